@@ -0,0 +1,89 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measure the serialization of rows for Client.insert_rows.
+
+Compares a per-cell lookup of the converters, with one UUID per row, to
+the converters compiled once per schema. Runs offline:
+
+    python insert_rows.py [num_rows]
+"""
+
+from __future__ import print_function
+
+import datetime
+import sys
+import time
+import uuid
+
+from google.cloud._helpers import UTC
+from google.cloud.bigquery._helpers import _SCALAR_VALUE_TO_JSON_ROW
+from google.cloud.bigquery.client import _insert_ids
+from google.cloud.bigquery.client import _row_encoder
+from google.cloud.bigquery.schema import SchemaField
+from google.cloud.bigquery.table import _row_from_mapping
+
+
+SCHEMA = [
+    SchemaField('id', 'INTEGER', mode='REQUIRED'),
+    SchemaField('score', 'FLOAT'),
+    SchemaField('active', 'BOOLEAN'),
+    SchemaField('created', 'TIMESTAMP'),
+    SchemaField('name', 'STRING'),
+    SchemaField('tags', 'STRING', mode='REPEATED'),
+]
+
+
+def make_rows(num_rows):
+    when = datetime.datetime(2018, 1, 1, tzinfo=UTC)
+    return [
+        {'id': index, 'score': index * 0.5, 'active': bool(index % 2),
+         'created': when, 'name': 'name-%d' % (index,), 'tags': ['a', 'b']}
+        for index in range(num_rows)]
+
+
+def per_cell(rows):
+    json_rows = []
+    for row in rows:
+        row = _row_from_mapping(row, SCHEMA)
+        json_row = {}
+        for field, value in zip(SCHEMA, row):
+            converter = _SCALAR_VALUE_TO_JSON_ROW.get(field.field_type)
+            if converter is not None:
+                value = converter(value)
+            json_row[field.name] = value
+        json_rows.append(json_row)
+    return [{'json': row, 'insertId': str(uuid.uuid4())} for row in json_rows]
+
+
+def compiled(rows):
+    encode = _row_encoder(SCHEMA)
+    json_rows = [encode(row) for row in rows]
+    return [
+        {'json': row, 'insertId': row_id}
+        for row, row_id in zip(json_rows, _insert_ids(len(json_rows)))]
+
+
+def main(num_rows=200000):
+    rows = make_rows(num_rows)
+    for name, function in (('per-cell', per_cell), ('compiled', compiled)):
+        start = time.time()
+        serialized = function(rows)
+        elapsed = time.time() - start
+        print('{0}: {1} rows in {2:.2f} sec ({3:.0f} rows/sec)'.format(
+            name, len(serialized), elapsed, len(serialized) / elapsed))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,88 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare RowIterator.to_dataframe with a row-by-row conversion.
+
+Runs offline, against synthetic ``tabledata.list`` pages:
+
+    python to_dataframe.py [num_rows] [page_size]
+"""
+
+from __future__ import print_function
+
+import sys
+import time
+
+import mock
+import pandas
+
+from google.cloud.bigquery._helpers import _rows_from_json
+from google.cloud.bigquery.schema import SchemaField
+from google.cloud.bigquery.table import RowIterator
+
+
+SCHEMA = [
+    SchemaField('id', 'INTEGER'),
+    SchemaField('score', 'FLOAT'),
+    SchemaField('active', 'BOOLEAN'),
+    SchemaField('created', 'TIMESTAMP'),
+    SchemaField('name', 'STRING'),
+]
+
+
+def make_pages(num_rows, page_size):
+    pages = []
+    for start in range(0, num_rows, page_size):
+        rows = [
+            {'f': [
+                {'v': str(index)},
+                {'v': str(index * 0.5)},
+                {'v': 'true' if index % 2 else 'false'},
+                {'v': '%.6fE9' % (1.4 + index * 1e-9)},
+                {'v': 'name-%d' % (index,)},
+            ]}
+            for index in range(start, min(start + page_size, num_rows))]
+        pages.append({'rows': rows, 'pageToken': 'token'})
+    pages[-1].pop('pageToken')
+    return pages
+
+
+def row_by_row(pages):
+    rows = []
+    for page in pages:
+        rows.extend(
+            row.values() for row in _rows_from_json(page['rows'], SCHEMA))
+    return pandas.DataFrame(
+        rows, columns=[field.name for field in SCHEMA])
+
+
+def columnar(pages):
+    api_request = mock.Mock(side_effect=pages)
+    iterator = RowIterator(mock.sentinel.client, api_request, '/rows', SCHEMA)
+    return iterator.to_dataframe()
+
+
+def main(num_rows=1000000, page_size=100000):
+    pages = make_pages(num_rows, page_size)
+    for name, function in (('row-by-row', row_by_row),
+                           ('columnar', columnar)):
+        start = time.time()
+        df = function(pages)
+        elapsed = time.time() - start
+        print('{0}: {1} rows in {2:.2f} sec ({3:.0f} rows/sec)'.format(
+            name, len(df), elapsed, len(df) / elapsed))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
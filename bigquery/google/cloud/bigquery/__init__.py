@@ -49,6 +49,7 @@ from google.cloud.bigquery.query import ScalarQueryParameter
 from google.cloud.bigquery.query import StructQueryParameter
 from google.cloud.bigquery.query import UDFResource
 from google.cloud.bigquery.schema import SchemaField
+from google.cloud.bigquery.streaming import StreamingInserter
 from google.cloud.bigquery.table import EncryptionConfiguration
 from google.cloud.bigquery.table import Table
 from google.cloud.bigquery.table import TableReference
@@ -84,6 +85,7 @@ __all__ = [
     'ExtractJobConfig',
     'LoadJob',
     'LoadJobConfig',
+    'StreamingInserter',
     # Shared helpers
     'SchemaField',
     'UDFResource',
@@ -180,6 +180,96 @@ def _field_to_index_mapping(schema):
     return {f.name: i for i, f in enumerate(schema)}
 
 
+# Converters taking only the (non-null) value, for the most common types.
+_VALUE_FROM_JSON = {
+    'INTEGER': int,
+    'INT64': int,
+    'FLOAT': float,
+    'FLOAT64': float,
+}
+
+
+def _cell_decoder(field):
+    """Compile a converter for the JSON values of a field.
+
+    The converter and the handling of the field's mode are looked up once,
+    rather than for each cell as :data:`_CELLDATA_FROM_JSON` converters do.
+
+    :type field: :class:`~google.cloud.bigquery.schema.SchemaField`
+    :param field: The field to be converted.
+
+    :rtype: callable
+    :returns: A function converting a cell value (``cell['v']``) of the
+              field, e.g. a list of converted items for repeated fields.
+    """
+    if field.field_type == 'RECORD':
+        convert = _record_decoder(field)
+    elif field.field_type in _VALUE_FROM_JSON:
+        convert = _VALUE_FROM_JSON[field.field_type]
+    elif field.field_type == 'STRING':
+        convert = None
+    else:
+        converter = _CELLDATA_FROM_JSON[field.field_type]
+
+        def convert(value):
+            return converter(value, field)
+
+    if field.mode == 'REPEATED':
+        if convert is None:
+            return lambda value: [item['v'] for item in value]
+        return lambda value: [convert(item['v']) for item in value]
+
+    if convert is None:
+        return lambda value: value
+    if field.mode == 'NULLABLE':
+        return lambda value: None if value is None else convert(value)
+    return convert
+
+
+def _record_decoder(field):
+    """Compile a converter for the (non-null) JSON values of a record.
+
+    :type field: :class:`~google.cloud.bigquery.schema.SchemaField`
+    :param field: A ``RECORD`` field.
+
+    :rtype: callable
+    :returns: A function converting a record value to a mapping.
+    """
+    subfields = [
+        (subfield.name, _cell_decoder(subfield))
+        for subfield in field.fields]
+
+    def decode(value):
+        return {
+            name: decode_cell(cell['v'])
+            for (name, decode_cell), cell in zip(subfields, value['f'])}
+
+    return decode
+
+
+def _row_tuple_decoder(schema):
+    """Compile a converter for JSON rows of a given schema.
+
+    Build the converter once and reuse it for all the rows of a result.
+
+    :type schema: tuple
+    :param schema: A tuple of
+                   :class:`~google.cloud.bigquery.schema.SchemaField`.
+
+    :rtype: callable
+    :returns: A function converting a JSON response row to a tuple, like
+              :func:`_row_tuple_from_json`.
+    """
+    decoders = [_cell_decoder(field) for field in schema]
+
+    def decode(row):
+        return tuple([
+            decode_cell(cell['v'])
+            for decode_cell, cell in zip(decoders, row['f'])])
+
+    return decode
+
+
 def _row_tuple_from_json(row, schema):
     """Convert JSON row data to row with appropriate types.
 
@@ -195,6 +285,8 @@ def _row_tuple_from_json(row, schema):
     :rtype: tuple
     :returns: A tuple of data converted to native types.
     """
+    # Compiling a decoder only pays off over many rows, see
+    # :func:`_row_tuple_decoder`.
     row_data = []
     for field, cell in zip(schema, row['f']):
         converter = _CELLDATA_FROM_JSON[field.field_type]
@@ -212,8 +304,8 @@ def _rows_from_json(values, schema):
     from google.cloud.bigquery import Row
 
     field_to_index = _field_to_index_mapping(schema)
-    return [Row(_row_tuple_from_json(r, schema), field_to_index)
-            for r in values]
+    decode = _row_tuple_decoder(schema)
+    return [Row(decode(r), field_to_index) for r in values]
 
 
 def _int_to_json(value):
@@ -308,6 +400,61 @@ _SCALAR_VALUE_TO_JSON_PARAM = _SCALAR_VALUE_TO_JSON_ROW.copy()
 _SCALAR_VALUE_TO_JSON_PARAM['TIMESTAMP'] = _timestamp_to_json_parameter
 
 
+def _field_encoder(field):
+    """Compile a converter of a field's values to their row JSON form.
+
+    :type field: :class:`~google.cloud.bigquery.schema.SchemaField`
+    :param field: The field to be converted.
+
+    :rtype: callable or ``NoneType``
+    :returns: A function converting a value of the field (e.g. a list for
+              repeated fields), or :data:`None` if values are sent as-is.
+    """
+    if field.field_type in ('RECORD', 'STRUCT'):
+        convert = _record_encoder(field)
+    else:
+        convert = _SCALAR_VALUE_TO_JSON_ROW.get(field.field_type)
+
+    if convert is None:  # STRING doesn't need converting
+        return None
+    if field.mode == 'REPEATED':
+        return lambda value: None if value is None else [
+            convert(item) for item in value]
+    return convert
+
+
+def _record_encoder(field):
+    """Compile a converter of a record's values to their row JSON form.
+
+    Records may be passed as mappings or, like rows, as sequences ordered
+    according to the subfields. Keys which do not correspond to a subfield
+    are sent as-is.
+
+    :type field: :class:`~google.cloud.bigquery.schema.SchemaField`
+    :param field: A ``RECORD`` field.
+
+    :rtype: callable
+    :returns: A function converting a record value to a mapping.
+    """
+    subfields = [
+        (subfield.name, _field_encoder(subfield))
+        for subfield in field.fields]
+    encoders = {name: encode for name, encode in subfields if encode}
+
+    def encode(value):
+        if value is None:
+            return None
+        if isinstance(value, dict):
+            return {
+                name: encoders[name](item) if name in encoders else item
+                for name, item in value.items()}
+        return {
+            name: item if encode_item is None else encode_item(item)
+            for (name, encode_item), item in zip(subfields, value)}
+
+    return encode
+
+
 def _snake_to_camel_case(value):
     """Convert snake case string to camel case."""
     words = value.split('_')
@@ -448,8 +595,7 @@ def _item_to_row(iterator, resource):
     """
     from google.cloud.bigquery import Row
 
-    return Row(_row_tuple_from_json(resource, iterator.schema),
-               iterator._field_to_index)
+    return Row(iterator._decode_row(resource), iterator._field_to_index)
 
 
 # pylint: disable=unused-argument
@@ -465,6 +611,8 @@ def _rows_page_start(iterator, page, response):
     :type response: dict
     :param response: The JSON API response for a page of rows in a table.
     """
+    # Kept for column-wise conversions, e.g. ``RowIterator.to_dataframe``.
+    page._rows = response.get('rows', ())
     total_rows = response.get('totalRows')
     if total_rows is not None:
         total_rows = int(total_rows)
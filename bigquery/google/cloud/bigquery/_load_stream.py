@@ -0,0 +1,216 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Serialize in-memory rows into compressed streams for load jobs.
+
+The data is produced as the upload reads it, so that memory use does not
+depend on the number of rows.
+"""
+
+import csv
+import json
+import os
+import zlib
+
+import six
+
+from google.cloud._helpers import _to_bytes
+
+
+_ROWS_PER_CHUNK = 10000
+_COMPRESSION_LEVEL = 6
+_GZIP_WBITS = 16 + zlib.MAX_WBITS  # Write a gzip header and trailer.
+
+
+class _GzipStream(object):
+    """Read-only file-like object gzip-compressing chunks of bytes lazily.
+
+    Only :meth:`read`, :meth:`tell` and (limited) :meth:`seek` are
+    supported, as needed by :class:`~google.resumable_media.requests.\
+ResumableUpload`.
+
+    :type chunks: iterable of bytes
+    :param chunks: The uncompressed data.
+
+    :type level: int
+    :param level: (Optional) The ``zlib`` compression level.
+    """
+
+    def __init__(self, chunks, level=_COMPRESSION_LEVEL):
+        self._chunks = iter(chunks)
+        self._compressor = zlib.compressobj(
+            level, zlib.DEFLATED, _GZIP_WBITS)
+        self._buffer = []
+        self._buffered = 0
+        self._position = 0
+        self._last_read = (0, b'')
+        self._exhausted = False
+
+    def _fill(self, size):
+        """Compress chunks until ``size`` bytes (or all) are buffered."""
+        while not self._exhausted and (size < 0 or self._buffered < size):
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                data = self._compressor.flush()
+                self._exhausted = True
+            else:
+                data = self._compressor.compress(chunk)
+            if data:
+                self._buffer.append(data)
+                self._buffered += len(data)
+
+    def read(self, size=-1):
+        """Read compressed data.
+
+        :type size: int
+        :param size: (Optional) The maximum number of bytes to read. If
+                     negative or omitted, read until the end.
+
+        :rtype: bytes
+        :returns: The data, shorter than ``size`` only at the end.
+        """
+        if size is None:
+            size = -1
+        self._fill(size)
+        data = b''.join(self._buffer)
+        rest = b''
+        if size >= 0:
+            data, rest = data[:size], data[size:]
+        self._buffer = [rest] if rest else []
+        self._buffered = len(rest)
+        self._last_read = (self._position, data)
+        self._position += len(data)
+        return data
+
+    def tell(self):
+        """Report the number of compressed bytes read so far.
+
+        :rtype: int
+        :returns: The current position.
+        """
+        return self._position
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        """Move back within the data returned by the last :meth:`read`.
+
+        This is enough to resend a chunk of a resumable upload after a
+        failure.
+
+        :type offset: int
+        :param offset: The absolute position to move to.
+
+        :type whence: int
+        :param whence: (Optional) Must be :data:`os.SEEK_SET`.
+
+        :rtype: int
+        :returns: The new position.
+        :raises: :class:`ValueError` if the position is not within the
+                 last data read.
+        """
+        start, data = self._last_read
+        if whence != os.SEEK_SET or not start <= offset <= self._position:
+            raise ValueError(
+                'Cannot seek to {} in a stream of generated data.'.format(
+                    offset))
+        rewound = data[offset - start:]
+        if rewound:
+            self._buffer.insert(0, rewound)
+            self._buffered += len(rewound)
+        self._last_read = (start, data[:offset - start])
+        self._position = offset
+        return offset
+
+
+def _batches(rows):
+    """Group the items of an iterable into lists.
+
+    :type rows: iterable
+    :param rows: The items to be grouped.
+
+    :rtype: iterator of list
+    :returns: Lists of (at most ``_ROWS_PER_CHUNK``) consecutive items.
+    """
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= _ROWS_PER_CHUNK:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _json_chunks(json_rows):
+    """Serialize rows as newline-delimited JSON.
+
+    :type json_rows: iterable of dict
+    :param json_rows: JSON-compatible mappings of row data.
+
+    :rtype: iterator of bytes
+    :returns: Chunks of UTF-8 encoded lines, each holding many rows.
+    """
+    for batch in _batches(json_rows):
+        yield _to_bytes(
+            u''.join(json.dumps(row) + u'\n' for row in batch), 'utf-8')
+
+
+def _csv_chunks(rows):
+    """Serialize rows as CSV.
+
+    :type rows: iterable of sequence
+    :param rows: The values of each row. :data:`None` is written as an
+                 empty field.
+
+    :rtype: iterator of bytes
+    :returns: Chunks of UTF-8 encoded lines, each holding many rows.
+    """
+    for batch in _batches(rows):
+        if six.PY2:
+            # The Python 2 ``csv`` module only writes byte strings.
+            buffer_ = six.BytesIO()
+            batch = ([_encode_cell(value) for value in row] for row in batch)
+        else:
+            buffer_ = six.StringIO()
+        csv.writer(buffer_, lineterminator='\n').writerows(batch)
+        yield _to_bytes(buffer_.getvalue(), 'utf-8')
+
+
+def _encode_cell(value):
+    """Encode a CSV field value for the Python 2 ``csv`` module.
+
+    :type value: object
+    :param value: The value of the field.
+
+    :rtype: object
+    :returns: ``value``, UTF-8 encoded if it is a unicode string.
+    """
+    if isinstance(value, six.text_type):
+        return value.encode('utf-8')
+    return value
+
+
+def _dataframe_csv_chunks(dataframe):
+    """Serialize a DataFrame as CSV, starting with a header row.
+
+    :type dataframe: :class:`pandas.DataFrame`
+    :param dataframe: The data to be written. The index is not written.
+
+    :rtype: iterator of bytes
+    :returns: Chunks of UTF-8 encoded lines, each holding many rows.
+    """
+    # Always produce one chunk, for the header of an empty DataFrame.
+    for start in range(0, max(len(dataframe), 1), _ROWS_PER_CHUNK):
+        chunk = dataframe.iloc[start:start + _ROWS_PER_CHUNK]
+        yield _to_bytes(
+            chunk.to_csv(header=start == 0, index=False), 'utf-8')
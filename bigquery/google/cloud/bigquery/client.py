@@ -17,8 +17,10 @@
 from __future__ import absolute_import
 
 import collections
+import concurrent.futures
 import functools
 import os
+import time
 import uuid
 import warnings
 
@@ -33,21 +35,30 @@ from google.cloud import exceptions
 from google.cloud.client import ClientWithProject
 
 from google.cloud.bigquery._helpers import DEFAULT_RETRY
-from google.cloud.bigquery._helpers import _SCALAR_VALUE_TO_JSON_ROW
+from google.cloud.bigquery._helpers import _SCALAR_VALUE_TO_JSON_PARAM
+from google.cloud.bigquery._helpers import _field_encoder
 from google.cloud.bigquery._helpers import _snake_to_camel_case
 from google.cloud.bigquery._http import Connection
+from google.cloud.bigquery._load_stream import _GzipStream
+from google.cloud.bigquery._load_stream import _csv_chunks
+from google.cloud.bigquery._load_stream import _dataframe_csv_chunks
+from google.cloud.bigquery._load_stream import _json_chunks
 from google.cloud.bigquery.dataset import Dataset
 from google.cloud.bigquery.dataset import DatasetListItem
 from google.cloud.bigquery.dataset import DatasetReference
 from google.cloud.bigquery.job import CopyJob
 from google.cloud.bigquery.job import ExtractJob
 from google.cloud.bigquery.job import LoadJob
+from google.cloud.bigquery.job import LoadJobConfig
 from google.cloud.bigquery.job import QueryJob, QueryJobConfig
+from google.cloud.bigquery.job import SourceFormat
+from google.cloud.bigquery.job import _DONE_STATE
 from google.cloud.bigquery.query import _QueryResults
 from google.cloud.bigquery.table import Table
 from google.cloud.bigquery.table import TableListItem
 from google.cloud.bigquery.table import TableReference
 from google.cloud.bigquery.table import RowIterator
+from google.cloud.bigquery.table import _ParallelRowIterator
 from google.cloud.bigquery.table import _TABLE_HAS_NO_SCHEMA
 from google.cloud.bigquery.table import _row_from_mapping
 
@@ -64,6 +75,20 @@ _GENERIC_CONTENT_TYPE = u'*/*'
 _READ_LESS_THAN_SIZE = (
     'Size {:d} was specified but the file-like object only had '
     '{:d} bytes remaining.')
+_WAIT_INITIAL_INTERVAL = 1.0  # Seconds.
+_WAIT_MULTIPLIER = 1.5
+_WAIT_MAX_INTERVAL = 10.0
+_LIST_JOBS_THRESHOLD = 3
+_LIST_JOBS_PAGE_SIZE = 1000
+_WAIT_RETURN_WHEN = frozenset([
+    concurrent.futures.FIRST_COMPLETED,
+    concurrent.futures.FIRST_EXCEPTION,
+    concurrent.futures.ALL_COMPLETED,
+])
+
+DoneAndNotDoneJobs = collections.namedtuple(
+    'DoneAndNotDoneJobs', ['done', 'not_done'])
+"""The jobs returned by :meth:`Client.wait_for_jobs`, as two sets."""
 
 
 class Project(object):
@@ -508,7 +533,8 @@ class Client(ClientWithProject):
             raise TypeError('table must be a Table or a TableReference')
         self._call_api(retry, method='DELETE', path=table.path)
 
-    def _get_query_results(self, job_id, retry, project=None, timeout_ms=None):
+    def _get_query_results(self, job_id, retry, project=None, timeout_ms=None,
+                           max_results=0):
         """Get the query results object for a query job.
 
         :type job_id: str
@@ -527,11 +553,19 @@ class Client(ClientWithProject):
             (Optional) number of milliseconds the the API call should wait for
             the query to complete before the request times out.
 
+        :type max_results: int
+        :param max_results:
+            (Optional) maximum number of rows to return once the query is
+            complete. Defaults to ``0`` (no rows); pass ``None`` to get the
+            first page of rows, sized by the server.
+
         :rtype: :class:`google.cloud.bigquery.query._QueryResults`
         :returns: a new ``_QueryResults`` instance
         """
 
-        extra_params = {'maxResults': 0}
+        extra_params = {}
+        if max_results is not None:
+            extra_params['maxResults'] = max_results
 
         if project is None:
             project = self.project
@@ -548,6 +582,31 @@ class Client(ClientWithProject):
             retry, method='GET', path=path, query_params=extra_params)
         return _QueryResults.from_api_repr(resource)
 
+    def _list_rows_from_query_results(self, query_results, retry):
+        """List the rows of a completed query, starting with those returned
+        by ``getQueryResults``.
+
+        :type query_results: :class:`google.cloud.bigquery.query._QueryResults`
+        :param query_results: Results holding the first page of rows (see
+                              :meth:`_QueryResults._has_first_page`).
+
+        :type retry: :class:`google.api_core.retry.Retry`
+        :param retry: (Optional) How to retry the RPCs fetching further
+                      pages.
+
+        :rtype: :class:`~google.cloud.bigquery.table.RowIterator`
+        :returns: Iterator of row data, which only makes requests for the
+                  pages after the first one.
+        """
+        path = '/projects/{}/queries/{}'.format(
+            query_results.project, query_results.job_id)
+        return RowIterator(
+            client=self,
+            api_request=functools.partial(self._call_api, retry),
+            path=path,
+            schema=query_results.schema,
+            first_page_response=query_results._properties)
+
     def job_from_resource(self, resource):
         """Detect correct job type from resource and instantiate.
 
@@ -701,6 +760,140 @@ class Client(ClientWithProject):
             max_results=max_results,
             extra_params=extra_params)
 
+    def wait_for_jobs(self, jobs, timeout=None,
+                      return_when=concurrent.futures.ALL_COMPLETED,
+                      retry=DEFAULT_RETRY):
+        """Wait for many jobs to complete, polling them all together.
+
+        This is the counterpart of :func:`concurrent.futures.wait` for
+        jobs. Unlike calling ``result()`` on each job in turn, the jobs
+        are polled from the calling thread in rounds: when several jobs
+        are pending, a single listing of the active jobs of each project
+        tells which jobs need to be reloaded. The interval between rounds
+        grows while no job completes.
+
+        Jobs which were not started yet are started first. The futures of
+        completed jobs are resolved, so that their ``result()`` does not
+        poll again.
+
+        :type jobs: iterable of job instances
+        :param jobs: The jobs to wait for.
+
+        :type timeout: float
+        :param timeout: (Optional) The maximum number of seconds to wait.
+                        If not passed, wait without time limit.
+
+        :type return_when: str
+        :param return_when:
+            (Optional) When to return, one of
+            :data:`concurrent.futures.FIRST_COMPLETED`,
+            :data:`concurrent.futures.FIRST_EXCEPTION` (a job completed
+            with an error, or all jobs completed) or
+            :data:`concurrent.futures.ALL_COMPLETED`.
+
+        :type retry: :class:`google.api_core.retry.Retry`
+        :param retry: (Optional) How to retry the RPCs.
+
+        :rtype: :class:`DoneAndNotDoneJobs`
+        :returns: The sets of completed and of still pending jobs. No
+                  error is raised if the timeout expires.
+        :raises: :class:`ValueError` if ``return_when`` is not valid.
+        """
+        if return_when not in _WAIT_RETURN_WHEN:
+            raise ValueError(
+                'Invalid return_when value: {!r}'.format(return_when))
+
+        done = set()
+        pending = set()
+        for job in jobs:
+            if job.state is None:
+                job._begin(retry=retry)
+            if job.state == _DONE_STATE:
+                job._set_future_result()
+                done.add(job)
+            else:
+                pending.add(job)
+
+        deadline = None
+        if timeout is not None:
+            deadline = time.time() + timeout
+        interval = None
+        while not _wait_finished(done, pending, return_when):
+            if interval is not None:
+                delay = interval
+                if deadline is not None:
+                    delay = min(delay, deadline - time.time())
+                    if delay <= 0:
+                        break
+                time.sleep(delay)
+
+            completed = self._poll_jobs(pending, retry)
+            pending -= completed
+            done |= completed
+
+            if completed or interval is None:
+                interval = _WAIT_INITIAL_INTERVAL
+            else:
+                interval = min(
+                    interval * _WAIT_MULTIPLIER, _WAIT_MAX_INTERVAL)
+
+        return DoneAndNotDoneJobs(done, pending)
+
+    def _poll_jobs(self, jobs, retry):
+        """Reload the jobs which may have completed.
+
+        :type jobs: set of job instances
+        :param jobs: The pending jobs.
+
+        :type retry: :class:`google.api_core.retry.Retry`
+        :param retry: How to retry the RPCs.
+
+        :rtype: set of job instances
+        :returns: The jobs which completed.
+        """
+        to_reload = jobs
+        if len(jobs) >= _LIST_JOBS_THRESHOLD:
+            # Jobs still listed as active need not be reloaded. Jobs of
+            # other users are never listed, so they are always reloaded.
+            active = set()
+            for project in set(job.project for job in jobs):
+                active.update(self._list_active_job_ids(project, retry))
+            to_reload = [
+                job for job in jobs
+                if (job.project, job.job_id) not in active]
+
+        completed = set()
+        for job in to_reload:
+            job.reload(retry=retry)
+            if job.state == _DONE_STATE:
+                job._set_future_result()
+                completed.add(job)
+        return completed
+
+    def _list_active_job_ids(self, project, retry):
+        """List the IDs of the caller's pending and running jobs.
+
+        :type project: str
+        :param project: The project of the jobs.
+
+        :type retry: :class:`google.api_core.retry.Retry`
+        :param retry: How to retry the RPCs.
+
+        :rtype: :class:`~google.api_core.page_iterator.Iterator`
+        :returns: Iterable of ``(project, job_id)`` tuples.
+        """
+        return page_iterator.HTTPIterator(
+            client=self,
+            api_request=functools.partial(self._call_api, retry),
+            path='/projects/%s/jobs' % (project,),
+            item_to_value=_item_to_job_id,
+            items_key='jobs',
+            extra_params={
+                'projection': 'minimal',
+                'stateFilter': ['pending', 'running'],
+                'maxResults': _LIST_JOBS_PAGE_SIZE,
+            })
+
     def load_table_from_uri(self, source_uris, destination,
                             job_id=None, job_id_prefix=None,
                             job_config=None, retry=DEFAULT_RETRY):
@@ -806,6 +999,164 @@ class Client(ClientWithProject):
             raise exceptions.from_http_response(exc.response)
         return self.job_from_resource(response.json())
 
+    def load_table_from_iterable(self, rows, destination,
+                                 num_retries=_DEFAULT_NUM_RETRIES,
+                                 job_id=None, job_id_prefix=None,
+                                 job_config=None):
+        """Load rows from an iterable, without writing them to a file.
+
+        The rows are serialized as the upload proceeds, into gzip-compressed
+        newline-delimited JSON or, if ``job_config.source_format`` is
+        ``CSV``, CSV data. Memory use does not depend on the number of rows.
+        For large amounts of data, this is much cheaper than
+        :meth:`insert_rows`.
+
+        :type rows: iterable of tuple or dict
+        :param rows: Row data, as accepted by :meth:`insert_rows`. If no
+                     schema is known (see ``job_config``), rows must be
+                     JSON-compatible mappings for JSON, or sequences of
+                     values written as-is for CSV.
+
+        :type destination: One of:
+                           :class:`~google.cloud.bigquery.table.Table`
+                           :class:`~google.cloud.bigquery.table.TableReference`
+        :param destination: Table into which data is to be loaded.
+
+        :type num_retries: int
+        :param num_retries: Number of upload retries. Defaults to 6.
+
+        :type job_id: str
+        :param job_id: (Optional) Name of the job.
+
+        :type job_id_prefix: str or ``NoneType``
+        :param job_id_prefix: (Optional) the user-provided prefix for a
+                              randomly generated job ID. This parameter will be
+                              ignored if a ``job_id`` is also given.
+
+        :type job_config: :class:`google.cloud.bigquery.job.LoadJobConfig`
+        :param job_config: (Optional) Extra configuration options for the job.
+                           Its schema, or else the schema of ``destination``
+                           if it is a :class:`~google.cloud.bigquery.table.\
+Table`, is used to convert the rows.
+
+        :rtype: :class:`~google.cloud.bigquery.job.LoadJob`
+        :returns: the job instance used to load the data (e.g., for
+                  querying status).
+        :raises: :class:`ValueError` if the source format is neither JSON nor
+                 CSV, or if the schema has nested or repeated fields with CSV.
+        """
+        job_config = _copy_load_job_config(job_config)
+        if job_config.source_format is None:
+            job_config.source_format = SourceFormat.NEWLINE_DELIMITED_JSON
+        schema = job_config.schema
+        if not schema and isinstance(destination, Table):
+            schema = destination.schema
+
+        if job_config.source_format == SourceFormat.NEWLINE_DELIMITED_JSON:
+            if schema:
+                rows = six.moves.map(_row_encoder(schema), rows)
+            chunks = _json_chunks(rows)
+        elif job_config.source_format == SourceFormat.CSV:
+            if schema:
+                rows = six.moves.map(_csv_row_encoder(schema), rows)
+            chunks = _csv_chunks(rows)
+        else:
+            raise ValueError(
+                'Cannot load rows as {}'.format(job_config.source_format))
+
+        return self._load_table_from_stream(
+            _GzipStream(chunks), destination, num_retries, job_id,
+            job_id_prefix, job_config)
+
+    def load_table_from_dataframe(self, dataframe, destination,
+                                  num_retries=_DEFAULT_NUM_RETRIES,
+                                  job_id=None, job_id_prefix=None,
+                                  job_config=None):
+        """Load a :class:`pandas.DataFrame`, without writing it to a file.
+
+        The DataFrame is serialized as the upload proceeds, into
+        gzip-compressed CSV data starting with a header row of the column
+        names, which the load job skips. The index is not loaded, and the
+        columns must be in the order of the table's schema.
+
+        :type dataframe: :class:`pandas.DataFrame`
+        :param dataframe: The data to be loaded.
+
+        :type destination: One of:
+                           :class:`~google.cloud.bigquery.table.Table`
+                           :class:`~google.cloud.bigquery.table.TableReference`
+        :param destination: Table into which data is to be loaded.
+
+        :type num_retries: int
+        :param num_retries: Number of upload retries. Defaults to 6.
+
+        :type job_id: str
+        :param job_id: (Optional) Name of the job.
+
+        :type job_id_prefix: str or ``NoneType``
+        :param job_id_prefix: (Optional) the user-provided prefix for a
+                              randomly generated job ID. This parameter will be
+                              ignored if a ``job_id`` is also given.
+
+        :type job_config: :class:`google.cloud.bigquery.job.LoadJobConfig`
+        :param job_config: (Optional) Extra configuration options for the job.
+
+        :rtype: :class:`~google.cloud.bigquery.job.LoadJob`
+        :returns: the job instance used to load the data (e.g., for
+                  querying status).
+        :raises: :class:`ValueError` if ``job_config`` sets a source format
+                 other than CSV.
+        """
+        job_config = _copy_load_job_config(job_config)
+        if job_config.source_format is None:
+            job_config.source_format = SourceFormat.CSV
+        if job_config.source_format != SourceFormat.CSV:
+            raise ValueError('DataFrames can only be loaded as CSV')
+        job_config.skip_leading_rows = 1
+
+        return self._load_table_from_stream(
+            _GzipStream(_dataframe_csv_chunks(dataframe)), destination,
+            num_retries, job_id, job_id_prefix, job_config)
+
+    def _load_table_from_stream(self, stream, destination, num_retries,
+                                job_id, job_id_prefix, job_config):
+        """Start a load job, uploading a stream of unknown size.
+
+        :type stream: IO[bytes]
+        :param stream: The data to be loaded.
+
+        :type destination: One of:
+                           :class:`~google.cloud.bigquery.table.Table`
+                           :class:`~google.cloud.bigquery.table.TableReference`
+        :param destination: Table into which data is to be loaded.
+
+        :type num_retries: int
+        :param num_retries: Number of upload retries.
+
+        :type job_id: str
+        :param job_id: Name of the job (or :data:`None`).
+
+        :type job_id_prefix: str or ``NoneType``
+        :param job_id_prefix: Prefix for a randomly generated job ID.
+
+        :type job_config: :class:`google.cloud.bigquery.job.LoadJobConfig`
+        :param job_config: Configuration options for the job.
+
+        :rtype: :class:`~google.cloud.bigquery.job.LoadJob`
+        :returns: the job instance used to load the data.
+        """
+        if isinstance(destination, Table):
+            destination = destination.reference
+        job_id = _make_job_id(job_id, job_id_prefix)
+        job = LoadJob(job_id, None, destination, self, job_config)
+        job_resource = job._build_resource()
+        try:
+            response = self._do_resumable_upload(
+                stream, job_resource, num_retries)
+        except resumable_media.InvalidResponse as exc:
+            raise exceptions.from_http_response(exc.response)
+        return self.job_from_resource(response.json())
+
     def _do_resumable_upload(self, stream, metadata, num_retries):
         """Perform a resumable upload.
 
@@ -1090,20 +1441,8 @@ class Client(ClientWithProject):
         else:
             raise TypeError('table should be Table or TableReference')
 
-        json_rows = []
-
-        for index, row in enumerate(rows):
-            if isinstance(row, dict):
-                row = _row_from_mapping(row, schema)
-            json_row = {}
-
-            for field, value in zip(schema, row):
-                converter = _SCALAR_VALUE_TO_JSON_ROW.get(field.field_type)
-                if converter is not None:  # STRING doesn't need converting
-                    value = converter(value)
-                json_row[field.name] = value
-
-            json_rows.append(json_row)
+        encode = _row_encoder(schema)
+        json_rows = [encode(row) for row in rows]
 
         return self.insert_rows_json(table, json_rows, **kwargs)
 
@@ -1121,7 +1460,7 @@ class Client(ClientWithProject):
         :param table: the destination table for the row data, or a reference
                       to it.
 
-        :type json_rows: list of dictionaries
+        :type json_rows: iterable of dictionaries
         :param json_rows: Row data to be inserted. Keys must match the table
                           schema fields and values must be JSON-compatible
                           representations.
@@ -1159,17 +1498,18 @@ class Client(ClientWithProject):
                   identifies the row, and the "errors" key contains a list
                   of the mappings describing one or more problems with the
                   row.
+        :raises: ValueError if ``row_ids`` does not hold one ID per row.
         """
-        rows_info = []
-        data = {'rows': rows_info}
-
-        for index, row in enumerate(json_rows):
-            info = {'json': row}
-            if row_ids is not None:
-                info['insertId'] = row_ids[index]
-            else:
-                info['insertId'] = str(uuid.uuid4())
-            rows_info.append(info)
+        json_rows = list(json_rows)
+        if row_ids is None:
+            row_ids = _insert_ids(len(json_rows))
+        elif len(row_ids) != len(json_rows):
+            raise ValueError(
+                'Got {} row IDs for {} rows.'.format(
+                    len(row_ids), len(json_rows)))
+        data = {'rows': [
+            {'json': row, 'insertId': row_id}
+            for row, row_id in zip(json_rows, row_ids)]}
 
         if skip_invalid_rows is not None:
             data['skipInvalidRows'] = skip_invalid_rows
@@ -1216,7 +1556,8 @@ class Client(ClientWithProject):
         return self.insert_rows_json(*args, **kwargs)
 
     def list_rows(self, table, selected_fields=None, max_results=None,
-                  page_token=None, start_index=None, retry=DEFAULT_RETRY):
+                  page_token=None, start_index=None, retry=DEFAULT_RETRY,
+                  parallelism=None, ordered=True, page_size=None):
         """List the rows of the table.
 
         See
@@ -1259,6 +1600,26 @@ class Client(ClientWithProject):
         :type retry: :class:`google.api_core.retry.Retry`
         :param retry: (Optional) How to retry the RPC.
 
+        :type parallelism: int
+        :param parallelism: (Optional) Split the rows into this many ranges
+                            of ``startIndex`` values and fetch them
+                            concurrently, rather than following page tokens
+                            one page after another. Requires a
+                            :class:`~google.cloud.bigquery.table.Table`
+                            with a known ``num_rows`` (see
+                            ``client.get_table``); cannot be combined with
+                            ``page_token``.
+
+        :type ordered: bool
+        :param ordered: (Optional) With ``parallelism``, whether rows are
+                        yielded in table order (the default). Pass ``False``
+                        to yield pages as soon as any range fetches them.
+
+        :type page_size: int
+        :param page_size: (Optional) The maximum number of rows in each page
+                          of results. The API may return fewer rows (pages
+                          are also limited in size).
+
         :rtype: :class:`~google.cloud.bigquery.table.RowIterator`
         :returns: Iterator of row data
                   :class:`~google.cloud.bigquery.table.Row`-s. During each
@@ -1284,6 +1645,30 @@ class Client(ClientWithProject):
             params['selectedFields'] = ','.join(
                 field.name for field in selected_fields)
 
+        if parallelism is not None:
+            num_rows = getattr(table, 'num_rows', None)
+            if num_rows is None:
+                raise ValueError(
+                    'parallelism requires a Table with num_rows: '
+                    "call 'client.get_table()'")
+            if page_token is not None:
+                raise ValueError('Cannot use parallelism with page_token')
+            start = start_index or 0
+            stop = num_rows
+            if max_results is not None:
+                stop = min(stop, start + max_results)
+            return _ParallelRowIterator(
+                client=self,
+                api_request=functools.partial(self._call_api, retry),
+                path='%s/data' % (table.path,),
+                schema=schema,
+                start=start,
+                stop=stop,
+                parallelism=parallelism,
+                ordered=ordered,
+                extra_params=params,
+                page_size=page_size)
+
         if start_index is not None:
             params['startIndex'] = start_index
 
@@ -1294,7 +1679,8 @@ class Client(ClientWithProject):
             schema=schema,
             page_token=page_token,
             max_results=max_results,
-            extra_params=params)
+            extra_params=params,
+            page_size=page_size)
         return row_iterator
 
     def list_partitions(self, table, retry=DEFAULT_RETRY):
@@ -1321,6 +1707,90 @@ class Client(ClientWithProject):
         return [row[0] for row in query_job]
 
 
+def _row_encoder(schema):
+    """Compile a converter of rows to their JSON representation.
+
+    The converters of the fields, including the subfields of records, are
+    looked up once, rather than for each cell.
+
+    :type schema: list of :class:`~google.cloud.bigquery.schema.SchemaField`
+    :param schema: The fields of the rows.
+
+    :rtype: callable
+    :returns: A function converting a row, as accepted by
+              :meth:`Client.insert_rows`, to a dict keyed by field name.
+    """
+    fields = [(field.name, _field_encoder(field)) for field in schema]
+
+    def encode(row):
+        if isinstance(row, dict):
+            row = _row_from_mapping(row, schema)
+        return {
+            name: value if encode_value is None else encode_value(value)
+            for (name, encode_value), value in zip(fields, row)}
+
+    return encode
+
+
+def _csv_row_encoder(schema):
+    """Compile a converter of rows to the values of their CSV fields.
+
+    :type schema: list of :class:`~google.cloud.bigquery.schema.SchemaField`
+    :param schema: The fields of the rows.
+
+    :rtype: callable
+    :returns: A function converting a row, as accepted by
+              :meth:`Client.insert_rows`, to a list of values.
+    :raises: :class:`ValueError` if a field is a record or is repeated.
+    """
+    encoders = []
+    for field in schema:
+        if field.mode == 'REPEATED' or field.field_type in (
+                'RECORD', 'STRUCT'):
+            raise ValueError(
+                'CSV cannot hold the values of field {}'.format(field.name))
+        encoders.append(_SCALAR_VALUE_TO_JSON_PARAM.get(field.field_type))
+
+    def encode(row):
+        if isinstance(row, dict):
+            row = _row_from_mapping(row, schema)
+        return [
+            value if encode_value is None else encode_value(value)
+            for encode_value, value in zip(encoders, row)]
+
+    return encode
+
+
+def _copy_load_job_config(job_config):
+    """Copy a load job configuration, so that it can be modified.
+
+    :type job_config: :class:`~google.cloud.bigquery.job.LoadJobConfig`
+    :param job_config: The configuration (or :data:`None`).
+
+    :rtype: :class:`~google.cloud.bigquery.job.LoadJobConfig`
+    :returns: A copy of ``job_config``, or a new configuration.
+    """
+    if job_config is None:
+        return LoadJobConfig()
+    return LoadJobConfig.from_api_repr(job_config.to_api_repr())
+
+
+def _insert_ids(count):
+    """Create unique IDs for rows inserted together.
+
+    A single random UUID is shared by the batch, suffixed with the index
+    of each row: :func:`uuid.uuid4` is comparatively slow.
+
+    :type count: int
+    :param count: The number of IDs.
+
+    :rtype: list of str
+    :returns: The insert IDs.
+    """
+    prefix = str(uuid.uuid4())
+    return ['{}-{}'.format(prefix, index) for index in range(count)]
+
+
 # pylint: disable=unused-argument
 def _item_to_project(iterator, resource):
     """Convert a JSON project to the native object.
@@ -1368,6 +1838,46 @@ def _item_to_job(iterator, resource):
     return iterator.client.job_from_resource(resource)
 
 
+def _item_to_job_id(iterator, resource):
+    """Convert a JSON job to the ID of the job.
+
+    :type iterator: :class:`~google.api_core.page_iterator.Iterator`
+    :param iterator: The iterator that is currently in use.
+
+    :type resource: dict
+    :param resource: An item to be converted to a job ID.
+
+    :rtype: tuple
+    :returns: The project and the ID of the next job in the page.
+    """
+    reference = resource['jobReference']
+    return reference['projectId'], reference['jobId']
+
+
+def _wait_finished(done, pending, return_when):
+    """Check if :meth:`Client.wait_for_jobs` should return.
+
+    :type done: set of job instances
+    :param done: The completed jobs.
+
+    :type pending: set of job instances
+    :param pending: The jobs not completed yet.
+
+    :type return_when: str
+    :param return_when: See :meth:`Client.wait_for_jobs`.
+
+    :rtype: bool
+    :returns: True if the wait is over.
+    """
+    if not pending:
+        return True
+    if return_when == concurrent.futures.FIRST_COMPLETED:
+        return bool(done)
+    if return_when == concurrent.futures.FIRST_EXCEPTION:
+        return any(job.error_result is not None for job in done)
+    return False
+
+
 def _item_to_table(iterator, resource):
     """Convert a JSON table to the native object.
 
@@ -15,8 +15,8 @@
 """Cursor for the Google BigQuery DB-API."""
 
 import collections
-
-import six
+import concurrent.futures
+import re
 
 from google.cloud.bigquery import job
 from google.cloud.bigquery.dbapi import _helpers
@@ -34,6 +34,21 @@ Column = collections.namedtuple(
         'scale', 'null_ok',
     ])
 
+# Pages are requested with a multiple of ``arraysize`` rows, of at least
+# this many rows.
+_MIN_PAGE_SIZE = 1000
+
+# An INSERT statement ending with a VALUES clause, which can be repeated
+# to insert the rows of several sets of parameters at once.
+_INSERT_VALUES_RE = re.compile(
+    r'^(?P<prefix>\s*INSERT\b.*?\bVALUES\s*)(?P<values>\(.*\))\s*;?\s*$',
+    re.IGNORECASE | re.DOTALL)
+
+# Limits of a single query, see
+# https://cloud.google.com/bigquery/quotas#query_jobs
+_MAX_QUERY_LENGTH = 1024 * 1024  # Characters.
+_MAX_QUERY_PARAMETERS = 10000
+
 
 class Cursor(object):
     """DB-API Cursor to Google BigQuery.
@@ -51,11 +66,22 @@ class Cursor(object):
         # Per PEP 249: The arraysize attribute defaults to 1, meaning to fetch
         # a single row at a time.
         self.arraysize = 1
+        # Return rows as plain tuples rather than
+        # :class:`~google.cloud.bigquery.table.Row` objects, which also
+        # allow access to values by field name.
+        self.plain_tuples = False
         self._query_data = None
         self._query_job = None
 
     def close(self):
-        """No-op."""
+        """Stop fetching results in the background, if needed."""
+        self._reset_query_data()
+
+    def _reset_query_data(self):
+        """Discard the rows of the last query."""
+        if self._query_data is not None:
+            self._query_data.close()
+        self._query_data = None
 
     def _set_description(self, schema):
         """Set description from schema.
@@ -132,10 +158,6 @@ class Cursor(object):
         :param job_id: (Optional) The job_id to use. If not set, a job ID
             is generated at random.
         """
-        self._query_data = None
-        self._query_job = None
-        client = self.connection._client
-
         # The DB-API uses the pyformat formatting, since the way BigQuery does
         # query parameters was not one of the standard options. Convert both
         # the query and the parameters to the format expected by the client
@@ -143,6 +165,24 @@ class Cursor(object):
         formatted_operation = _format_operation(
             operation, parameters=parameters)
         query_parameters = _helpers.to_query_parameters(parameters)
+        self._execute(formatted_operation, query_parameters, job_id=job_id)
+
+    def _execute(self, formatted_operation, query_parameters, job_id=None):
+        """Run a query already in the format expected by BigQuery.
+
+        :type formatted_operation: str
+        :param formatted_operation: A Google BigQuery query string.
+
+        :type query_parameters:
+            List[google.cloud.bigquery.query._AbstractQueryParameter]
+        :param query_parameters: The query parameters.
+
+        :type job_id: str
+        :param job_id: (Optional) The job_id to use.
+        """
+        self._reset_query_data()
+        self._query_job = None
+        client = self.connection._client
 
         config = job.QueryJobConfig()
         config.query_parameters = query_parameters
@@ -163,19 +203,42 @@ class Cursor(object):
     def executemany(self, operation, seq_of_parameters):
         """Prepare and execute a database operation multiple times.
 
+        An ``INSERT`` statement ending with a ``VALUES`` clause, such as
+        ``INSERT INTO dataset.table (a, b) VALUES (%s, %s)``, is run as few
+        times as possible: the ``VALUES`` clause is repeated for many sets
+        of parameters in each query, within the limits of the length and
+        number of parameters of a query. ``rowcount`` is then the total
+        number of rows inserted. Other operations are executed once per set
+        of parameters.
+
         :type operation: str
         :param operation: A Google BigQuery query string.
 
         :type seq_of_parameters: Sequence[Mapping[str, Any] or Sequence[Any]]
         :param parameters: Sequence of many sets of parameter values.
         """
-        for parameters in seq_of_parameters:
-            self.execute(operation, parameters)
+        match = _INSERT_VALUES_RE.match(operation)
+        if match is None or '%' in match.group('prefix'):
+            for parameters in seq_of_parameters:
+                self.execute(operation, parameters)
+            return
+
+        rowcount = 0
+        for formatted_operation, values in _batch_insert_values(
+                match.group('prefix'), match.group('values'),
+                seq_of_parameters):
+            self._execute(
+                formatted_operation,
+                _helpers.to_query_parameters_list(values))
+            rowcount += max(self.rowcount, 0)
+        self.rowcount = rowcount
 
     def _try_fetch(self, size=None):
         """Try to start fetching data, if not yet started.
 
-        Mutates self to indicate that iteration has started.
+        Mutates self to indicate that iteration has started. Pages are
+        sized from ``arraysize``, so that ``fetchmany()`` returns slices
+        of pages.
         """
         if self._query_job is None:
             raise exceptions.InterfaceError(
@@ -185,16 +248,17 @@ class Cursor(object):
             self._query_job.statement_type
             and self._query_job.statement_type.upper() != 'SELECT')
         if is_dml:
-            self._query_data = iter([])
+            self._query_data = _PageBuffer(())
             return
 
         if self._query_data is None:
             client = self.connection._client
-            # TODO(tswast): pass in page size to list_rows based on arraysize
             rows_iter = client.list_rows(
                 self._query_job.destination,
-                selected_fields=self._query_job._query_results.schema)
-            self._query_data = iter(rows_iter)
+                selected_fields=self._query_job._query_results.schema,
+                page_size=_page_size(self.arraysize))
+            self._query_data = _PageBuffer(
+                rows_iter.pages, _page_converter(rows_iter, self.plain_tuples))
 
     def fetchone(self):
         """Fetch a single row from the results of the last ``execute*()`` call.
@@ -207,18 +271,18 @@ class Cursor(object):
             if called before ``execute()``.
         """
         self._try_fetch()
-        try:
-            return six.next(self._query_data)
-        except StopIteration:
+        rows = self._query_data.take(1)
+        if not rows:
             return None
+        return rows[0]
 
     def fetchmany(self, size=None):
         """Fetch multiple results from the last ``execute*()`` call.
 
         .. note::
             The size parameter is not used for the request/response size.
-            Set the ``arraysize`` attribute before calling ``execute()`` to
-            set the batch size.
+            Set the ``arraysize`` attribute before the first fetch to set
+            the batch size.
 
         :type size: int
         :param size:
@@ -234,14 +298,7 @@ class Cursor(object):
             size = self.arraysize
 
         self._try_fetch(size=size)
-        rows = []
-
-        for row in self._query_data:
-            rows.append(row)
-            if len(rows) >= size:
-                break
-
-        return rows
+        return self._query_data.take(size)
 
     def fetchall(self):
         """Fetch all remaining results from the last ``execute*()`` call.
@@ -252,7 +309,7 @@ class Cursor(object):
             if called before ``execute()``.
         """
         self._try_fetch()
-        return list(self._query_data)
+        return self._query_data.take()
 
     def setinputsizes(self, sizes):
         """No-op."""
@@ -261,6 +318,204 @@ class Cursor(object):
         """No-op."""
 
 
+class _PageBuffer(object):
+    """Rows of the current page, with the next page fetched in the background.
+
+    :type pages: Iterable[Any]
+    :param pages: The pages of results.
+
+    :type convert: Callable[Any, List[tuple]]
+    :param convert: (Optional) Returns the rows of a page as a list. Called
+                    in the background, as well as ``pages.__next__``.
+    """
+    def __init__(self, pages, convert=list):
+        self._pages = iter(pages)
+        self._convert = convert
+        self._rows = []
+        self._index = 0
+        self._executor = concurrent.futures.ThreadPoolExecutor(1)
+        self._next_page = self._executor.submit(self._fetch_page)
+
+    def _fetch_page(self):
+        """Fetch and convert the next page.
+
+        :rtype: List[tuple] or ``NoneType``
+        :returns: The rows of the page, or ``None`` after the last page.
+        """
+        for page in self._pages:
+            return self._convert(page)
+        return None
+
+    def _advance(self):
+        """Move to the next page, and start fetching the one after it.
+
+        :rtype: bool
+        :returns: False if there are no more pages.
+        """
+        if self._next_page is None:
+            return False
+        try:
+            rows = self._next_page.result()
+        except Exception:
+            self.close()
+            raise
+        if rows is None:
+            self.close()
+            return False
+        self._rows = rows
+        self._index = 0
+        self._next_page = self._executor.submit(self._fetch_page)
+        return True
+
+    def take(self, size=None):
+        """Remove rows from the buffer, fetching pages as needed.
+
+        :type size: int
+        :param size: (Optional) Maximum number of rows to return. If not
+                     passed, return all the remaining rows.
+
+        :rtype: List[tuple]
+        :returns: The rows, fewer than ``size`` only after the last page.
+        """
+        rows = []
+        while size is None or len(rows) < size:
+            if self._index >= len(self._rows) and not self._advance():
+                break
+            stop = len(self._rows)
+            if size is not None:
+                stop = min(stop, self._index + size - len(rows))
+            rows.extend(self._rows[self._index:stop])
+            self._index = stop
+        return rows
+
+    def close(self):
+        """Stop fetching pages."""
+        if self._next_page is not None:
+            self._next_page.cancel()
+            self._next_page = None
+        self._executor.shutdown(wait=False)
+
+
+def _page_size(arraysize):
+    """Choose the number of rows of each page of results.
+
+    :type arraysize: int
+    :param arraysize: The number of rows returned by ``fetchmany()``.
+
+    :rtype: int or ``NoneType``
+    :returns: A multiple of ``arraysize`` of at least ``_MIN_PAGE_SIZE``
+              rows, or ``None`` for the server's default if ``arraysize``
+              is 1.
+    """
+    if arraysize is None or arraysize <= 1:
+        return None
+    return arraysize * max(1, _MIN_PAGE_SIZE // arraysize)
+
+
+def _page_converter(rows_iter, plain_tuples):
+    """Create a function returning the rows of a page as a list.
+
+    :type rows_iter: :class:`~google.cloud.bigquery.table.RowIterator`
+    :param rows_iter: The iterator producing the pages.
+
+    :type plain_tuples: bool
+    :param plain_tuples: Return tuples rather than
+                         :class:`~google.cloud.bigquery.table.Row` objects.
+
+    :rtype: Callable[google.api_core.page_iterator.Page, List[tuple]]
+    :returns: The converter.
+    """
+    if not plain_tuples:
+        return list
+
+    decode = rows_iter._decode_row
+
+    def convert(page):
+        return [decode(row) for row in page._rows]
+
+    return convert
+
+
+class _PositionalPlaceholders(object):
+    """Mapping replacing named parameters with positional ones.
+
+    The values of the parameters are recorded in the order of their
+    placeholders.
+
+    :type parameters: Mapping[str, Any]
+    :param parameters: Dictionary of parameter values.
+    """
+    def __init__(self, parameters):
+        self._parameters = parameters
+        self.values = []
+
+    def __getitem__(self, name):
+        self.values.append(self._parameters[name])
+        return '?'
+
+
+def _format_values(values, parameters):
+    """Format the ``VALUES`` clause of an ``INSERT`` for a parameter set.
+
+    :type values: str
+    :param values: The ``VALUES`` clause, such as ``(%s, %s)``.
+
+    :type parameters: Mapping[str, Any] or Sequence[Any]
+    :param parameters: Parameter values.
+
+    :rtype: Tuple[str, List[Any]]
+    :returns: The clause using positional parameters, such as ``(?, ?)``,
+              and the values of those parameters, in order.
+    :raises: :class:`~google.cloud.bigquery.dbapi.ProgrammingError`
+        if a parameter used in the clause is not found in ``parameters``.
+    """
+    if isinstance(parameters, collections.Mapping):
+        placeholders = _PositionalPlaceholders(parameters)
+        try:
+            return values % placeholders, placeholders.values
+        except KeyError as exc:
+            raise exceptions.ProgrammingError(exc)
+
+    return _format_operation_list(values, parameters), list(parameters)
+
+
+def _batch_insert_values(prefix, values, seq_of_parameters):
+    """Combine the rows of many ``INSERT`` statements into few statements.
+
+    :type prefix: str
+    :param prefix: The statement up to its ``VALUES`` keyword.
+
+    :type values: str
+    :param values: The ``VALUES`` clause, such as ``(%s, %s)``.
+
+    :type seq_of_parameters: Sequence[Mapping[str, Any] or Sequence[Any]]
+    :param seq_of_parameters: Sequence of many sets of parameter values.
+
+    :rtype: Iterator[Tuple[str, List[Any]]]
+    :returns: The formatted statements, each with the values of its
+              positional parameters, within ``_MAX_QUERY_LENGTH`` and
+              ``_MAX_QUERY_PARAMETERS`` unless a single row exceeds them.
+    """
+    rows = []
+    batch_values = []
+    length = len(prefix)
+    for parameters in seq_of_parameters:
+        row, row_values = _format_values(values, parameters)
+        row_length = len(row) + 2  # Include the ", " separator.
+        if rows and (
+                length + row_length > _MAX_QUERY_LENGTH or
+                len(batch_values) + len(row_values) > _MAX_QUERY_PARAMETERS):
+            yield prefix + ', '.join(rows), batch_values
+            rows = []
+            batch_values = []
+            length = len(prefix)
+        rows.append(row)
+        batch_values.extend(row_values)
+        length += row_length
+    if rows:
+        yield prefix + ', '.join(rows), batch_values
+
+
 def _format_operation_list(operation, parameters):
     """Formats parameters in operation in the way BigQuery expects.
 
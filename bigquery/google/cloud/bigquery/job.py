@@ -1645,6 +1645,7 @@ class QueryJob(_AsyncJob):
         self._configuration = job_config
         self._query_results = None
         self._done_timeout = None
+        self._done_max_results = 0
 
     @property
     def allow_large_results(self):
@@ -2021,7 +2022,8 @@ class QueryJob(_AsyncJob):
         if self.state != _DONE_STATE:
             self._query_results = self._client._get_query_results(
                 self.job_id, retry,
-                project=self.project, timeout_ms=timeout_ms)
+                project=self.project, timeout_ms=timeout_ms,
+                max_results=self._done_max_results)
 
             # Only reload the job once we know the query is complete.
             # This will ensure that fields such as the destination table are
@@ -2052,18 +2054,29 @@ class QueryJob(_AsyncJob):
             During each page, the iterator will have the ``total_rows``
             attribute set, which counts the total number of rows **in the
             result set** (this is distinct from the total number of rows in
-            the current page: ``iterator.page.num_items``).
+            the current page: ``iterator.page.num_items``). The first page
+            is the one returned when polling found the query complete, so
+            small results are read without further requests.
 
         :raises:
             :class:`~google.cloud.exceptions.GoogleCloudError` if the job
             failed or :class:`concurrent.futures.TimeoutError` if the job did
             not complete in the given timeout.
         """
-        super(QueryJob, self).result(timeout=timeout)
+        # Ask for rows while polling: they are only returned by the call
+        # finding the query complete.
+        self._done_max_results = None
+        try:
+            super(QueryJob, self).result(timeout=timeout)
+        finally:
+            self._done_max_results = 0
         # Return an iterator instead of returning the job.
         if not self._query_results:
             self._query_results = self._client._get_query_results(
-                self.job_id, retry, project=self.project)
+                self.job_id, retry, project=self.project, max_results=None)
+        if self._query_results._has_first_page():
+            return self._client._list_rows_from_query_results(
+                self._query_results, retry)
         schema = self._query_results.schema
         dest_table = self.destination
         return self._client.list_rows(dest_table, selected_fields=schema,
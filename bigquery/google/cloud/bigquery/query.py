@@ -614,6 +614,17 @@ class _QueryResults(object):
         """
         return _parse_schema_resource(self._properties.get('schema', {}))
 
+    def _has_first_page(self):
+        """Check if the results include the first page of rows.
+
+        Rows are only returned once the query is complete, and if they
+        were requested (see ``Client._get_query_results``).
+
+        :rtype: bool
+        :returns: True if the rows (if any) were returned with the results.
+        """
+        return 'rows' in self._properties or self.total_rows == 0
+
     def _set_properties(self, api_response):
         """Update properties from resource in body of ``api_response``
 
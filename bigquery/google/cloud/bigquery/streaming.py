@@ -0,0 +1,311 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Stream rows into a table in the background.
+
+:class:`StreamingInserter` accepts rows one at a time and sends them with
+``tabledata.insertAll`` in batches, bounded by size, row count and
+latency:
+
+.. code-block:: python
+
+   from google.cloud.bigquery.streaming import StreamingInserter
+
+   with StreamingInserter(client, table) as inserter:
+       futures = [inserter.insert(row) for row in rows]
+   for future in futures:
+       future.result()  # Raises InsertError for rejected rows.
+"""
+
+from __future__ import absolute_import
+
+import collections
+import concurrent.futures
+import itertools
+import json
+import threading
+import time
+import uuid
+
+from google.cloud.bigquery._helpers import DEFAULT_RETRY
+from google.cloud.bigquery.client import _row_encoder
+from google.cloud.bigquery.table import Table
+from google.cloud.bigquery.table import TableReference
+from google.cloud.bigquery.table import _TABLE_HAS_NO_SCHEMA
+
+
+BatchSettings = collections.namedtuple(
+    'BatchSettings', ['max_bytes', 'max_latency', 'max_rows'])
+BatchSettings.__new__.__defaults__ = (
+    5 * 1024 * 1024,  # max_bytes: the API accepts 10 MB per request.
+    1.0,  # max_latency: 1 second.
+    500,  # max_rows: the number of rows per request recommended.
+)
+"""Limits on the batches sent by a :class:`StreamingInserter`.
+
+A batch is sent as soon as one limit would be exceeded: ``max_bytes`` of
+(estimated) request size, ``max_rows`` rows, or ``max_latency`` seconds
+since its first row was added.
+"""
+
+_DEFAULT_MAX_WORKERS = 4
+_DEFAULT_MAX_ATTEMPTS = 3
+_RETRY_DELAY = 1.0  # Seconds, doubled after each attempt.
+_RETRYABLE_REASONS = frozenset(
+    ['backendError', 'internalError', 'stopped', 'timeout'])
+"""Reasons of ``insertErrors`` for which a row is sent again.
+
+``stopped`` rows were valid, but not inserted because of other invalid
+rows in the same request.
+"""
+
+
+class InsertError(Exception):
+    """Raised by the future of a row which could not be inserted.
+
+    Args:
+        errors (List[dict]): Mappings describing the problems with the row,
+            as returned in ``insertErrors``.
+    """
+
+    def __init__(self, errors):
+        super(InsertError, self).__init__(errors)
+        self.errors = errors
+
+
+class _Batch(object):
+    """Rows waiting to be sent in one ``insertAll`` request."""
+
+    def __init__(self):
+        self.rows = []
+        self.size = 0
+
+
+class StreamingInserter(object):
+    """Insert rows into a table in batches, from background threads.
+
+    Rows are sent with the same insert IDs on every attempt, so that
+    BigQuery can drop duplicates of rows inserted by a failed request.
+
+    Args:
+        client (google.cloud.bigquery.client.Client): The client to use.
+        table (Union[google.cloud.bigquery.table.Table, \
+                     google.cloud.bigquery.table.TableReference]):
+            The destination table.
+        selected_fields (Sequence[google.cloud.bigquery.schema.SchemaField]):
+            (Optional) The fields of the rows passed to :meth:`insert`.
+            Defaults to the schema of ``table``.
+        batch_settings (BatchSettings): (Optional) When to send batches.
+        max_workers (int): (Optional) The number of batches sent at once.
+        max_attempts (int): (Optional) How many times rows failing with
+            a retryable error (``backendError``, ``internalError``,
+            ``stopped`` or ``timeout``) are sent.
+        skip_invalid_rows (bool): (Optional) See
+            :meth:`~google.cloud.bigquery.client.Client.insert_rows_json`.
+        ignore_unknown_values (bool): (Optional) See
+            :meth:`~google.cloud.bigquery.client.Client.insert_rows_json`.
+        template_suffix (str): (Optional) See
+            :meth:`~google.cloud.bigquery.client.Client.insert_rows_json`.
+        retry (google.api_core.retry.Retry): (Optional) How to retry each
+            ``insertAll`` request.
+    """
+
+    def __init__(self, client, table, selected_fields=None,
+                 batch_settings=BatchSettings(),
+                 max_workers=_DEFAULT_MAX_WORKERS,
+                 max_attempts=_DEFAULT_MAX_ATTEMPTS, skip_invalid_rows=None,
+                 ignore_unknown_values=None, template_suffix=None,
+                 retry=DEFAULT_RETRY):
+        if not isinstance(table, (Table, TableReference)):
+            raise TypeError('table should be Table or TableReference')
+        if selected_fields is not None:
+            self._schema = selected_fields
+        elif isinstance(table, Table):
+            self._schema = table.schema
+        else:
+            self._schema = None
+        self._encode = _row_encoder(self._schema) if self._schema else None
+        # Row IDs share a random prefix, see ``Client.insert_rows_json``.
+        self._id_prefix = str(uuid.uuid4())
+        self._id_counter = itertools.count()
+        self._client = client
+        self._table = table
+        self.batch_settings = batch_settings
+        self._max_attempts = max_attempts
+        self._insert_kwargs = {
+            'skip_invalid_rows': skip_invalid_rows,
+            'ignore_unknown_values': ignore_unknown_values,
+            'template_suffix': template_suffix,
+            'retry': retry,
+        }
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers)
+        self._lock = threading.Lock()
+        self._batch = None
+        self._pending = set()
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def insert(self, row, row_id=None):
+        """Queue a row for insertion.
+
+        Args:
+            row (Union[tuple, dict]): The row, as accepted by
+                :meth:`~google.cloud.bigquery.client.Client.insert_rows`.
+            row_id (str): (Optional) A unique ID for the row. If omitted,
+                one is created.
+
+        Returns:
+            concurrent.futures.Future: Resolves to the row's insert ID once
+                the row is inserted, or raises :exc:`InsertError` (or the
+                error of the request) if it could not be.
+
+        Raises:
+            ValueError: If no schema is known for the table.
+        """
+        if self._encode is None:
+            raise ValueError(_TABLE_HAS_NO_SCHEMA)
+        return self.insert_json(self._encode(row), row_id)
+
+    def insert_json(self, json_row, row_id=None):
+        """Queue a row for insertion, without type conversions.
+
+        Args:
+            json_row (dict): The row, as accepted by
+                :meth:`~google.cloud.bigquery.client.Client.insert_rows_json`.
+            row_id (str): (Optional) A unique ID for the row. If omitted,
+                one is created.
+
+        Returns:
+            concurrent.futures.Future: See :meth:`insert`.
+
+        Raises:
+            ValueError: If the inserter is closed.
+        """
+        if row_id is None:
+            row_id = '{}-{}'.format(self._id_prefix, next(self._id_counter))
+        # Estimate the row's share of the request body.
+        size = len(json.dumps({'insertId': row_id, 'json': json_row})) + 1
+        future = concurrent.futures.Future()
+        future.add_done_callback(self._discard)
+        settings = self.batch_settings
+
+        with self._lock:
+            if self._closed:
+                raise ValueError('Cannot insert rows once closed.')
+            batch = self._batch
+            if batch is not None and (
+                    len(batch.rows) >= settings.max_rows or
+                    batch.size + size > settings.max_bytes):
+                self._commit(batch)
+                batch = None
+            if batch is None:
+                batch = self._batch = _Batch()
+                timer = threading.Timer(
+                    settings.max_latency, self._commit_if_current, (batch,))
+                timer.daemon = True
+                timer.start()
+            batch.rows.append((row_id, json_row, future))
+            batch.size += size
+            self._pending.add(future)
+        return future
+
+    def flush(self):
+        """Send the rows queued so far, and wait for all rows to be sent.
+
+        Errors are reported by the futures of the rows, not raised.
+        """
+        with self._lock:
+            if self._batch is not None:
+                self._commit(self._batch)
+            pending = list(self._pending)
+        concurrent.futures.wait(pending)
+
+    def close(self):
+        """Flush the queued rows and stop the background threads."""
+        with self._lock:
+            self._closed = True
+        self.flush()
+        self._executor.shutdown()
+
+    def _discard(self, future):
+        """Forget the future of a row once it is resolved."""
+        with self._lock:
+            self._pending.discard(future)
+
+    def _commit_if_current(self, batch):
+        """Send a batch whose latency limit expired, unless already sent."""
+        with self._lock:
+            if self._batch is batch:
+                self._commit(batch)
+
+    def _commit(self, batch):
+        """Send a batch in the background. Must hold ``self._lock``."""
+        self._batch = None
+        self._executor.submit(self._send, batch.rows)
+
+    def _send(self, rows):
+        """Insert rows, retrying those failing with a retryable error.
+
+        Args:
+            rows (List[Tuple[str, dict, concurrent.futures.Future]]): The
+                insert ID, JSON data and future of each row.
+        """
+        delay = _RETRY_DELAY
+        for attempt in range(1, self._max_attempts + 1):
+            try:
+                errors = self._client.insert_rows_json(
+                    self._table, [json_row for _, json_row, _ in rows],
+                    row_ids=[row_id for row_id, _, _ in rows],
+                    **self._insert_kwargs)
+            except Exception as exc:  # pylint: disable=broad-except
+                for _, _, future in rows:
+                    future.set_exception(exc)
+                return
+
+            errors_by_index = {
+                error['index']: error['errors'] for error in errors}
+            retry_rows = []
+            for index, row in enumerate(rows):
+                row_errors = errors_by_index.get(index)
+                future = row[2]
+                if row_errors is None:
+                    future.set_result(row[0])
+                elif (attempt < self._max_attempts and
+                        _is_retryable(row_errors)):
+                    retry_rows.append(row)
+                else:
+                    future.set_exception(InsertError(row_errors))
+
+            if not retry_rows:
+                return
+            rows = retry_rows
+            time.sleep(delay)
+            delay *= 2
+
+
+def _is_retryable(errors):
+    """Check if a row failed only with retryable errors.
+
+    Args:
+        errors (List[dict]): The ``insertErrors`` of the row.
+
+    Returns:
+        bool: True if the row can be sent again.
+    """
+    return all(error.get('reason') in _RETRYABLE_REASONS for error in errors)
@@ -16,17 +16,26 @@
 
 from __future__ import absolute_import
 
+import concurrent.futures
 import copy
 import datetime
+import functools
 import operator
+import threading
 
 import six
+from six.moves import queue
+try:
+    import numpy
+except ImportError:  # pragma: NO COVER
+    numpy = None
 try:
     import pandas
 except ImportError:  # pragma: NO COVER
     pandas = None
 
 from google.api_core.page_iterator import HTTPIterator
+from google.api_core.page_iterator import Page
 
 from google.cloud._helpers import _datetime_from_microseconds
 from google.cloud._helpers import _millis_from_datetime
@@ -34,6 +43,8 @@ from google.cloud.bigquery._helpers import _item_to_row
 from google.cloud.bigquery._helpers import _rows_page_start
 from google.cloud.bigquery._helpers import _snake_to_camel_case
 from google.cloud.bigquery._helpers import _field_to_index_mapping
+from google.cloud.bigquery._helpers import _cell_decoder
+from google.cloud.bigquery._helpers import _row_tuple_decoder
 from google.cloud.bigquery.schema import SchemaField
 from google.cloud.bigquery.schema import _build_schema_resource
 from google.cloud.bigquery.schema import _parse_schema_resource
@@ -1138,6 +1149,109 @@ class Row(object):
         return 'Row({}, {})'.format(self._xxx_values, f2i)
 
 
+def _int_column_from_json(values):
+    """Convert the JSON values of an ``INTEGER`` column to an array.
+
+    Columns with nulls become ``float64`` (with ``NaN`` for nulls), as
+    :class:`pandas.DataFrame` does for integers mixed with :data:`None`.
+    """
+    if None in values:
+        return numpy.array(values, dtype=numpy.float64)
+    return numpy.array(values, dtype=object).astype(numpy.int64)
+
+
+def _float_column_from_json(values):
+    """Convert the JSON values of a ``FLOAT`` column to an array."""
+    return numpy.array(values, dtype=numpy.float64)
+
+
+def _bool_column_from_json(values):
+    """Convert the JSON values of a ``BOOLEAN`` column to an array.
+
+    Returns :data:`None` for columns with nulls, which have no NumPy
+    ``bool`` representation.
+    """
+    if None in values:
+        return None
+    return numpy.array(
+        [value.lower() in ('t', 'true', '1') for value in values],
+        dtype=numpy.bool_)
+
+
+def _timestamp_column_from_json(values):
+    """Convert the JSON values of a ``TIMESTAMP`` column to an array.
+
+    The values (floating point seconds since the epoch, in UTC) are
+    converted to naive ``datetime64[us]``, with ``NaT`` for nulls.
+    """
+    micros = numpy.round(numpy.array(values, dtype=numpy.float64) * 1e6)
+    nulls = numpy.isnan(micros)
+    micros[nulls] = 0
+    column = micros.astype(numpy.int64).astype('datetime64[us]')
+    column[nulls] = numpy.datetime64('NaT')
+    return column
+
+
+def _datetime_column_from_json(values):
+    """Convert the JSON values of a ``DATETIME`` column to an array."""
+    return numpy.array(values, dtype='datetime64[us]')
+
+
+_COLUMN_FROM_JSON = {
+    'INTEGER': _int_column_from_json,
+    'INT64': _int_column_from_json,
+    'FLOAT': _float_column_from_json,
+    'FLOAT64': _float_column_from_json,
+    'BOOLEAN': _bool_column_from_json,
+    'BOOL': _bool_column_from_json,
+    'TIMESTAMP': _timestamp_column_from_json,
+    'DATETIME': _datetime_column_from_json,
+}
+
+
+def _column_from_json(values, field):
+    """Convert the JSON values of a column of a page of rows.
+
+    :type values: list
+    :param values: The cell values (``row['f'][index]['v']``) of the column.
+
+    :type field: :class:`~google.cloud.bigquery.schema.SchemaField`
+    :param field: The column's field.
+
+    :rtype: :class:`numpy.ndarray` or list
+    :returns: A typed array, or a list of values converted one by one for
+              types (and repeated fields) with no NumPy representation.
+    """
+    if field.mode != 'REPEATED':
+        converter = _COLUMN_FROM_JSON.get(field.field_type)
+        if converter is not None:
+            column = converter(values)
+            if column is not None:
+                return column
+
+    decode = _cell_decoder(field)
+    return [decode(value) for value in values]
+
+
+def _concatenate_columns(pieces):
+    """Join the converted pieces of a column, one per page.
+
+    :type pieces: list
+    :param pieces: Arrays or lists returned by :func:`_column_from_json`.
+
+    :rtype: :class:`numpy.ndarray` or list
+    :returns: The whole column.
+    """
+    if len(pieces) == 1:
+        return pieces[0]
+    if all(isinstance(piece, numpy.ndarray) for piece in pieces):
+        return numpy.concatenate(pieces)
+    column = []
+    for piece in pieces:
+        column.extend(piece)
+    return column
+
+
 class RowIterator(HTTPIterator):
     """A class for iterating through HTTP/JSON API row list responses.
 
@@ -1150,12 +1264,17 @@ class RowIterator(HTTPIterator):
             fetching results from.
         max_results (int): The maximum number of results to fetch.
         extra_params (dict): Extra query string parameters for the API call.
+        first_page_response (dict): An API response already holding the
+            first page of rows (and the token of the next one), used instead
+            of making the first request.
+        page_size (int): The maximum number of rows in each page.
 
     .. autoattribute:: pages
     """
 
     def __init__(self, client, api_request, path, schema, page_token=None,
-                 max_results=None, extra_params=None):
+                 max_results=None, extra_params=None,
+                 first_page_response=None, page_size=None):
         super(RowIterator, self).__init__(
             client, api_request, path, item_to_value=_item_to_row,
             items_key='rows', page_token=page_token, max_results=max_results,
@@ -1163,7 +1282,35 @@ class RowIterator(HTTPIterator):
             next_token='pageToken')
         self._schema = schema
         self._field_to_index = _field_to_index_mapping(schema)
+        self._decode_row = _row_tuple_decoder(schema)
         self._total_rows = None
+        self._first_page_response = first_page_response
+        self._page_size = page_size
+
+    def _get_query_params(self):
+        """Getter for query parameters for the next request.
+
+        Returns:
+            dict: A dictionary of query parameters, limiting the number of
+                rows to ``page_size``.
+        """
+        params = super(RowIterator, self)._get_query_params()
+        if self._page_size is not None:
+            params['maxResults'] = min(
+                self._page_size, params.get('maxResults', self._page_size))
+        return params
+
+    def _get_next_page_response(self):
+        """Requests the next page, unless the first one was provided.
+
+        Returns:
+            dict: The parsed JSON response of the next page's contents.
+        """
+        if self._first_page_response is not None:
+            response = self._first_page_response
+            self._first_page_response = None
+            return response
+        return super(RowIterator, self)._get_next_page_response()
 
     @property
     def schema(self):
@@ -1201,7 +1348,245 @@ class RowIterator(HTTPIterator):
                              'install pandas to use the to_dataframe() '
                              'function.')
 
-        column_headers = [field.name for field in self.schema]
-        rows = [row.values() for row in iter(self)]
+        # Convert each page column by column, straight from the API
+        # response, rather than building a ``Row`` per record.
+        schema = self._schema
+        pieces = [[] for _ in schema]
+        for page in self.pages:
+            cells = [row['f'] for row in page._rows]
+            for index, field in enumerate(schema):
+                values = [row_cells[index]['v'] for row_cells in cells]
+                pieces[index].append(_column_from_json(values, field))
+
+        column_headers = [field.name for field in schema]
+        columns = {}
+        for field, field_pieces in zip(schema, pieces):
+            if not field_pieces:
+                columns[field.name] = []
+                continue
+            column = _concatenate_columns(field_pieces)
+            if (isinstance(column, numpy.ndarray) and
+                    field.field_type == 'TIMESTAMP'):
+                column = pandas.Series(column).dt.tz_localize('UTC')
+            columns[field.name] = column
+
+        return pandas.DataFrame(columns, columns=column_headers)
+
+
+_DONE = object()
+"""Marks the end of the responses of a range in :class:`_ParallelRowIterator`.
+"""
+_RANGE_QUEUE_PAGES = 2  # Pages buffered per range of a parallel iteration.
+_QUEUE_POLL_INTERVAL = 0.1  # Seconds.
+
+
+def _split_range(start, stop, parts):
+    """Split a range of row indexes into contiguous, similar ranges.
+
+    :type start: int
+    :param start: The first index.
+
+    :type stop: int
+    :param stop: The index after the last one.
 
-        return pandas.DataFrame(rows, columns=column_headers)
+    :type parts: int
+    :param parts: The maximum number of ranges.
+
+    :rtype: list of tuple
+    :returns: Non-empty ``(start, stop)`` ranges, in order.
+    """
+    total = max(stop - start, 0)
+    parts = max(min(parts, total), 1)
+    size, extra = divmod(total, parts)
+    ranges = []
+    for part in range(parts):
+        part_stop = start + size + (1 if part < extra else 0)
+        if part_stop > start:
+            ranges.append((start, part_stop))
+        start = part_stop
+    return ranges
+
+
+class _ParallelRowIterator(RowIterator):
+    """Iterate over table rows fetched by several concurrent streams.
+
+    The rows between ``start`` and ``stop`` are split into ``parallelism``
+    ranges, each read page after page (by advancing ``startIndex``) in its
+    own thread. A few pages of each range are buffered until the
+    iteration reaches them; the streams then wait, so that memory use
+    does not grow with the size of the table.
+
+    Args:
+        client (google.cloud.bigquery.Client): The API client.
+        api_request (Callable[google.cloud._http.JSONConnection.api_request]):
+            The function to use to make API requests.
+        path (str): The method path to query for the list of items.
+        schema (Sequence[google.cloud.bigquery.schema.SchemaField]):
+            The fields of the rows.
+        start (int): The index of the first row to fetch.
+        stop (int): The index after the last row to fetch.
+        parallelism (int): The number of concurrent streams.
+        ordered (bool): If false, yield pages as soon as any stream
+            fetched them, rather than in the order of the table.
+        extra_params (dict): Extra query string parameters for the API call.
+        page_size (int): The maximum number of rows in each page.
+    """
+
+    def __init__(self, client, api_request, path, schema, start, stop,
+                 parallelism, ordered=True, extra_params=None,
+                 page_size=None):
+        super(_ParallelRowIterator, self).__init__(
+            client, api_request, path, schema, extra_params=extra_params,
+            page_size=page_size)
+        self._ranges = _split_range(start, stop, parallelism)
+        self._ordered = ordered
+        self._responses = None
+
+    def _next_page(self):
+        """Get the next page fetched by the streams.
+
+        Returns:
+            Optional[Page]: The next page, or :data:`None` once every range
+                has been read.
+        """
+        if self._responses is None:
+            self._responses = self._fetch_ranges()
+        response = six.next(self._responses, None)
+        if response is None:
+            return None
+        page = Page(self, response.get('rows', ()), self._item_to_value)
+        self._page_start(self, page, response)
+        return page
+
+    def _fetch_ranges(self):
+        """Start fetching all the ranges concurrently.
+
+        The streams do not reference the iterator: once it is garbage
+        collected, the generator returned is closed, which stops them.
+
+        Returns:
+            Iterator[dict]: The API responses, ordered by row index if
+                ``ordered``.
+        """
+        fetch_range = functools.partial(
+            _fetch_range, self.api_request, self.path,
+            dict(self.extra_params), self._page_size)
+        return _fetch_ranges(fetch_range, self._ranges, self._ordered)
+
+
+def _fetch_range(api_request, path, extra_params, page_size, start, stop,
+                 responses, cancelled):
+    """Read a range of rows, page after page.
+
+    Args:
+        api_request (Callable): The function making API requests.
+        path (str): The path of the ``tabledata.list`` method.
+        extra_params (dict): Extra query string parameters for the API call.
+        page_size (Optional[int]): The maximum number of rows in each page.
+        start (int): The index of the first row.
+        stop (int): The index after the last row.
+        responses (queue.Queue): Bounded queue receiving each response,
+            then either the exception raised or :data:`_DONE`.
+        cancelled (threading.Event): Set if the iteration stopped.
+    """
+    try:
+        while start < stop and not cancelled.is_set():
+            params = dict(extra_params)
+            params['startIndex'] = start
+            params['maxResults'] = stop - start
+            if page_size is not None:
+                params['maxResults'] = min(page_size, params['maxResults'])
+            response = api_request(
+                method='GET', path=path, query_params=params)
+            num_rows = len(response.get('rows', ()))
+            if num_rows == 0:
+                break
+            if not _put_until_cancelled(responses, response, cancelled):
+                return
+            start += num_rows
+    except Exception as exc:  # pylint: disable=broad-except
+        _put_until_cancelled(responses, exc, cancelled)
+    else:
+        _put_until_cancelled(responses, _DONE, cancelled)
+
+
+def _fetch_ranges(fetch_range, ranges, ordered):
+    """Fetch ranges of rows concurrently.
+
+    Args:
+        fetch_range (Callable): :func:`_fetch_range`, missing the arguments
+            from ``start`` on.
+        ranges (List[Tuple[int, int]]): The ``(start, stop)`` ranges.
+        ordered (bool): Whether to yield the responses by row index.
+
+    Yields:
+        dict: The API responses.
+    """
+    if not ranges:
+        return
+
+    cancelled = threading.Event()
+    if ordered:
+        queues = [queue.Queue(_RANGE_QUEUE_PAGES) for _ in ranges]
+    else:
+        queues = [queue.Queue(_RANGE_QUEUE_PAGES * len(ranges))] * len(ranges)
+
+    executor = concurrent.futures.ThreadPoolExecutor(len(ranges))
+    try:
+        for (start, stop), responses in zip(ranges, queues):
+            executor.submit(fetch_range, start, stop, responses, cancelled)
+
+        if ordered:
+            for responses in queues:
+                for response in _drain(responses, 1):
+                    yield response
+        else:
+            for response in _drain(queues[0], len(ranges)):
+                yield response
+    finally:
+        cancelled.set()
+        executor.shutdown(wait=False)
+
+
+def _put_until_cancelled(responses, value, cancelled):
+    """Put a value on a bounded queue, unless the iteration stopped.
+
+    Args:
+        responses (queue.Queue): The queue to put the value on.
+        value (object): The value to be put.
+        cancelled (threading.Event): Set if the iteration stopped.
+
+    Returns:
+        bool: True if the value was put on the queue.
+    """
+    while not cancelled.is_set():
+        try:
+            responses.put(value, timeout=_QUEUE_POLL_INTERVAL)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _drain(responses, num_ranges):
+    """Yield responses from a queue until every range feeding it is done.
+
+    Args:
+        responses (queue.Queue): The queue filled by
+            :func:`_fetch_range`.
+        num_ranges (int): The number of ranges feeding the queue.
+
+    Yields:
+        dict: The API responses.
+
+    Raises:
+        Exception: The first error raised while fetching a range.
+    """
+    while num_ranges:
+        response = responses.get()
+        if response is _DONE:
+            num_ranges -= 1
+        elif isinstance(response, Exception):
+            raise response
+        else:
+            yield response
@@ -375,6 +375,61 @@ class Test_record_from_json(unittest.TestCase):
         self.assertEqual(coerced, expected)
 
 
+class Test_row_tuple_decoder(unittest.TestCase):
+
+    def _call_fut(self, schema):
+        from google.cloud.bigquery._helpers import _row_tuple_decoder
+
+        return _row_tuple_decoder(schema)
+
+    def test_w_nullable_scalars(self):
+        import datetime
+        from google.cloud._helpers import UTC
+
+        schema = [
+            _Field('NULLABLE', 'int', 'INTEGER'),
+            _Field('NULLABLE', 'float', 'FLOAT64'),
+            _Field('NULLABLE', 'str', 'STRING'),
+            _Field('NULLABLE', 'bool', 'BOOLEAN'),
+            _Field('NULLABLE', 'ts', 'TIMESTAMP'),
+            _Field('NULLABLE', 'date', 'DATE'),
+        ]
+        decode = self._call_fut(schema)
+
+        row = {'f': [
+            {'v': '7'}, {'v': '1.5'}, {'v': 'abc'}, {'v': 'TRUE'},
+            {'v': '1.4338368E9'}, {'v': '1999-12-01'},
+        ]}
+        self.assertEqual(decode(row), (
+            7, 1.5, 'abc', True,
+            datetime.datetime(2015, 6, 9, 8, 0, tzinfo=UTC),
+            datetime.date(1999, 12, 1)))
+        # The decoder is reused for subsequent rows.
+        null_row = {'f': [{'v': None}] * len(schema)}
+        self.assertEqual(decode(null_row), (None,) * len(schema))
+
+    def test_w_required_integer_null(self):
+        decode = self._call_fut([_Field('REQUIRED', 'int', 'INTEGER')])
+        with self.assertRaises(TypeError):
+            decode({'f': [{'v': None}]})
+
+    def test_w_nullable_record(self):
+        sub_1 = _Field('NULLABLE', 'sub_1', 'INTEGER')
+        sub_2 = _Field('REPEATED', 'sub_2', 'STRING')
+        col = _Field('NULLABLE', 'col', 'RECORD', fields=[sub_1, sub_2])
+        decode = self._call_fut([col])
+
+        row = {'f': [{'v': {'f': [
+            {'v': None}, {'v': [{'v': 'a'}, {'v': 'b'}]}]}}]}
+        self.assertEqual(decode(row), ({'sub_1': None, 'sub_2': ['a', 'b']},))
+        self.assertEqual(decode({'f': [{'v': None}]}), (None,))
+
+    def test_w_repeated_bytes(self):
+        decode = self._call_fut([_Field('REPEATED', 'col', 'BYTES')])
+        row = {'f': [{'v': [{'v': 'YWJj'}, {'v': 'ZGVm'}]}]}
+        self.assertEqual(decode(row), ([b'abc', b'def'],))
+
+
 class Test_row_tuple_from_json(unittest.TestCase):
 
     def _call_fut(self, row, schema):
@@ -730,6 +785,56 @@ class Test_time_to_json(unittest.TestCase):
         self.assertEqual(self._call_fut(when), '12:13:41')
 
 
+class Test_field_encoder(unittest.TestCase):
+
+    def _call_fut(self, field):
+        from google.cloud.bigquery._helpers import _field_encoder
+
+        return _field_encoder(field)
+
+    def test_w_string(self):
+        self.assertIsNone(self._call_fut(_Field('NULLABLE', 'str', 'STRING')))
+
+    def test_w_scalar(self):
+        encode = self._call_fut(_Field('NULLABLE', 'int', 'INTEGER'))
+        self.assertEqual(encode(7), '7')
+        self.assertIsNone(encode(None))
+
+    def test_w_repeated_scalar(self):
+        encode = self._call_fut(_Field('REPEATED', 'bool', 'BOOLEAN'))
+        self.assertEqual(encode([True, False]), ['true', 'false'])
+        self.assertEqual(encode(()), [])
+        self.assertIsNone(encode(None))
+
+    def test_w_record(self):
+        import datetime
+
+        sub_1 = _Field('NULLABLE', 'sub_1', 'DATE')
+        sub_2 = _Field('REPEATED', 'sub_2', 'INTEGER')
+        sub_3 = _Field('NULLABLE', 'sub_3', 'STRING')
+        encode = self._call_fut(
+            _Field('NULLABLE', 'rec', 'RECORD', fields=[sub_1, sub_2, sub_3]))
+
+        when = datetime.date(1999, 12, 1)
+        self.assertEqual(
+            encode({'sub_1': when, 'sub_2': [1, 2], 'other': 3}),
+            {'sub_1': '1999-12-01', 'sub_2': ['1', '2'], 'other': 3})
+        self.assertEqual(
+            encode((when, [3], 'abc')),
+            {'sub_1': '1999-12-01', 'sub_2': ['3'], 'sub_3': 'abc'})
+        self.assertIsNone(encode(None))
+
+    def test_w_repeated_nested_record(self):
+        inner = _Field('NULLABLE', 'inner', 'STRUCT', fields=[
+            _Field('NULLABLE', 'flag', 'BOOL')])
+        encode = self._call_fut(
+            _Field('REPEATED', 'outer', 'RECORD', fields=[inner]))
+
+        self.assertEqual(
+            encode([{'inner': {'flag': True}}, {'inner': None}]),
+            [{'inner': {'flag': 'true'}}, {'inner': None}])
+
+
 class Test_snake_to_camel_case(unittest.TestCase):
 
     def _call_fut(self, value):
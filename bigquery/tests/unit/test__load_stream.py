@@ -0,0 +1,157 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import zlib
+
+import mock
+
+try:
+    import pandas
+except (ImportError, AttributeError):  # pragma: NO COVER
+    pandas = None
+
+
+def _gunzip(data):
+    return zlib.decompress(data, 16 + zlib.MAX_WBITS)
+
+
+class Test_GzipStream(unittest.TestCase):
+
+    @staticmethod
+    def _make_one(*args, **kw):
+        from google.cloud.bigquery._load_stream import _GzipStream
+
+        return _GzipStream(*args, **kw)
+
+    def test_read_all(self):
+        stream = self._make_one([b'abc', b'', b'def'])
+        data = stream.read()
+        self.assertEqual(_gunzip(data), b'abcdef')
+        self.assertEqual(stream.tell(), len(data))
+        self.assertEqual(stream.read(), b'')
+
+    def test_read_empty(self):
+        stream = self._make_one([])
+        self.assertEqual(_gunzip(stream.read(None)), b'')
+
+    def test_read_sized_is_lazy(self):
+        chunks = mock.MagicMock()
+        produced = iter([b'x' * 1000] * 100)
+        chunks.__iter__.return_value = produced
+        stream = self._make_one(chunks, level=0)
+
+        data = stream.read(10)
+        self.assertEqual(len(data), 10)
+        self.assertEqual(stream.tell(), 10)
+        # Only the first chunks were serialized.
+        self.assertTrue(len(list(produced)) > 90)
+
+    def test_read_chunks(self):
+        stream = self._make_one([b'abc' * 1000, b'def' * 1000], level=0)
+        pieces = []
+        piece = stream.read(7)
+        while piece:
+            pieces.append(piece)
+            piece = stream.read(7)
+
+        self.assertTrue(all(len(piece) == 7 for piece in pieces[:-1]))
+        self.assertEqual(
+            _gunzip(b''.join(pieces)), b'abc' * 1000 + b'def' * 1000)
+
+    def test_seek_within_last_read(self):
+        stream = self._make_one([b'abcdefgh' * 100], level=0)
+        first = stream.read(10)
+        second = stream.read(10)
+
+        self.assertEqual(stream.seek(14), 14)
+        self.assertEqual(stream.tell(), 14)
+        rest = stream.read()
+        self.assertEqual(_gunzip(first + second[:4] + rest), b'abcdefgh' * 100)
+
+        # Seeking to the current position is always allowed.
+        self.assertEqual(stream.seek(stream.tell()), stream.tell())
+
+    def test_seek_out_of_range(self):
+        import os
+
+        stream = self._make_one([b'abcdefgh' * 100], level=0)
+        stream.read(10)
+        stream.read(10)
+
+        with self.assertRaises(ValueError):
+            stream.seek(5)
+        with self.assertRaises(ValueError):
+            stream.seek(25)
+        with self.assertRaises(ValueError):
+            stream.seek(0, os.SEEK_END)
+
+
+class Test_json_chunks(unittest.TestCase):
+
+    def test_batches(self):
+        from google.cloud.bigquery._load_stream import _json_chunks
+
+        rows = ({'a': index} for index in range(5))
+        with mock.patch(
+                'google.cloud.bigquery._load_stream._ROWS_PER_CHUNK', new=2):
+            chunks = list(_json_chunks(rows))
+
+        self.assertEqual(chunks, [
+            b'{"a": 0}\n{"a": 1}\n', b'{"a": 2}\n{"a": 3}\n', b'{"a": 4}\n'])
+
+
+class Test_csv_chunks(unittest.TestCase):
+
+    def test_quoting_and_nulls(self):
+        from google.cloud.bigquery._load_stream import _csv_chunks
+
+        rows = [(u'a,b', None, 1), (u'\xe9', u'"q"', 2)]
+        chunks = list(_csv_chunks(rows))
+
+        self.assertEqual(
+            chunks, [u'"a,b",,1\n\xe9,"""q""",2\n'.encode('utf-8')])
+
+    def test_non_ascii(self):
+        from google.cloud.bigquery._load_stream import _csv_chunks
+
+        rows = [(u'caf\xe9', u'\u65e5\u672c', 1.5, True, None)]
+        chunks = list(_csv_chunks(rows))
+
+        self.assertEqual(
+            chunks, [u'caf\xe9,\u65e5\u672c,1.5,True,\n'.encode('utf-8')])
+
+
+@unittest.skipIf(pandas is None, 'Requires `pandas`')
+class Test_dataframe_csv_chunks(unittest.TestCase):
+
+    @staticmethod
+    def _call_fut(dataframe):
+        from google.cloud.bigquery._load_stream import _dataframe_csv_chunks
+
+        return list(_dataframe_csv_chunks(dataframe))
+
+    def test_header_once(self):
+        dataframe = pandas.DataFrame(
+            {'name': ['a', 'b', 'c'], 'age': [1, 2, 3]},
+            columns=['name', 'age'])
+        with mock.patch(
+                'google.cloud.bigquery._load_stream._ROWS_PER_CHUNK', new=2):
+            chunks = self._call_fut(dataframe)
+
+        self.assertEqual(chunks, [b'name,age\na,1\nb,2\n', b'c,3\n'])
+
+    def test_empty(self):
+        dataframe = pandas.DataFrame(columns=['name', 'age'])
+        self.assertEqual(self._call_fut(dataframe), [b'name,age\n'])
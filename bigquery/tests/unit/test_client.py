@@ -116,6 +116,53 @@ class TestClient(unittest.TestCase):
         self.assertEqual(query_results.total_rows, 10)
         self.assertTrue(query_results.complete)
 
+    def test__get_query_results_w_first_page(self):
+        creds = _make_credentials()
+        client = self._make_one(self.PROJECT, creds)
+        conn = client._connection = _Connection({
+            'jobReference': {'projectId': self.PROJECT, 'jobId': 'job'},
+            'jobComplete': True,
+        })
+
+        client._get_query_results('job', None, max_results=None)
+
+        self.assertEqual(conn._requested[0]['query_params'], {})
+
+    def test__list_rows_from_query_results(self):
+        from google.cloud.bigquery.query import _QueryResults
+
+        creds = _make_credentials()
+        client = self._make_one(self.PROJECT, creds)
+        schema = {'fields': [{'name': 'age', 'type': 'INTEGER'}]}
+        reference = {'projectId': self.PROJECT, 'jobId': 'job'}
+        query_results = _QueryResults({
+            'jobReference': reference,
+            'jobComplete': True,
+            'schema': schema,
+            'totalRows': '3',
+            'rows': [{'f': [{'v': '1'}]}, {'f': [{'v': '2'}]}],
+            'pageToken': 'TOKEN',
+        })
+        conn = client._connection = _Connection({
+            'jobReference': reference,
+            'jobComplete': True,
+            'schema': schema,
+            'totalRows': '3',
+            'rows': [{'f': [{'v': '3'}]}],
+        })
+
+        iterator = client._list_rows_from_query_results(query_results, None)
+        rows = list(iterator)
+
+        self.assertEqual([row.age for row in rows], [1, 2, 3])
+        self.assertEqual(iterator.total_rows, 3)
+        self.assertEqual(len(conn._requested), 1)
+        req = conn._requested[0]
+        self.assertEqual(req['method'], 'GET')
+        self.assertEqual(
+            req['path'], '/projects/%s/queries/job' % (self.PROJECT,))
+        self.assertEqual(req['query_params'], {'pageToken': 'TOKEN'})
+
     def test_list_projects_defaults(self):
         from google.cloud.bigquery.client import Project
 
@@ -1546,6 +1593,166 @@ class TestClient(unittest.TestCase):
                           'allUsers': True,
                           'stateFilter': 'done'})
 
+    def _make_wait_job(self, client, job_id, state='RUNNING'):
+        from google.cloud.bigquery.job import QueryJob
+
+        job = QueryJob(job_id, 'SELECT 1', client)
+        if state is not None:
+            job._properties['status'] = {'state': state}
+        return job
+
+    def _job_resource(self, job_id, state, error_result=None):
+        status = {'state': state}
+        if error_result is not None:
+            status['errorResult'] = error_result
+        return {
+            'jobReference': {'projectId': self.PROJECT, 'jobId': job_id},
+            'configuration': {'query': {'query': 'SELECT 1'}},
+            'status': status,
+        }
+
+    def test_wait_for_jobs_invalid_return_when(self):
+        creds = _make_credentials()
+        client = self._make_one(self.PROJECT, creds)
+
+        with self.assertRaises(ValueError):
+            client.wait_for_jobs([], return_when='WHENEVER')
+
+    def test_wait_for_jobs_empty(self):
+        creds = _make_credentials()
+        client = self._make_one(self.PROJECT, creds)
+        conn = client._connection = _Connection()
+
+        done, not_done = client.wait_for_jobs([])
+
+        self.assertEqual(done, set())
+        self.assertEqual(not_done, set())
+        self.assertEqual(conn._requested, [])
+
+    def test_wait_for_jobs_reloads_few_jobs(self):
+        creds = _make_credentials()
+        client = self._make_one(self.PROJECT, creds)
+        conn = client._connection = _Connection(
+            self._job_resource('job_1', 'RUNNING'),
+            self._job_resource('job_2', 'RUNNING'),
+            self._job_resource('job_1', 'RUNNING'),
+            self._job_resource('job_2', 'RUNNING'),
+            self._job_resource('job_1', 'DONE'),
+            self._job_resource('job_2', 'DONE'),
+        )
+        jobs = [
+            self._make_wait_job(client, 'job_1'),
+            self._make_wait_job(client, 'job_2'),
+        ]
+
+        with mock.patch('time.sleep') as sleep:
+            done, not_done = client.wait_for_jobs(jobs)
+
+        self.assertEqual(done, set(jobs))
+        self.assertEqual(not_done, set())
+        self.assertEqual(len(conn._requested), 6)
+        self.assertTrue(all(
+            req['method'] == 'GET' for req in conn._requested))
+        # The interval grows while no job completes.
+        self.assertEqual(sleep.mock_calls, [mock.call(1.0), mock.call(1.5)])
+        # The futures are resolved without further requests.
+        for job in jobs:
+            self.assertTrue(job.done())
+            self.assertIsNone(job.exception())
+        self.assertEqual(len(conn._requested), 6)
+
+    def test_wait_for_jobs_lists_active_jobs(self):
+        creds = _make_credentials()
+        client = self._make_one(self.PROJECT, creds)
+        active = {
+            'jobs': [
+                {'jobReference': {
+                    'projectId': self.PROJECT, 'jobId': 'job_1'}},
+                {'jobReference': {
+                    'projectId': self.PROJECT, 'jobId': 'other_job'}},
+            ],
+        }
+        conn = client._connection = _Connection(
+            active,
+            self._job_resource('job_2', 'DONE'),
+            self._job_resource('job_3', 'DONE'),
+        )
+        jobs = [
+            self._make_wait_job(client, 'job_1'),
+            self._make_wait_job(client, 'job_2', state='PENDING'),
+            self._make_wait_job(client, 'job_3'),
+        ]
+
+        with mock.patch('time.sleep') as sleep:
+            done, not_done = client.wait_for_jobs(
+                jobs, return_when='FIRST_COMPLETED')
+
+        self.assertEqual(done, set(jobs[1:]))
+        self.assertEqual(not_done, set(jobs[:1]))
+        sleep.assert_not_called()
+        self.assertEqual(len(conn._requested), 3)
+        req = conn._requested[0]
+        self.assertEqual(req['method'], 'GET')
+        self.assertEqual(req['path'], '/projects/%s/jobs' % self.PROJECT)
+        self.assertEqual(req['query_params'], {
+            'projection': 'minimal',
+            'stateFilter': ['pending', 'running'],
+            'maxResults': 1000,
+        })
+        self.assertEqual(
+            sorted(req['path'] for req in conn._requested[1:]),
+            ['/projects/%s/jobs/job_2' % self.PROJECT,
+             '/projects/%s/jobs/job_3' % self.PROJECT])
+
+    def test_wait_for_jobs_timeout(self):
+        creds = _make_credentials()
+        client = self._make_one(self.PROJECT, creds)
+        conn = client._connection = _Connection(
+            self._job_resource('job_1', 'RUNNING'),
+            self._job_resource('job_1', 'RUNNING'),
+        )
+        job = self._make_wait_job(client, 'job_1')
+
+        with mock.patch('time.time', side_effect=[100.0, 100.0, 101.5]):
+            with mock.patch('time.sleep') as sleep:
+                done, not_done = client.wait_for_jobs([job], timeout=1.5)
+
+        self.assertEqual(done, set())
+        self.assertEqual(not_done, set([job]))
+        self.assertEqual(len(conn._requested), 2)
+        sleep.assert_called_once_with(1.0)
+
+    def test_wait_for_jobs_first_exception(self):
+        creds = _make_credentials()
+        client = self._make_one(self.PROJECT, creds)
+        conn = client._connection = _Connection()
+        failed = self._make_wait_job(client, 'job_1', state='DONE')
+        failed._properties['status']['errorResult'] = {
+            'reason': 'invalidQuery', 'message': 'Bad query'}
+        running = self._make_wait_job(client, 'job_2')
+
+        done, not_done = client.wait_for_jobs(
+            [failed, running], return_when='FIRST_EXCEPTION')
+
+        self.assertEqual(done, set([failed]))
+        self.assertEqual(not_done, set([running]))
+        self.assertEqual(conn._requested, [])
+        self.assertIsNotNone(failed.exception())
+
+    def test_wait_for_jobs_begins_new_jobs(self):
+        creds = _make_credentials()
+        client = self._make_one(self.PROJECT, creds)
+        conn = client._connection = _Connection(
+            self._job_resource('job_1', 'DONE'))
+        job = self._make_wait_job(client, 'job_1', state=None)
+
+        done, not_done = client.wait_for_jobs([job])
+
+        self.assertEqual(done, set([job]))
+        self.assertEqual(not_done, set())
+        self.assertEqual(len(conn._requested), 1)
+        self.assertEqual(conn._requested[0]['method'], 'POST')
+
     def test_load_table_from_uri(self):
         from google.cloud.bigquery.job import LoadJob
 
@@ -2169,11 +2376,11 @@ class TestClient(unittest.TestCase):
         SENT = {
             'rows': [{
                 'json': _row_data(row),
-                'insertId': str(i),
+                'insertId': 'abcd-%d' % (i,),
             } for i, row in enumerate(ROWS)],
         }
 
-        with mock.patch('uuid.uuid4', side_effect=map(str, range(len(ROWS)))):
+        with mock.patch('uuid.uuid4', return_value='abcd'):
             errors = client.create_rows(table, ROWS)
 
         self.assertEqual(len(errors), 0)
@@ -2234,11 +2441,11 @@ class TestClient(unittest.TestCase):
         SENT = {
             'rows': [{
                 'json': _row_data(row),
-                'insertId': str(i),
+                'insertId': 'abcd-%d' % (i,),
             } for i, row in enumerate(ROWS)],
         }
 
-        with mock.patch('uuid.uuid4', side_effect=map(str, range(len(ROWS)))):
+        with mock.patch('uuid.uuid4', return_value='abcd'):
             errors = client.create_rows(table, ROWS)
 
         self.assertEqual(len(errors), 0)
@@ -2279,11 +2486,11 @@ class TestClient(unittest.TestCase):
         SENT = {
             'rows': [{
                 'json': _row_data(row),
-                'insertId': str(i),
+                'insertId': 'abcd-%d' % (i,),
             } for i, row in enumerate(ROWS)],
         }
 
-        with mock.patch('uuid.uuid4', side_effect=map(str, range(len(ROWS)))):
+        with mock.patch('uuid.uuid4', return_value='abcd'):
             errors = client.create_rows(table, ROWS)
 
         self.assertEqual(len(errors), 0)
@@ -2381,18 +2588,19 @@ class TestClient(unittest.TestCase):
             (['red', 'green'], [{'index': [1, 2], 'score': [3.1415, 1.414]}]),
         ]
 
-        def _row_data(row):
-            return {'color': row[0],
-                    'struct': row[1]}
-
         SENT = {
             'rows': [{
-                'json': _row_data(row),
-                'insertId': str(i),
-            } for i, row in enumerate(ROWS)],
+                'json': {
+                    'color': ['red', 'green'],
+                    'struct': [
+                        {'index': ['1', '2'], 'score': [3.1415, 1.414]},
+                    ],
+                },
+                'insertId': 'abcd-0',
+            }],
         }
 
-        with mock.patch('uuid.uuid4', side_effect=map(str, range(len(ROWS)))):
+        with mock.patch('uuid.uuid4', return_value='abcd'):
             errors = client.create_rows(table, ROWS)
 
         self.assertEqual(len(errors), 0)
@@ -2429,17 +2637,20 @@ class TestClient(unittest.TestCase):
         ]
 
         def _row_data(row):
+            phone = row[1]
+            if phone is not None:
+                phone = dict(phone, rank=str(phone['rank']))
             return {'full_name': row[0],
-                    'phone': row[1]}
+                    'phone': phone}
 
         SENT = {
             'rows': [{
                 'json': _row_data(row),
-                'insertId': str(i),
+                'insertId': 'abcd-%d' % (i,),
             } for i, row in enumerate(ROWS)],
         }
 
-        with mock.patch('uuid.uuid4', side_effect=map(str, range(len(ROWS)))):
+        with mock.patch('uuid.uuid4', return_value='abcd'):
             errors = client.create_rows(self.TABLE_REF, ROWS,
                                         selected_fields=[full_name, phone])
 
@@ -2517,11 +2728,11 @@ class TestClient(unittest.TestCase):
         SENT = {
             'rows': [{
                 'json': row,
-                'insertId': str(i),
+                'insertId': 'abcd-%d' % (i,),
             } for i, row in enumerate(ROWS)],
         }
 
-        with mock.patch('uuid.uuid4', side_effect=map(str, range(len(ROWS)))):
+        with mock.patch('uuid.uuid4', return_value='abcd'):
             errors = client.create_rows_json(table, ROWS)
 
         self.assertEqual(len(errors), 0)
@@ -2531,6 +2742,32 @@ class TestClient(unittest.TestCase):
         self.assertEqual(req['path'], '/%s' % PATH)
         self.assertEqual(req['data'], SENT)
 
+    def test_insert_rows_json_w_generator(self):
+        creds = _make_credentials()
+        client = self._make_one(project=self.PROJECT, credentials=creds)
+        conn = client._connection = _Connection({})
+        rows = ({'n': index} for index in range(2))
+
+        with mock.patch('uuid.uuid4', return_value='abcd'):
+            errors = client.insert_rows_json(self.TABLE_REF, rows)
+
+        self.assertEqual(errors, [])
+        self.assertEqual(conn._requested[0]['data'], {'rows': [
+            {'json': {'n': 0}, 'insertId': 'abcd-0'},
+            {'json': {'n': 1}, 'insertId': 'abcd-1'},
+        ]})
+
+    def test_insert_rows_json_w_mismatched_row_ids(self):
+        creds = _make_credentials()
+        client = self._make_one(project=self.PROJECT, credentials=creds)
+        conn = client._connection = _Connection({})
+
+        with self.assertRaises(ValueError):
+            client.insert_rows_json(
+                self.TABLE_REF, [{'n': 0}, {'n': 1}], row_ids=['a'])
+
+        self.assertEqual(conn._requested, [])
+
     def test_list_rows(self):
         import datetime
         from google.cloud._helpers import UTC
@@ -2769,6 +3006,79 @@ class TestClient(unittest.TestCase):
         with self.assertRaises(TypeError):
             client.list_rows(1)
 
+    def test_list_rows_w_parallelism(self):
+        from google.cloud.bigquery.table import Table, SchemaField
+
+        creds = _make_credentials()
+        http = object()
+        client = self._make_one(project=self.PROJECT, credentials=creds,
+                                _http=http)
+        age = SchemaField('age', 'INTEGER')
+        table = Table(self.TABLE_REF, schema=[age])
+        table._properties['numRows'] = '10'
+        page_1 = {'rows': [{'f': [{'v': '1'}]}, {'f': [{'v': '2'}]}]}
+        page_2 = {'rows': [{'f': [{'v': '3'}]}, {'f': [{'v': '4'}]}]}
+        conn = client._connection = _Connection(page_1, page_2)
+
+        iterator = client.list_rows(
+            table, selected_fields=[age], start_index=3, max_results=4,
+            parallelism=2)
+        rows = list(iterator)
+
+        self.assertEqual(len(rows), 4)
+        path = '/projects/%s/datasets/%s/tables/%s/data' % (
+            self.PROJECT, self.DS_ID, self.TABLE_ID)
+        self.assertEqual(
+            sorted([(req['path'], req['query_params']['startIndex'],
+                     req['query_params']['maxResults'],
+                     req['query_params']['selectedFields'])
+                    for req in conn._requested]),
+            [(path, 3, 2, 'age'), (path, 5, 2, 'age')])
+
+    def test_list_rows_w_page_size(self):
+        from google.cloud.bigquery.table import Table, SchemaField
+
+        creds = _make_credentials()
+        http = object()
+        client = self._make_one(project=self.PROJECT, credentials=creds,
+                                _http=http)
+        age = SchemaField('age', 'INTEGER')
+        table = Table(self.TABLE_REF, schema=[age])
+        table._properties['numRows'] = '3'
+        page = {'rows': [{'f': [{'v': '1'}]}]}
+        conn = client._connection = _Connection(page, page, page)
+
+        rows = list(client.list_rows(table, page_size=1, parallelism=1))
+
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(
+            [(req['query_params']['startIndex'],
+              req['query_params']['maxResults'])
+             for req in conn._requested],
+            [(0, 1), (1, 1), (2, 1)])
+
+    def test_list_rows_w_parallelism_errors(self):
+        from google.cloud.bigquery.table import Table, SchemaField
+
+        creds = _make_credentials()
+        http = object()
+        client = self._make_one(project=self.PROJECT, credentials=creds,
+                                _http=http)
+        age = SchemaField('age', 'INTEGER')
+
+        # table ref, or table with an unknown number of rows
+        with self.assertRaises(ValueError):
+            client.list_rows(
+                self.TABLE_REF, selected_fields=[age], parallelism=2)
+        table = Table(self.TABLE_REF, schema=[age])
+        with self.assertRaises(ValueError):
+            client.list_rows(table, parallelism=2)
+
+        # page token
+        table._properties['numRows'] = '10'
+        with self.assertRaises(ValueError):
+            client.list_rows(table, page_token='TOKEN', parallelism=2)
+
     def test_list_partitions(self):
         RESOURCE = {
             'jobReference': {
@@ -2846,6 +3156,51 @@ class Test_make_job_id(unittest.TestCase):
         self.assertEqual(job_id, 'job_id')
 
 
+class Test_row_encoder(unittest.TestCase):
+
+    def _call_fut(self, schema):
+        from google.cloud.bigquery.client import _row_encoder
+
+        return _row_encoder(schema)
+
+    def test_w_tuples_and_mappings(self):
+        from google.cloud.bigquery.schema import SchemaField
+
+        schema = [
+            SchemaField('name', 'STRING', mode='REQUIRED'),
+            SchemaField('age', 'INTEGER'),
+            SchemaField('tags', 'STRING', mode='REPEATED'),
+        ]
+        encode = self._call_fut(schema)
+
+        self.assertEqual(
+            encode(('Phred', 32, ['a'])),
+            {'name': 'Phred', 'age': '32', 'tags': ['a']})
+        self.assertEqual(
+            encode({'name': 'Bharney', 'unknown': 1}),
+            {'name': 'Bharney', 'age': None, 'tags': ()})
+        with self.assertRaises(KeyError):
+            encode({'age': 3})
+
+
+class Test_insert_ids(unittest.TestCase):
+
+    def _call_fut(self, count):
+        from google.cloud.bigquery.client import _insert_ids
+
+        return _insert_ids(count)
+
+    def test_w_count(self):
+        with mock.patch('uuid.uuid4', return_value='abcd') as uuid4:
+            ids = self._call_fut(3)
+
+        self.assertEqual(ids, ['abcd-0', 'abcd-1', 'abcd-2'])
+        uuid4.assert_called_once_with()
+
+    def test_unique_across_calls(self):
+        self.assertNotEqual(self._call_fut(1), self._call_fut(1))
+
+
 class TestClientUpload(object):
     # NOTE: This is a "partner" to `TestClient` meant to test some of the
     #       "load_table_from_file" portions of `Client`. It also uses
@@ -3073,6 +3428,167 @@ class TestClientUpload(object):
         with pytest.raises(ValueError):
             client.load_table_from_file(file_obj, self.TABLE_REF)
 
+    def _make_reading_upload_patch(self, client, uploaded):
+        """Patch ``_do_resumable_upload`` to gunzip and record the data."""
+        import zlib
+
+        response = self._make_response(
+            http_client.OK, json.dumps(self.EXPECTED_CONFIGURATION),
+            {'Content-Type': 'application/json'})
+
+        def do_upload(stream, metadata, num_retries):
+            data = zlib.decompress(stream.read(), 16 + zlib.MAX_WBITS)
+            uploaded.append((data, metadata))
+            return response
+
+        return self._make_do_upload_patch(
+            client, '_do_resumable_upload', side_effect=do_upload)
+
+    def test_load_table_from_iterable_json(self):
+        from google.cloud.bigquery.table import SchemaField
+        from google.cloud.bigquery.table import Table
+
+        client = self._make_client()
+        table = Table(self.TABLE_REF, schema=[
+            SchemaField('name', 'STRING'),
+            SchemaField('age', 'INTEGER'),
+        ])
+        rows = iter([('Phred', 32), {'name': 'Wylma', 'age': None}])
+        uploaded = []
+
+        with self._make_reading_upload_patch(client, uploaded) as do_upload:
+            job = client.load_table_from_iterable(
+                rows, table, job_id='job_id')
+
+        assert job.job_id == 'job_id'
+        assert do_upload.call_args[0][2] == 6
+        data, metadata = uploaded[0]
+        assert [json.loads(line) for line in data.splitlines()] == [
+            {'name': 'Phred', 'age': '32'},
+            {'name': 'Wylma', 'age': None},
+        ]
+        load = metadata['configuration']['load']
+        assert load['sourceFormat'] == self.SourceFormat.NEWLINE_DELIMITED_JSON
+        assert load['destinationTable'] == {
+            'projectId': 'project_id',
+            'datasetId': 'test_dataset',
+            'tableId': 'test_table',
+        }
+
+    def test_load_table_from_iterable_json_wo_schema(self):
+        client = self._make_client()
+        uploaded = []
+
+        with self._make_reading_upload_patch(client, uploaded):
+            client.load_table_from_iterable(
+                [{'a': 1}, {'a': [2]}], self.TABLE_REF)
+
+        assert uploaded[0][0] == b'{"a": 1}\n{"a": [2]}\n'
+
+    def test_load_table_from_iterable_csv(self):
+        import datetime
+        from google.cloud._helpers import UTC
+        from google.cloud.bigquery.table import SchemaField
+
+        client = self._make_client()
+        config = self._make_config()
+        config.schema = [
+            SchemaField('name', 'STRING'),
+            SchemaField('active', 'BOOLEAN'),
+            SchemaField('when', 'TIMESTAMP'),
+        ]
+        when = datetime.datetime(2018, 1, 2, 3, 4, 5, tzinfo=UTC)
+        rows = [('a,b', True, when), ('c', None, None)]
+        uploaded = []
+
+        with self._make_reading_upload_patch(client, uploaded):
+            client.load_table_from_iterable(
+                rows, self.TABLE_REF, job_config=config)
+
+        data, metadata = uploaded[0]
+        assert data == (
+            b'"a,b",true,2018-01-02 03:04:05+00:00\n'
+            b'c,,\n')
+        load = metadata['configuration']['load']
+        assert load['sourceFormat'] == self.SourceFormat.CSV
+        assert len(load['schema']['fields']) == 3
+
+    def test_load_table_from_iterable_csv_w_repeated_field(self):
+        from google.cloud.bigquery.table import SchemaField
+        from google.cloud.bigquery.table import Table
+
+        client = self._make_client()
+        table = Table(self.TABLE_REF, schema=[
+            SchemaField('tags', 'STRING', mode='REPEATED')])
+
+        with pytest.raises(ValueError):
+            client.load_table_from_iterable(
+                [], table, job_config=self._make_config())
+
+    def test_load_table_from_iterable_w_bad_format(self):
+        from google.cloud.bigquery.job import LoadJobConfig
+
+        client = self._make_client()
+        config = LoadJobConfig()
+        config.source_format = self.SourceFormat.AVRO
+
+        with pytest.raises(ValueError):
+            client.load_table_from_iterable(
+                [], self.TABLE_REF, job_config=config)
+
+    def test_load_table_from_iterable_failure(self):
+        from google.resumable_media import InvalidResponse
+        from google.cloud import exceptions
+
+        client = self._make_client()
+        response = self._make_response(
+            content='Someone is already in this spot.',
+            status_code=http_client.CONFLICT)
+        do_upload_patch = self._make_do_upload_patch(
+            client, '_do_resumable_upload',
+            side_effect=InvalidResponse(response))
+
+        with do_upload_patch, pytest.raises(exceptions.Conflict):
+            client.load_table_from_iterable([{'a': 1}], self.TABLE_REF)
+
+    def test_load_table_from_dataframe(self):
+        pandas = pytest.importorskip('pandas')
+        from google.cloud.bigquery.job import CreateDisposition
+        from google.cloud.bigquery.job import LoadJobConfig
+
+        client = self._make_client()
+        dataframe = pandas.DataFrame(
+            {'name': ['Phred', 'Wylma'], 'age': [32, 29]},
+            columns=['name', 'age'])
+        config = LoadJobConfig()
+        config.create_disposition = CreateDisposition.CREATE_NEVER
+        uploaded = []
+
+        with self._make_reading_upload_patch(client, uploaded):
+            client.load_table_from_dataframe(
+                dataframe, self.TABLE_REF, job_config=config)
+
+        data, metadata = uploaded[0]
+        assert data == b'name,age\nPhred,32\nWylma,29\n'
+        load = metadata['configuration']['load']
+        assert load['sourceFormat'] == self.SourceFormat.CSV
+        assert load['skipLeadingRows'] == '1'
+        assert load['createDisposition'] == CreateDisposition.CREATE_NEVER
+        # The caller's configuration is left unchanged.
+        assert config.source_format is None
+        assert config.skip_leading_rows is None
+
+    def test_load_table_from_dataframe_w_json_format(self):
+        from google.cloud.bigquery.job import LoadJobConfig
+
+        client = self._make_client()
+        config = LoadJobConfig()
+        config.source_format = self.SourceFormat.NEWLINE_DELIMITED_JSON
+
+        with pytest.raises(ValueError):
+            client.load_table_from_dataframe(
+                mock.Mock(), self.TABLE_REF, job_config=config)
+
     # Low-level tests
 
     @classmethod
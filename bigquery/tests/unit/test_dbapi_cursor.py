@@ -41,9 +41,21 @@ class TestCursor(unittest.TestCase):
             total_rows=total_rows,
             schema=schema,
             num_dml_affected_rows=num_dml_affected_rows)
-        mock_client.list_rows.return_value = rows
+        mock_client.list_rows.return_value = self._mock_rows(rows)
         return mock_client
 
+    @staticmethod
+    def _mock_rows(rows, page_size=None):
+        mock_rows = mock.Mock(spec=['pages'])
+        rows = rows or []
+        if page_size is None:
+            mock_rows.pages = [rows] if rows else []
+        else:
+            mock_rows.pages = [
+                rows[start:start + page_size]
+                for start in range(0, len(rows), page_size)]
+        return mock_rows
+
     def _mock_job(
             self, total_rows=0, schema=None, num_dml_affected_rows=None):
         from google.cloud.bigquery import job
@@ -161,6 +173,92 @@ class TestCursor(unittest.TestCase):
         third_page = cursor.fetchmany()
         self.assertEqual(third_page, [])
 
+    def test_fetchmany_across_pages(self):
+        from google.cloud.bigquery import dbapi
+
+        client = self._mock_client()
+        client.list_rows.return_value = self._mock_rows(
+            [(index,) for index in range(7)], page_size=3)
+        connection = dbapi.connect(client)
+        cursor = connection.cursor()
+        cursor.execute('SELECT a;')
+        cursor.arraysize = 2
+
+        self.assertEqual(cursor.fetchmany(), [(0,), (1,)])
+        self.assertEqual(cursor.fetchmany(size=3), [(2,), (3,), (4,)])
+        self.assertEqual(cursor.fetchone(), (5,))
+        self.assertEqual(cursor.fetchall(), [(6,)])
+        self.assertEqual(cursor.fetchmany(), [])
+        self.assertIsNone(cursor.fetchone())
+
+        # Pages hold a multiple of arraysize rows.
+        kwargs = client.list_rows.call_args[1]
+        self.assertEqual(kwargs['page_size'], 1000)
+
+    def test_fetch_page_size_wo_arraysize(self):
+        from google.cloud.bigquery import dbapi
+
+        client = self._mock_client(rows=[(1,)])
+        cursor = dbapi.connect(client).cursor()
+        cursor.execute('SELECT 1;')
+        cursor.fetchall()
+
+        self.assertIsNone(client.list_rows.call_args[1]['page_size'])
+
+    def test_fetch_w_plain_tuples(self):
+        from google.cloud.bigquery import dbapi
+        from google.cloud.bigquery.schema import SchemaField
+        from google.cloud.bigquery.table import RowIterator
+
+        schema = [
+            SchemaField('name', 'STRING'),
+            SchemaField('age', 'INTEGER'),
+        ]
+        api_request = mock.Mock(side_effect=[
+            {'rows': [{'f': [{'v': 'Phred'}, {'v': '32'}]}],
+             'pageToken': 'token'},
+            {'rows': [{'f': [{'v': 'Wylma'}, {'v': '29'}]}]},
+        ])
+        client = self._mock_client(schema=schema)
+        client.list_rows.return_value = RowIterator(
+            client, api_request, '/rows', schema)
+        cursor = dbapi.connect(client).cursor()
+        cursor.plain_tuples = True
+        cursor.execute('SELECT name, age;')
+
+        rows = cursor.fetchall()
+
+        self.assertEqual(rows, [('Phred', 32), ('Wylma', 29)])
+        self.assertIs(type(rows[0]), tuple)
+
+    def test_fetch_error(self):
+        from google.cloud.bigquery import dbapi
+
+        client = self._mock_client()
+        mock_rows = mock.Mock(spec=['pages'])
+        mock_rows.pages = mock.MagicMock()
+        mock_rows.pages.__iter__.side_effect = ValueError('boom')
+        client.list_rows.return_value = mock_rows
+        cursor = dbapi.connect(client).cursor()
+        cursor.execute('SELECT 1;')
+
+        with self.assertRaises(ValueError):
+            cursor.fetchone()
+
+    def test_close_stops_fetching(self):
+        from google.cloud.bigquery import dbapi
+
+        client = self._mock_client()
+        client.list_rows.return_value = self._mock_rows(
+            [(index,) for index in range(4)], page_size=1)
+        cursor = dbapi.connect(client).cursor()
+        cursor.execute('SELECT a;')
+        self.assertEqual(cursor.fetchone(), (0,))
+
+        cursor.close()
+
+        self.assertIsNone(cursor._query_data)
+
     def test_fetchall_wo_execute_raises_error(self):
         from google.cloud.bigquery import dbapi
         connection = dbapi.connect(self._mock_client())
@@ -269,6 +367,99 @@ class TestCursor(unittest.TestCase):
         self.assertIsNone(cursor.description)
         self.assertEqual(cursor.rowcount, 12)
 
+    def test_executemany_w_insert(self):
+        from google.cloud.bigquery.dbapi import connect
+
+        client = self._mock_client(rows=[], num_dml_affected_rows=3)
+        cursor = connect(client).cursor()
+        cursor.executemany(
+            'INSERT INTO dataset.table (a, b) VALUES (%s, \'100%%\');',
+            [(1,), (2,), (3,)])
+
+        self.assertEqual(client.query.call_count, 1)
+        args, kwargs = client.query.call_args
+        self.assertEqual(
+            args[0],
+            "INSERT INTO dataset.table (a, b) VALUES "
+            "(?, '100%'), (?, '100%'), (?, '100%')")
+        parameters = kwargs['job_config'].query_parameters
+        self.assertEqual([param.value for param in parameters], [1, 2, 3])
+        self.assertTrue(all(param.name is None for param in parameters))
+        self.assertEqual(cursor.rowcount, 3)
+
+    def test_executemany_w_insert_named_parameters(self):
+        from google.cloud.bigquery.dbapi import connect
+
+        client = self._mock_client(rows=[], num_dml_affected_rows=2)
+        cursor = connect(client).cursor()
+        cursor.executemany(
+            'insert dataset.table (a, b, c)\n'
+            'values (%(x)s, %(y)s, %(x)s)',
+            [{'x': 1, 'y': 'a'}, {'x': 2, 'y': 'b'}])
+
+        args, kwargs = client.query.call_args
+        self.assertEqual(
+            args[0],
+            'insert dataset.table (a, b, c)\nvalues (?, ?, ?), (?, ?, ?)')
+        parameters = kwargs['job_config'].query_parameters
+        self.assertEqual(
+            [param.value for param in parameters], [1, 'a', 1, 2, 'b', 2])
+
+    def test_executemany_w_insert_chunked(self):
+        from google.cloud.bigquery.dbapi import connect
+
+        client = self._mock_client(rows=[], num_dml_affected_rows=2)
+        cursor = connect(client).cursor()
+        patch = mock.patch(
+            'google.cloud.bigquery.dbapi.cursor._MAX_QUERY_PARAMETERS', new=4)
+        with patch:
+            cursor.executemany(
+                'INSERT INTO dataset.table (a, b) VALUES (%s, %s)',
+                [(1, 2), (3, 4), (5, 6)])
+
+        self.assertEqual(
+            [call[0][0] for call in client.query.call_args_list],
+            ['INSERT INTO dataset.table (a, b) VALUES (?, ?), (?, ?)',
+             'INSERT INTO dataset.table (a, b) VALUES (?, ?)'])
+        self.assertEqual(cursor.rowcount, 4)
+
+    def test_executemany_w_insert_chunked_by_length(self):
+        from google.cloud.bigquery.dbapi import connect
+
+        client = self._mock_client(rows=[], num_dml_affected_rows=1)
+        cursor = connect(client).cursor()
+        patch = mock.patch(
+            'google.cloud.bigquery.dbapi.cursor._MAX_QUERY_LENGTH', new=35)
+        with patch:
+            cursor.executemany(
+                'INSERT INTO t (a) VALUES (%s)', [(1,), (2,), (3,)])
+
+        self.assertEqual(
+            [call[0][0] for call in client.query.call_args_list],
+            ['INSERT INTO t (a) VALUES (?), (?)',
+             'INSERT INTO t (a) VALUES (?)'])
+
+    def test_executemany_w_insert_missing_parameter(self):
+        from google.cloud.bigquery.dbapi import connect
+        from google.cloud.bigquery.dbapi import ProgrammingError
+
+        client = self._mock_client(rows=[], num_dml_affected_rows=1)
+        cursor = connect(client).cursor()
+        with self.assertRaises(ProgrammingError):
+            cursor.executemany(
+                'INSERT INTO t (a) VALUES (%(a)s)', [{'b': 1}])
+        client.query.assert_not_called()
+
+    def test_executemany_w_insert_select(self):
+        from google.cloud.bigquery.dbapi import connect
+
+        client = self._mock_client(rows=[], num_dml_affected_rows=1)
+        cursor = connect(client).cursor()
+        cursor.executemany(
+            'INSERT INTO t (a) SELECT a FROM u WHERE b = %s', [(1,), (2,)])
+
+        self.assertEqual(client.query.call_count, 2)
+
     def test__format_operation_w_dict(self):
         from google.cloud.bigquery.dbapi import cursor
         formatted_operation = cursor._format_operation(
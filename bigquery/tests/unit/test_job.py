@@ -2393,7 +2393,55 @@ class TestQueryJob(unittest.TestCase, _Base):
         begin_request, _, query_request, reload_request = connection._requested
         self.assertEqual(begin_request['method'], 'POST')
         self.assertEqual(query_request['method'], 'GET')
+        # Rows are requested along with the query results.
+        self.assertNotIn('maxResults', query_request['query_params'])
         self.assertEqual(reload_request['method'], 'GET')
+        self.assertEqual(job._done_max_results, 0)
+
+    def test_result_reuses_first_page(self):
+        begun_resource = self._make_resource()
+        query_resource = {
+            'jobComplete': True,
+            'jobReference': {
+                'projectId': self.PROJECT,
+                'jobId': self.JOB_ID,
+            },
+            'schema': {'fields': [{'name': 'col1', 'type': 'STRING'}]},
+            'totalRows': '2',
+            'rows': [{'f': [{'v': 'abc'}]}, {'f': [{'v': 'def'}]}],
+        }
+        done_resource = copy.deepcopy(begun_resource)
+        done_resource['status'] = {'state': 'DONE'}
+        connection = _Connection(
+            begun_resource, query_resource, done_resource)
+        client = _make_client(project=self.PROJECT, connection=connection)
+        job = self._make_one(self.JOB_ID, self.QUERY, client)
+
+        rows = list(job.result())
+
+        self.assertEqual([row.col1 for row in rows], ['abc', 'def'])
+        # No request for the rows: begin, getQueryResults and reload.
+        self.assertEqual(len(connection._requested), 3)
+
+    def test_result_already_done_w_empty_result(self):
+        query_resource = {
+            'jobComplete': True,
+            'jobReference': {
+                'projectId': self.PROJECT,
+                'jobId': self.JOB_ID,
+            },
+            'totalRows': '0',
+        }
+        connection = _Connection(query_resource)
+        client = _make_client(self.PROJECT, connection=connection)
+        resource = self._make_resource(ended=True)
+        job = self._get_target_class().from_api_repr(resource, client)
+
+        result = job.result()
+
+        self.assertEqual(list(result), [])
+        self.assertEqual(len(connection._requested), 1)
+        self.assertEqual(connection._requested[0]['query_params'], {})
 
     def test_result_w_timeout(self):
         begun_resource = self._make_resource()
@@ -0,0 +1,243 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import mock
+
+
+def _make_table(schema=()):
+    from google.cloud.bigquery.dataset import DatasetReference
+    from google.cloud.bigquery.table import Table
+
+    table_ref = DatasetReference('project', 'dataset').table('table')
+    return Table(table_ref, schema=list(schema))
+
+
+class _Client(object):
+    """Fake client recording ``insert_rows_json`` calls.
+
+    ``responses`` are the errors returned (or exceptions raised) by
+    successive calls; once exhausted, every row is inserted.
+    """
+
+    def __init__(self, *responses):
+        import threading
+
+        self._responses = list(responses)
+        self._lock = threading.Lock()
+        self.calls = []
+
+    def insert_rows_json(self, table, json_rows, row_ids=None, **kwargs):
+        with self._lock:
+            self.calls.append((table, json_rows, row_ids, kwargs))
+            response = []
+            if self._responses:
+                response = self._responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+class TestStreamingInserter(unittest.TestCase):
+
+    def setUp(self):
+        patch = mock.patch(
+            'google.cloud.bigquery.streaming._RETRY_DELAY', new=0)
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery.streaming import StreamingInserter
+
+        return StreamingInserter
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    @staticmethod
+    def _settings(**kw):
+        from google.cloud.bigquery.streaming import BatchSettings
+
+        kw.setdefault('max_latency', 60.0)
+        return BatchSettings(**kw)
+
+    def test_ctor_defaults(self):
+        from google.cloud.bigquery import DEFAULT_RETRY
+        from google.cloud.bigquery.streaming import BatchSettings
+
+        table = _make_table()
+        inserter = self._make_one(mock.sentinel.client, table)
+
+        self.assertEqual(inserter.batch_settings, BatchSettings())
+        self.assertEqual(inserter.batch_settings.max_rows, 500)
+        self.assertEqual(inserter._insert_kwargs, {
+            'skip_invalid_rows': None,
+            'ignore_unknown_values': None,
+            'template_suffix': None,
+            'retry': DEFAULT_RETRY,
+        })
+        inserter.close()
+
+    def test_ctor_wrong_table_type(self):
+        with self.assertRaises(TypeError):
+            self._make_one(mock.sentinel.client, 'table')
+
+    def test_insert_batches_by_row_count(self):
+        from google.cloud.bigquery.schema import SchemaField
+
+        schema = [
+            SchemaField('name', 'STRING'),
+            SchemaField('age', 'INTEGER'),
+        ]
+        table = _make_table(schema)
+        client = _Client()
+
+        with self._make_one(client, table,
+                            batch_settings=self._settings(max_rows=2),
+                            skip_invalid_rows=True) as inserter:
+            futures = [
+                inserter.insert(('Phred', 32), row_id='id-1'),
+                inserter.insert({'name': 'Bharney', 'age': 33},
+                                row_id='id-2'),
+                inserter.insert(('Wylma', 29), row_id='id-3'),
+            ]
+
+        self.assertEqual(
+            [future.result() for future in futures],
+            ['id-1', 'id-2', 'id-3'])
+        self.assertEqual(len(client.calls), 2)
+        calls = sorted(client.calls, key=lambda call: len(call[1]))
+        self.assertIs(calls[0][0], table)
+        self.assertEqual(calls[0][1], [{'name': 'Wylma', 'age': '29'}])
+        self.assertEqual(calls[1][1], [
+            {'name': 'Phred', 'age': '32'},
+            {'name': 'Bharney', 'age': '33'},
+        ])
+        self.assertEqual(calls[1][2], ['id-1', 'id-2'])
+        self.assertTrue(calls[1][3]['skip_invalid_rows'])
+        self.assertEqual(inserter._pending, set())
+
+    def test_insert_json_batches_by_size(self):
+        client = _Client()
+        inserter = self._make_one(
+            client, _make_table(),
+            batch_settings=self._settings(max_bytes=100))
+
+        futures = [
+            inserter.insert_json({'data': 'x' * 20}) for _ in range(3)]
+        inserter.flush()
+
+        self.assertTrue(all(future.done() for future in futures))
+        self.assertEqual(len(client.calls), 3)
+        row_ids = [call[2][0] for call in client.calls]
+        self.assertEqual(len(set(row_ids)), 3)
+        inserter.close()
+
+    def test_insert_json_max_latency(self):
+        client = _Client()
+        inserter = self._make_one(
+            client, _make_table(),
+            batch_settings=self._settings(max_latency=0.01))
+
+        future = inserter.insert_json({'a': 1}, row_id='id-1')
+
+        self.assertEqual(future.result(timeout=10), 'id-1')
+        self.assertEqual(len(client.calls), 1)
+        inserter.close()
+
+    def test_retries_retryable_rows(self):
+        from google.cloud.bigquery.streaming import InsertError
+
+        invalid = [{'reason': 'invalid', 'message': 'bad'}]
+        client = _Client(
+            [
+                {'index': 0, 'errors': [{'reason': 'stopped'}]},
+                {'index': 1, 'errors': invalid},
+                {'index': 2, 'errors': [{'reason': 'backendError'}]},
+            ],
+            [{'index': 1, 'errors': [{'reason': 'backendError'}]}],
+        )
+        inserter = self._make_one(client, _make_table())
+
+        futures = [
+            inserter.insert_json({'row': index}, row_id='id-%d' % index)
+            for index in range(3)]
+        inserter.close()
+
+        self.assertEqual(futures[0].result(), 'id-0')
+        with self.assertRaises(InsertError) as exc_info:
+            futures[1].result()
+        self.assertEqual(exc_info.exception.errors, invalid)
+        self.assertEqual(futures[2].result(), 'id-2')
+        self.assertEqual(len(client.calls), 3)
+        self.assertEqual(client.calls[1][2], ['id-0', 'id-2'])
+        # The same insert ID is sent again.
+        self.assertEqual(client.calls[2][2], ['id-2'])
+
+    def test_retries_exhausted(self):
+        from google.cloud.bigquery.streaming import InsertError
+
+        errors = [{'index': 0, 'errors': [{'reason': 'backendError'}]}]
+        client = _Client(errors, errors)
+        inserter = self._make_one(client, _make_table(), max_attempts=2)
+
+        future = inserter.insert_json({'a': 1})
+        inserter.close()
+
+        with self.assertRaises(InsertError):
+            future.result()
+        self.assertEqual(len(client.calls), 2)
+
+    def test_request_error(self):
+        from google.cloud.exceptions import BadRequest
+
+        client = _Client(BadRequest('nope'))
+        inserter = self._make_one(client, _make_table())
+
+        futures = [inserter.insert_json({'a': 1}) for _ in range(2)]
+        inserter.close()
+
+        for future in futures:
+            with self.assertRaises(BadRequest):
+                future.result()
+
+    def test_insert_wo_schema(self):
+        inserter = self._make_one(mock.sentinel.client, _make_table())
+
+        with self.assertRaises(ValueError):
+            inserter.insert(('a', 1))
+        inserter.close()
+
+    def test_insert_w_selected_fields(self):
+        from google.cloud.bigquery.schema import SchemaField
+
+        client = _Client()
+        table_ref = _make_table().reference
+        inserter = self._make_one(
+            client, table_ref,
+            selected_fields=[SchemaField('flag', 'BOOLEAN')])
+
+        inserter.insert((True,))
+        inserter.close()
+
+        self.assertEqual(client.calls[0][1], [{'flag': 'true'}])
+
+    def test_insert_after_close(self):
+        inserter = self._make_one(mock.sentinel.client, _make_table())
+        inserter.close()
+
+        with self.assertRaises(ValueError):
+            inserter.insert_json({'a': 1})
@@ -1071,6 +1071,58 @@ class TestRowIterator(unittest.TestCase):
         api_request.assert_called_once_with(
             method='GET', path=path, query_params={})
 
+    def test_iterate_w_page_size(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [SchemaField('name', 'STRING', mode='REQUIRED')]
+        api_request = mock.Mock(side_effect=[
+            {'rows': [{'f': [{'v': 'Phred'}]}, {'f': [{'v': 'Bharney'}]}],
+             'pageToken': 'next-page'},
+            {'rows': [{'f': [{'v': 'Wylma'}]}]},
+        ])
+        row_iterator = RowIterator(
+            mock.sentinel.client, api_request, '/foo', schema,
+            max_results=3, page_size=2)
+
+        rows = list(row_iterator)
+
+        self.assertEqual(len(rows), 3)
+        api_request.assert_has_calls([
+            mock.call(method='GET', path='/foo',
+                      query_params={'maxResults': 2}),
+            mock.call(method='GET', path='/foo',
+                      query_params={'pageToken': 'next-page',
+                                    'maxResults': 1}),
+        ])
+
+    def test_iterate_w_first_page_response(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [SchemaField('name', 'STRING', mode='REQUIRED')]
+        first_page = {
+            'rows': [{'f': [{'v': 'Phred Phlyntstone'}]}],
+            'pageToken': 'next-page',
+            'totalRows': '2',
+        }
+        api_request = mock.Mock(return_value={
+            'rows': [{'f': [{'v': 'Bharney Rhubble'}]}],
+            'totalRows': '2',
+        })
+        row_iterator = RowIterator(
+            mock.sentinel.client, api_request, '/foo', schema,
+            first_page_response=first_page)
+
+        rows = list(row_iterator)
+
+        self.assertEqual(
+            [row.name for row in rows],
+            ['Phred Phlyntstone', 'Bharney Rhubble'])
+        self.assertEqual(row_iterator.total_rows, 2)
+        api_request.assert_called_once_with(
+            method='GET', path='/foo', query_params={'pageToken': 'next-page'})
+
     @unittest.skipIf(pandas is None, 'Requires `pandas`')
     def test_to_dataframe(self):
         from google.cloud.bigquery.table import RowIterator
@@ -1200,6 +1252,84 @@ class TestRowIterator(unittest.TestCase):
         self.assertEqual(df.complete.dtype.name, 'bool')
         self.assertEqual(df.date.dtype.name, 'object')
 
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_to_dataframe_w_multiple_pages(self):
+        from google.cloud.bigquery._helpers import _rows_from_json
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [
+            SchemaField('start_timestamp', 'TIMESTAMP'),
+            SchemaField('end_datetime', 'DATETIME'),
+            SchemaField('seconds', 'INTEGER'),
+            SchemaField('miles', 'FLOAT'),
+            SchemaField('complete', 'BOOLEAN'),
+            SchemaField('tags', 'STRING', mode='REPEATED'),
+            SchemaField('stop', 'RECORD', fields=[
+                SchemaField('name', 'STRING'),
+            ]),
+        ]
+        row_data = [
+            ['1.4338368E9', '2015-06-09T08:00:00', '420', '1.1', 'true',
+             [{'v': 'a'}], {'f': [{'v': 'x'}]}],
+            ['1.3878117E9', '2013-12-31T11:28:20.123456', '2580', 'NaN',
+             'FALSE', [], {'f': [{'v': None}]}],
+            [None, None, '2280', None, 'true', [{'v': 'b'}, {'v': 'c'}],
+             None],
+            ['1.3855653E9', '2013-11-27T15:15:00', '1', '4.4', 'false', [],
+             {'f': [{'v': 'y'}]}],
+        ]
+        rows = [{'f': [{'v': field} for field in row]} for row in row_data]
+        path = '/foo'
+        api_request = mock.Mock(side_effect=[
+            {'rows': rows[:2], 'pageToken': 'next', 'totalRows': 4},
+            {'rows': rows[2:], 'totalRows': 4},
+        ])
+        row_iterator = RowIterator(
+            mock.sentinel.client, api_request, path, schema)
+
+        df = row_iterator.to_dataframe()
+
+        self.assertEqual(api_request.call_count, 2)
+        self.assertEqual(row_iterator.total_rows, 4)
+        self.assertEqual(row_iterator.num_results, 4)
+        self.assertEqual(df.seconds.dtype.name, 'int64')
+        self.assertEqual(df.end_datetime.dtype.name, 'datetime64[ns]')
+        self.assertEqual(df.complete.dtype.name, 'bool')
+        # Same result as converting row by row.
+        expected = pandas.DataFrame(
+            [row.values() for row in _rows_from_json(rows, schema)],
+            columns=[field.name for field in schema])
+        pandas.util.testing.assert_frame_equal(df, expected)
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_to_dataframe_w_nullable_integers_and_bools(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [
+            SchemaField('seconds', 'INTEGER'),
+            SchemaField('complete', 'BOOLEAN'),
+        ]
+        rows = [
+            {'f': [{'v': '1'}, {'v': 'true'}]},
+            {'f': [{'v': None}, {'v': None}]},
+        ]
+        api_request = mock.Mock(side_effect=[
+            {'rows': rows[:1], 'pageToken': 'next'},
+            {'rows': rows[1:]},
+        ])
+        row_iterator = RowIterator(
+            mock.sentinel.client, api_request, '/foo', schema)
+
+        df = row_iterator.to_dataframe()
+
+        self.assertEqual(df.seconds.dtype.name, 'float64')
+        self.assertEqual(list(df.seconds[:1]), [1.0])
+        self.assertTrue(df.seconds.isnull()[1])
+        self.assertEqual(df.complete.dtype.name, 'object')
+        self.assertEqual(list(df.complete), [True, None])
+
     @mock.patch('google.cloud.bigquery.table.pandas', new=None)
     def test_to_dataframe_error_if_pandas_is_none(self):
         from google.cloud.bigquery.table import RowIterator
@@ -1220,3 +1350,163 @@ class TestRowIterator(unittest.TestCase):
 
         with self.assertRaises(ValueError):
             row_iterator.to_dataframe()
+
+
+class Test_split_range(unittest.TestCase):
+
+    @staticmethod
+    def _call_fut(start, stop, parts):
+        from google.cloud.bigquery.table import _split_range
+
+        return _split_range(start, stop, parts)
+
+    def test_even(self):
+        self.assertEqual(
+            self._call_fut(10, 16, 3), [(10, 12), (12, 14), (14, 16)])
+
+    def test_uneven(self):
+        self.assertEqual(
+            self._call_fut(0, 7, 3), [(0, 3), (3, 5), (5, 7)])
+
+    def test_more_parts_than_rows(self):
+        self.assertEqual(self._call_fut(0, 2, 8), [(0, 1), (1, 2)])
+
+    def test_empty(self):
+        self.assertEqual(self._call_fut(5, 5, 4), [])
+        self.assertEqual(self._call_fut(5, 3, 4), [])
+
+
+class _RowsBackend(object):
+    """Fake ``tabledata.list`` serving at most ``page_size`` rows a page."""
+
+    def __init__(self, num_rows, page_size=3, fail_at=None):
+        import threading
+
+        self._rows = [{'f': [{'v': str(index)}]} for index in range(num_rows)]
+        self._page_size = page_size
+        self._fail_at = fail_at
+        self._lock = threading.Lock()
+        self.requested = []
+
+    def api_request(self, method, path, query_params):
+        from google.cloud.exceptions import InternalServerError
+
+        with self._lock:
+            self.requested.append(dict(query_params))
+        start = query_params['startIndex']
+        if start == self._fail_at:
+            raise InternalServerError('boom')
+        stop = start + min(query_params['maxResults'], self._page_size)
+        return {'rows': self._rows[start:stop],
+                'totalRows': str(len(self._rows))}
+
+
+class Test_ParallelRowIterator(unittest.TestCase):
+
+    @staticmethod
+    def _make_one(backend, start, stop, parallelism, **kw):
+        from google.cloud.bigquery.table import _ParallelRowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [SchemaField('index', 'INTEGER')]
+        return _ParallelRowIterator(
+            mock.sentinel.client, backend.api_request, '/foo', schema,
+            start, stop, parallelism, **kw)
+
+    def test_ordered(self):
+        backend = _RowsBackend(20)
+        iterator = self._make_one(
+            backend, 2, 17, 4, extra_params={'selectedFields': 'index'})
+
+        rows = list(iterator)
+
+        self.assertEqual([row.index for row in rows], list(range(2, 17)))
+        self.assertEqual(iterator.total_rows, 20)
+        self.assertEqual(iterator.num_results, 15)
+        self.assertIsNone(iterator.next_page_token)
+        # Ranges of 4, 4, 4 and 3 rows, read in pages of up to 3 rows.
+        self.assertEqual(len(backend.requested), 7)
+        self.assertIn(
+            {'selectedFields': 'index', 'startIndex': 2, 'maxResults': 4},
+            backend.requested)
+        self.assertIn(
+            {'selectedFields': 'index', 'startIndex': 5, 'maxResults': 1},
+            backend.requested)
+
+    def test_ordered_buffers_few_pages(self):
+        import time
+
+        backend = _RowsBackend(200, page_size=1)
+        iterator = self._make_one(backend, 0, 200, 2)
+        rows_iter = iter(iterator)
+
+        self.assertEqual(six.next(rows_iter).index, 0)
+        time.sleep(0.3)
+
+        # Each stream holds at most two pages and blocks on the third,
+        # instead of reading its whole range of 100 rows.
+        second_range = [
+            params for params in backend.requested
+            if params['startIndex'] >= 100]
+        self.assertTrue(0 < len(second_range) <= 3)
+
+        # Dropping the iterator stops the streams.
+        del rows_iter, iterator
+        time.sleep(0.3)
+        num_requested = len(backend.requested)
+        time.sleep(0.3)
+        self.assertEqual(len(backend.requested), num_requested)
+        self.assertTrue(num_requested < 10)
+
+    def test_unordered(self):
+        backend = _RowsBackend(20)
+        iterator = self._make_one(backend, 0, 20, 3, ordered=False)
+
+        rows = list(iterator)
+
+        self.assertEqual(
+            sorted(row.index for row in rows), list(range(20)))
+
+    def test_pages(self):
+        backend = _RowsBackend(10, page_size=5)
+        iterator = self._make_one(backend, 0, 10, 2)
+
+        pages = list(iterator.pages)
+
+        self.assertEqual([page.num_items for page in pages], [5, 5])
+        self.assertEqual(iterator.num_results, 10)
+
+    def test_empty(self):
+        backend = _RowsBackend(10)
+        iterator = self._make_one(backend, 10, 10, 4)
+
+        self.assertEqual(list(iterator), [])
+        self.assertEqual(backend.requested, [])
+
+    def test_short_table(self):
+        # The table holds fewer rows than expected.
+        backend = _RowsBackend(4)
+        iterator = self._make_one(backend, 0, 8, 2)
+
+        self.assertEqual([row.index for row in iterator], [0, 1, 2, 3])
+
+    def test_error(self):
+        from google.cloud.exceptions import InternalServerError
+
+        backend = _RowsBackend(12, fail_at=6)
+        iterator = self._make_one(backend, 0, 12, 2)
+        rows_iter = iter(iterator)
+
+        self.assertEqual(
+            [six.next(rows_iter).index for _ in range(6)], list(range(6)))
+        with self.assertRaises(InternalServerError):
+            six.next(rows_iter)
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_to_dataframe(self):
+        backend = _RowsBackend(9)
+        iterator = self._make_one(backend, 0, 9, 3)
+
+        df = iterator.to_dataframe()
+
+        self.assertEqual(list(df['index']), list(range(9)))
@@ -14,15 +14,18 @@
 
 
 import base64
+import concurrent.futures
 import datetime
 
 import six
 
 import google.auth.credentials
+import google.auth.iam
 from google.cloud import _helpers
 
 
 NOW = datetime.datetime.utcnow  # To be replaced by tests.
+_REMOTE_SIGNING_WORKERS = 16
 
 
 def ensure_signed_credentials(credentials):
@@ -176,7 +179,125 @@ def generate_signed_url(credentials, resource, expiration,
               until expiration.
     """
     expiration = get_expiration_seconds(expiration)
+    string_to_sign = _get_string_to_sign(
+        resource, expiration, method, content_md5, content_type)
 
+    # Set the right query parameters.
+    query_params = get_signed_query_params(
+        credentials, expiration, string_to_sign)
+
+    return _build_signed_url(
+        api_access_endpoint, resource, query_params, response_type,
+        response_disposition, generation)
+
+
+def generate_signed_urls(credentials, resources, expiration,
+                         api_access_endpoint='', method='GET',
+                         content_md5=None, content_type=None,
+                         response_type=None, response_disposition=None,
+                         max_workers=None):
+    """Generate signed URLs for many resources at once.
+
+    Equivalent to calling :func:`generate_signed_url` for each resource,
+    but the expiration and the signing identity are only resolved once, so
+    that all URLs expire at the same time. Credentials which sign remotely
+    (i.e. whose signer is a :class:`google.auth.iam.Signer`, making one
+    ``signBlob`` request per signature) sign the URLs concurrently.
+
+    :type credentials: :class:`google.auth.credentials.Signing`
+    :param credentials: Credentials object with an associated private key to
+                        sign text.
+
+    :type resources: list of str
+    :param resources: Pointers to specific resources
+                      (typically, ``/bucket-name/path/to/blob.txt``).
+
+    :type expiration: :class:`int`, :class:`long`, :class:`datetime.datetime`,
+                      :class:`datetime.timedelta`
+    :param expiration: When the signed URLs should expire.
+
+    :type api_access_endpoint: str
+    :param api_access_endpoint: Optional URI base. Defaults to empty string.
+
+    :type method: str
+    :param method: The HTTP verb that will be used when requesting the URLs.
+                   See :func:`generate_signed_url`.
+
+    :type content_md5: str
+    :param content_md5: (Optional) The MD5 hash of the objects.
+
+    :type content_type: str
+    :param content_type: (Optional) The content type of the objects.
+
+    :type response_type: str
+    :param response_type: (Optional) Content type of responses to requests for
+                          the signed URLs.
+
+    :type response_disposition: str
+    :param response_disposition: (Optional) Content disposition of responses to
+                                 requests for the signed URLs.
+
+    :type max_workers: int
+    :param max_workers: (Optional) The number of signatures computed
+                        concurrently. Defaults to 1 for credentials which
+                        sign locally.
+
+    :rtype: list of str
+    :returns: Signed URLs, in the same order as ``resources``.
+    """
+    ensure_signed_credentials(credentials)
+    expiration = get_expiration_seconds(expiration)
+    service_account_name = credentials.signer_email
+    sign_bytes = credentials.sign_bytes
+
+    def sign(resource):
+        string_to_sign = _get_string_to_sign(
+            resource, expiration, method, content_md5, content_type)
+        signature = base64.b64encode(sign_bytes(string_to_sign))
+        query_params = {
+            'GoogleAccessId': service_account_name,
+            'Expires': str(expiration),
+            'Signature': signature,
+        }
+        return _build_signed_url(
+            api_access_endpoint, resource, query_params, response_type,
+            response_disposition)
+
+    if max_workers is None:
+        signer = getattr(credentials, 'signer', None)
+        if isinstance(signer, google.auth.iam.Signer):
+            max_workers = _REMOTE_SIGNING_WORKERS
+        else:
+            max_workers = 1
+
+    if max_workers > 1 and len(resources) > 1:
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            return list(executor.map(sign, resources))
+    return [sign(resource) for resource in resources]
+
+
+def _get_string_to_sign(resource, expiration, method, content_md5,
+                        content_type):
+    """Build the string signed for a V2 signed URL.
+
+    :type resource: str
+    :param resource: A pointer to a specific resource.
+
+    :type expiration: int
+    :param expiration: When the signed URL should expire, in seconds.
+
+    :type method: str
+    :param method: The HTTP verb (or ``'RESUMABLE'``).
+
+    :type content_md5: str
+    :param content_md5: The MD5 hash of the object (or :data:`None`).
+
+    :type content_type: str
+    :param content_type: The content type of the object (or :data:`None`).
+
+    :rtype: str
+    :returns: The string to be signed.
+    """
     if method == 'RESUMABLE':
         method = 'POST'
         canonicalized_resource = \
@@ -184,8 +305,7 @@ def generate_signed_url(credentials, resource, expiration,
     else:
         canonicalized_resource = '{0}'.format(resource)
 
-    # Generate the string to sign.
-    string_to_sign = '\n'.join([
+    return '\n'.join([
         method,
         content_md5 or '',
         content_type or '',
@@ -193,10 +313,33 @@ def generate_signed_url(credentials, resource, expiration,
         canonicalized_resource,
     ])
 
-    # Set the right query parameters.
-    query_params = get_signed_query_params(
-        credentials, expiration, string_to_sign)
 
+def _build_signed_url(api_access_endpoint, resource, query_params,
+                      response_type=None, response_disposition=None,
+                      generation=None):
+    """Assemble a signed URL.
+
+    :type api_access_endpoint: str
+    :param api_access_endpoint: URI base.
+
+    :type resource: str
+    :param resource: A pointer to a specific resource.
+
+    :type query_params: dict
+    :param query_params: The signed query parameters.
+
+    :type response_type: str
+    :param response_type: (Optional) Content type of responses.
+
+    :type response_disposition: str
+    :param response_disposition: (Optional) Content disposition of responses.
+
+    :type generation: str
+    :param generation: (Optional) The generation of the resource to fetch.
+
+    :rtype: str
+    :returns: The signed URL.
+    """
     if response_type is not None:
         query_params['response-content-type'] = response_type
     if response_disposition is not None:
@@ -213,13 +213,17 @@ class Batch(Connection):
         _, body = payload.split('\n\n', 1)
         return dict(multi._headers), body
 
-    def _finish_futures(self, responses):
+    def _finish_futures(self, responses, raise_exception=True):
         """Apply all the batch responses to the futures created.
 
         :type responses: list of (headers, payload) tuples.
         :param responses: List of headers and payloads from each response in
                           the batch.
 
+        :type raise_exception: bool
+        :param raise_exception: (Optional) Raise an exception for the first
+                                failed response. Defaults to :data:`True`.
+
         :raises: :class:`ValueError` if no requests have been deferred.
         """
         # If a bad status occurs, we track it, but don't raise an exception
@@ -239,12 +243,18 @@ class Batch(Connection):
                 except ValueError:
                     target_object._properties = subresponse.content
 
-        if exception_args is not None:
+        if exception_args is not None and raise_exception:
             raise exceptions.from_http_response(exception_args)
 
-    def finish(self):
+    def finish(self, raise_exception=True):
         """Submit a single `multipart/mixed` request with deferred requests.
 
+        :type raise_exception: bool
+        :param raise_exception: (Optional) Raise an exception if any deferred
+                                request failed (after populating the other
+                                futures). Pass :data:`False` to check the
+                                status of each response instead.
+
         :rtype: list of tuples
         :returns: one ``(headers, payload)`` tuple per deferred request.
         """
@@ -258,7 +268,7 @@ class Batch(Connection):
         response = self._client._base_connection._make_request(
             'POST', url, data=body, headers=headers)
         responses = list(_unpack_batch_response(response))
-        self._finish_futures(responses)
+        self._finish_futures(responses, raise_exception=raise_exception)
         return responses
 
     def current(self):
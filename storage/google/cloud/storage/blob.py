@@ -28,12 +28,17 @@
 import base64
 import copy
 import hashlib
+import io
 from io import BytesIO
+import json
 import mimetypes
 import os
 import time
 import warnings
+import zlib
 
+import six
+from six.moves import http_client
 from six.moves.urllib.parse import parse_qsl
 from six.moves.urllib.parse import quote
 from six.moves.urllib.parse import urlencode
@@ -56,6 +61,14 @@ from google.cloud.storage._helpers import _PropertyMixin
 from google.cloud.storage._helpers import _scalar_property
 from google.cloud.storage._signing import generate_signed_url
 from google.cloud.storage.acl import ObjectACL
+from google.cloud.storage.cache import _get_metadata_cache
+from google.cloud.storage.cache import _invalidate
+from google.cloud.storage.checksum import Checksums
+from google.cloud.storage.checksum import _ChecksummingReader
+from google.cloud.storage.checksum import _ChecksummingWriter
+from google.cloud.storage.fileio import BlobReader
+from google.cloud.storage.fileio import BlobWriter
+from google.cloud.storage.fileio import _TextBlobWriter
 
 
 _API_ACCESS_ENDPOINT = 'https://storage.googleapis.com'
@@ -89,9 +102,26 @@ _NUM_RETRIES_MESSAGE = (
     'retried. Subsequent retries will be sent after waiting 1, 2, 4, 8, etc. '
     'seconds (exponential backoff) until 10 minutes of wait time have '
     'elapsed. At that point, there will be no more attempts to retry.')
+_DEFAULT_RANGE_CHUNK_SIZE = 10 * 1024 * 1024  # 10 MB
+_DEFAULT_SESSION_CHUNK_SIZE = 10 * 1024 * 1024  # 10 MB
 _READ_LESS_THAN_SIZE = (
     'Size {:d} was specified but the file-like object only had '
     '{:d} bytes remaining.')
+_COMPLETED_STATUSES = (http_client.OK, http_client.CREATED)
+# NOTE: ``os.replace`` (which also overwrites on Windows) is Python 3 only.
+_replace_file = getattr(os, 'replace', os.rename)
+_BUFFER_TOO_SMALL = (
+    'Buffer of {:d} bytes is too small to hold {:d} bytes.')
+_INITIAL_ADAPTIVE_CHUNK_SIZE = 1024 * 1024  # 1 MB
+_MIN_ADAPTIVE_CHUNK_SIZE = 256 * 1024  # 256 KB
+_MAX_ADAPTIVE_CHUNK_SIZE = 128 * 1024 * 1024  # 128 MB
+_ADAPTIVE_CHUNK_SECONDS = 5.0
+"""Time an adaptively sized chunk should take to send."""
+_monotonic = getattr(time, 'monotonic', time.time)
+_GZIP_MAGIC = b'\x1f\x8b'
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+"""Window bits selecting the gzip container in :mod:`zlib`."""
+_GZIP_READ_BLOCK_SIZE = 1024 * 1024  # 1 MB
 
 
 class Blob(_PropertyMixin):
@@ -123,6 +153,18 @@ class Blob(_PropertyMixin):
     _CHUNK_SIZE_MULTIPLE = 256 * 1024
     """Number (256 KB, in bytes) that must divide the chunk size."""
 
+    adaptive_chunk_size = False
+    """Adapt the chunk size of resumable uploads to the link speed.
+
+    When :data:`True`, uploads are resumable (unless their size is known
+    to fit in a single chunk) and start with :attr:`chunk_size` (or 1 MB)
+    chunks. After each chunk, the size is adjusted so that the next one
+    takes about five seconds at the throughput just measured: fast links
+    get large chunks and few requests, while a slow or flaky link keeps
+    the data re-sent after an error small. Chunks stay between 256 KB and
+    128 MB.
+    """
+
     _STORAGE_CLASSES = (
         'NEARLINE',
         'MULTI_REGIONAL',
@@ -154,6 +196,7 @@ class Blob(_PropertyMixin):
         self.bucket = bucket
         self._acl = ObjectACL(self)
         self._encryption_key = encryption_key
+        self._transfer_checksums = None
 
     @property
     def chunk_size(self):
@@ -179,6 +222,30 @@ class Blob(_PropertyMixin):
                 self._CHUNK_SIZE_MULTIPLE,))
         self._chunk_size = value
 
+    @property
+    def transfer_checksums(self):
+        """Checksums of the data moved by the most recent transfer.
+
+        Computed incrementally while the bytes are uploaded or downloaded
+        by this instance, so they can be compared to :attr:`md5_hash` and
+        :attr:`crc32c` without reading the data again:
+
+        .. code-block:: python
+
+           blob.upload_from_filename('local.bin')
+           assert blob.transfer_checksums.matches(blob)
+
+        Downloads only compute an MD5 hash which can be compared, i.e.
+        for whole blobs which have one; a download made in a single
+        request reports the MD5 hash already checked while receiving it.
+
+        :rtype: :class:`~google.cloud.storage.checksum.Checksums` or
+                ``NoneType``
+        :returns: The checksums, or :data:`None` if no transfer has
+                  completed.
+        """
+        return self._transfer_checksums
+
     @staticmethod
     def path_helper(bucket_path, blob_name):
         """Relative URL path for a blob.
@@ -342,9 +409,14 @@ class Blob(_PropertyMixin):
                        to the ``client`` stored on the blob's bucket.
 
         :rtype: bool
-        :returns: True if the blob exists in Cloud Storage.
+        :returns: True if the blob exists in Cloud Storage (or is in the
+                  client's :attr:`~.Client.metadata_cache`).
         """
         client = self._require_client(client)
+        cache = _get_metadata_cache(client)
+        if cache is not None and cache.get(self.path) is not None:
+            return True
+
         # We only need the status code (200 or not) so we seek to
         # minimize the returned payload.
         query_params = {'fields': 'name'}
@@ -365,6 +437,77 @@ class Blob(_PropertyMixin):
         except NotFound:
             return False
 
+    def reload(self, client=None):
+        """Reload properties from Cloud Storage.
+
+        If the client has a :attr:`~.Client.metadata_cache`, properties
+        cached there are used instead, and freshly loaded ones are cached.
+
+        If :attr:`user_project` is set on the bucket, bills the API request
+        to that project.
+
+        :type client: :class:`~google.cloud.storage.client.Client` or
+                      ``NoneType``
+        :param client: Optional. The client to use.  If not passed, falls back
+                       to the ``client`` stored on the blob's bucket.
+        """
+        client = self._require_client(client)
+        cache = _get_metadata_cache(client)
+        if cache is not None:
+            properties = cache.get(self.path)
+            if properties is not None:
+                self._set_properties(properties)
+                return
+
+        super(Blob, self).reload(client=client)
+        if cache is not None:
+            cache.put(self.path, self._properties)
+
+    def patch(self, client=None):
+        """Sends all changed properties in a PATCH request.
+
+        Updates the ``_properties`` with the response from the backend.
+
+        If :attr:`user_project` is set on the bucket, bills the API request
+        to that project.
+
+        :type client: :class:`~google.cloud.storage.client.Client` or
+                      ``NoneType``
+        :param client: Optional. The client to use.  If not passed, falls back
+                       to the ``client`` stored on the blob's bucket.
+        """
+        client = self._require_client(client)
+        super(Blob, self).patch(client=client)
+        self._invalidate_cached(client)
+
+    def update(self, client=None):
+        """Sends all properties in a PUT request.
+
+        Updates the ``_properties`` with the response from the backend.
+
+        If :attr:`user_project` is set on the bucket, bills the API request
+        to that project.
+
+        :type client: :class:`~google.cloud.storage.client.Client` or
+                      ``NoneType``
+        :param client: Optional. The client to use.  If not passed, falls back
+                       to the ``client`` stored on the blob's bucket.
+        """
+        client = self._require_client(client)
+        super(Blob, self).update(client=client)
+        self._invalidate_cached(client)
+
+    def _invalidate_cached(self, client):
+        """Drop this blob from the client's metadata cache, if it has one.
+
+        :type client: :class:`~google.cloud.storage.client.Client` or
+                      ``NoneType``
+        :param client: The client used for the write (or :data:`None`).
+        """
+        client = self._require_client(client)
+        if getattr(client, 'metadata_cache', None) is not None:
+            _invalidate(client, self.path)
+
     def delete(self, client=None):
         """Deletes a blob from Cloud Storage.
 
@@ -423,7 +566,8 @@ class Blob(_PropertyMixin):
 
         return _add_query_parameters(base_url, name_value_pairs)
 
-    def _do_download(self, transport, file_obj, download_url, headers):
+    def _do_download(self, transport, file_obj, download_url, headers,
+                     start=None, end=None):
         """Perform a download without any error handling.
 
         This is intended to be called by :meth:`download_to_file` so it can
@@ -442,18 +586,118 @@ class Blob(_PropertyMixin):
 
         :type headers: dict
         :param headers: Optional headers to be sent with the request(s).
+
+        :type start: int
+        :param start: (Optional) The first byte in a range to be downloaded.
+
+        :type end: int
+        :param end: (Optional) The last byte in a range to be downloaded.
+
+        :rtype: :class:`~requests.Response` or ``NoneType``
+        :returns: The response of a download made in a single request,
+                  whose MD5 hash (if any) was checked by ``Download``.
         """
-        if self.chunk_size is None:
+        if self.chunk_size is None and start is None and end is None:
             download = Download(download_url, stream=file_obj, headers=headers)
-            download.consume(transport)
+            return download.consume(transport)
         else:
+            # NOTE: Ranges always use a chunked download: the MD5 hash sent
+            #       by the back-end describes the whole object, so the
+            #       validation done by ``Download`` would reject a slice.
+            if self.size == 0:
+                # No range can be satisfied: there is nothing to download.
+                return None
+            chunk_size = self.chunk_size
+            if start is None:
+                start = 0
+            if chunk_size is None:
+                if end is None:
+                    chunk_size = _DEFAULT_RANGE_CHUNK_SIZE
+                else:
+                    chunk_size = end - start + 1
             download = ChunkedDownload(
-                download_url, self.chunk_size, file_obj, headers=headers)
+                download_url, chunk_size, file_obj, start=start, end=end,
+                headers=headers)
+
+            try:
+                while not download.finished:
+                    download.consume_next_chunk(transport)
+            except resumable_media.InvalidResponse as exc:
+                # Only an empty blob rejects a range starting at 0.
+                status = exc.response.status_code
+                if (start != 0 or download.bytes_downloaded or
+                        status != http_client.REQUESTED_RANGE_NOT_SATISFIABLE):
+                    raise
+
+    def _download_range(self, file_obj, start, end, client=None):
+        """Download a range of bytes of this blob into a file-like object.
+
+        Used by :class:`~google.cloud.storage.fileio.BlobReader` to fetch
+        individual chunks.
+
+        :type file_obj: file
+        :param file_obj: A file handle to which to write the blob's data.
+
+        :type start: int
+        :param start: The first byte in the range to be downloaded.
+
+        :type end: int
+        :param end: The last byte in the range to be downloaded.
+
+        :type client: :class:`~google.cloud.storage.client.Client` or
+                      ``NoneType``
+        :param client: Optional. The client to use.  If not passed, falls back
+                       to the ``client`` stored on the blob's bucket.
+
+        :raises: :class:`google.cloud.exceptions.NotFound`
+        """
+        download_url = self._get_download_url()
+        headers = _get_encryption_headers(self._encryption_key)
+
+        transport = self._get_transport(client)
+        try:
+            self._do_download(
+                transport, file_obj, download_url, headers,
+                start=start, end=end)
+        except resumable_media.InvalidResponse as exc:
+            _raise_from_invalid_response(exc)
 
-            while not download.finished:
-                download.consume_next_chunk(transport)
+    def _resolve_range(self, start, end, client):
+        """Convert a (possibly negative) ``start`` into an absolute offset.
 
-    def download_to_file(self, file_obj, client=None):
+        :type start: int
+        :param start: The first byte to be downloaded (or :data:`None`). A
+                      negative value counts back from the end of the blob.
+
+        :type end: int
+        :param end: The last byte to be downloaded (or :data:`None`).
+
+        :type client: :class:`~google.cloud.storage.client.Client` or
+                      ``NoneType``
+        :param client: The client used to load :attr:`size` if needed.
+
+        :rtype: tuple
+        :returns: The ``(start, end)`` pair to be requested.
+        :raises: :exc:`ValueError` if ``end`` is combined with a negative
+                 ``start``, or precedes ``start``.
+        """
+        if start is not None and start < 0:
+            if end is not None:
+                raise ValueError(
+                    'A negative start cannot be combined with an end.')
+            if self.size is None:
+                self.reload(client=client)
+            start = max(self.size + start, 0)
+
+        if end is not None and end < (start or 0):
+            raise ValueError(
+                'The end of a range ({}) cannot precede its start ({}).'
+                .format(end, start or 0))
+
+        return start, end
+
+    def download_to_file(self, file_obj, client=None, start=None, end=None,
+                         decompress=False):
         """Download the contents of this blob into a file-like object.
 
         .. note::
@@ -472,9 +716,27 @@ class Blob(_PropertyMixin):
         The ``encryption_key`` should be a str or bytes with a length of at
         least 32.
 
+        Pass ``start`` and / or ``end`` to download only **part** of the
+        blob, e.g. the footer of a Parquet file or the tail of a log:
+
+        .. code-block:: python
+
+           blob.download_to_file(file_obj, start=-8)  # The last 8 bytes.
+
+        Ranges address the bytes as stored: a blob with a ``gzip`` content
+        encoding is then downloaded without being decompressed, and
+        :attr:`transfer_checksums` describes the downloaded slice only
+        (without an MD5 hash).
+
+        Pass ``decompress=True`` to inflate gzip data (e.g. a ``.gz`` file,
+        or a blob uploaded with ``compress=True`` and downloaded in chunks)
+        while it is received, so that ``file_obj`` receives the plain bytes
+        without a second pass. Data which turns out not to be compressed
+        (e.g. because the transport already inflated it) is written
+        unchanged.
+
         For more fine-grained control over the download process, check out
-        `google-resumable-media`_. For example, this library allows
-        downloading **parts** of a blob rather than the whole thing.
+        `google-resumable-media`_.
 
         If :attr:`user_project` is set on the bucket, bills the API request
         to that project.
@@ -487,21 +749,66 @@ class Blob(_PropertyMixin):
         :param client: Optional. The client to use.  If not passed, falls back
                        to the ``client`` stored on the blob's bucket.
 
-        :raises: :class:`google.cloud.exceptions.NotFound`
+        :type start: int
+        :param start: (Optional) The offset of the first byte to download.
+                      A negative value downloads the last ``-start`` bytes
+                      (loading :attr:`size` first if needed).
+
+        :type end: int
+        :param end: (Optional) The offset of the last byte to download
+                    (inclusive). Defaults to the end of the blob.
+
+        :type decompress: bool
+        :param decompress: (Optional) Inflate gzip-compressed data while
+                           downloading. Cannot be combined with a range.
+
+        :raises: :exc:`ValueError` if the range is invalid, or if the gzip
+                 data is truncated or corrupt;
+                 :class:`google.cloud.exceptions.NotFound`
         """
+        if decompress and (start or end is not None):
+            raise ValueError('Cannot decompress part of a blob.')
+
+        start, end = self._resolve_range(start, end, client)
         download_url = self._get_download_url()
         headers = _get_encryption_headers(self._encryption_key)
-        headers['accept-encoding'] = 'gzip'
+        if start is None and end is None:
+            headers['accept-encoding'] = 'gzip'
 
         transport = self._get_transport(client)
+        # Only compute the MD5 hash if it can be compared, and has not
+        # already been checked by ``Download``: the hash of part of a blob,
+        # or of a blob which has none (e.g. a composite object), cannot be.
+        single_request = (
+            self.chunk_size is None and start is None and end is None)
+        whole_blob = not start and end is None
+        has_md5 = self.md5_hash is not None or self.crc32c is None
+        checksums = Checksums(
+            md5_enabled=whole_blob and has_md5 and not single_request)
+        gunzip = None
+        if decompress:
+            file_obj = gunzip = _GunzipWriter(file_obj)
+        file_obj = _ChecksummingWriter(file_obj, checksums)
         try:
-            self._do_download(transport, file_obj, download_url, headers)
+            response = self._do_download(
+                transport, file_obj, download_url, headers,
+                start=start, end=end)
         except resumable_media.InvalidResponse as exc:
             _raise_from_invalid_response(exc)
 
-    def download_to_filename(self, filename, client=None):
+        if response is not None:
+            checksums.set_md5(_get_md5_header(response))
+        if gunzip is not None:
+            gunzip.finish()
+        self._transfer_checksums = checksums
+
+    def download_to_filename(self, filename, client=None, start=None,
+                             end=None, decompress=False):
         """Download the contents of this blob into a named file.
 
+        Only a complete download sets the file's modification time to the
+        blob's :attr:`updated` timestamp.
+
         If :attr:`user_project` is set on the bucket, bills the API request
         to that project.
 
@@ -513,22 +820,41 @@ class Blob(_PropertyMixin):
         :param client: Optional. The client to use.  If not passed, falls back
                        to the ``client`` stored on the blob's bucket.
 
-        :raises: :class:`google.cloud.exceptions.NotFound`
+        :type start: int
+        :param start: (Optional) The offset of the first byte to download.
+                      See :meth:`download_to_file`.
+
+        :type end: int
+        :param end: (Optional) The offset of the last byte to download
+                    (inclusive).
+
+        :type decompress: bool
+        :param decompress: (Optional) Inflate gzip-compressed data while
+                           downloading. See :meth:`download_to_file`.
+
+        :raises: :exc:`ValueError` if the range is invalid;
+                 :class:`google.cloud.exceptions.NotFound`
         """
         try:
             with open(filename, 'wb') as file_obj:
-                self.download_to_file(file_obj, client=client)
+                self.download_to_file(
+                    file_obj, client=client, start=start, end=end,
+                    decompress=decompress)
         except resumable_media.DataCorruption as exc:
             # Delete the corrupt downloaded file.
             os.remove(filename)
             raise
 
+        if start is not None or end is not None:
+            return
+
         updated = self.updated
         if updated is not None:
             mtime = time.mktime(updated.timetuple())
             os.utime(file_obj.name, (mtime, mtime))
 
-    def download_as_string(self, client=None):
+    def download_as_string(self, client=None, start=None, end=None,
+                           decompress=False):
         """Download the contents of this blob as a string.
 
         If :attr:`user_project` is set on the bucket, bills the API request
@@ -539,14 +865,183 @@ class Blob(_PropertyMixin):
         :param client: Optional. The client to use.  If not passed, falls back
                        to the ``client`` stored on the blob's bucket.
 
+        :type start: int
+        :param start: (Optional) The offset of the first byte to download.
+                      See :meth:`download_to_file`.
+
+        :type end: int
+        :param end: (Optional) The offset of the last byte to download
+                    (inclusive).
+
+        :type decompress: bool
+        :param decompress: (Optional) Inflate gzip-compressed data while
+                           downloading. See :meth:`download_to_file`.
+
         :rtype: bytes
-        :returns: The data stored in this blob.
-        :raises: :class:`google.cloud.exceptions.NotFound`
+        :returns: The data stored in this blob (or in the requested range).
+        :raises: :exc:`ValueError` if the range is invalid;
+                 :class:`google.cloud.exceptions.NotFound`
         """
         string_buffer = BytesIO()
-        self.download_to_file(string_buffer, client=client)
+        self.download_to_file(
+            string_buffer, client=client, start=start, end=end,
+            decompress=decompress)
         return string_buffer.getvalue()
 
+    def download_into(self, buffer, client=None):
+        """Download the contents of this blob into a caller-owned buffer.
+
+        The downloaded bytes are written in place, starting at the
+        beginning of ``buffer``, so no intermediate copy of the whole blob
+        is made. This allows blobs to be read straight into, e.g., a
+        pre-allocated NumPy array or an ``mmap``-ed file.
+
+        If :attr:`size` is already loaded, ``buffer`` is checked up front;
+        otherwise an error is raised only once the data overflows it.
+
+        If :attr:`user_project` is set on the bucket, bills the API request
+        to that project.
+
+        :type buffer: bytearray, :class:`memoryview` or :class:`mmap.mmap`
+        :param buffer: A writable object supporting the buffer protocol.
+                       Its capacity is counted in bytes, whatever the type
+                       of its items.
+
+        :type client: :class:`~google.cloud.storage.client.Client` or
+                      ``NoneType``
+        :param client: Optional. The client to use.  If not passed, falls back
+                       to the ``client`` stored on the blob's bucket.
+
+        :rtype: int
+        :returns: The number of bytes written to ``buffer``.
+        :raises: :exc:`ValueError` if ``buffer`` is read-only or too small;
+                 :class:`google.cloud.exceptions.NotFound`
+        """
+        writer = _BufferWriter(buffer)
+        if self.size is not None and self.size > writer.capacity:
+            raise ValueError(_BUFFER_TOO_SMALL.format(
+                writer.capacity, self.size))
+
+        self.download_to_file(writer, client=client)
+        return writer.position
+
+    def download_as_memoryview(self, client=None):
+        """Download the contents of this blob into a new buffer.
+
+        Unlike :meth:`download_as_string`, the data is written directly
+        into a buffer allocated from :attr:`size`, so peak memory use is
+        not doubled by copying the result out of a ``BytesIO``. The
+        returned view can be passed to, e.g., ``numpy.frombuffer``
+        without further copies.
+
+        .. note::
+
+           If :attr:`size` is not yet loaded, makes an additional API
+           request to load it. Blobs stored with a ``gzip`` content
+           encoding are decompressed while downloading, so their size
+           is not known in advance: they fall back to
+           :meth:`download_as_string`.
+
+        If :attr:`user_project` is set on the bucket, bills the API request
+        to that project.
+
+        :type client: :class:`~google.cloud.storage.client.Client` or
+                      ``NoneType``
+        :param client: Optional. The client to use.  If not passed, falls back
+                       to the ``client`` stored on the blob's bucket.
+
+        :rtype: :class:`memoryview`
+        :returns: A view over the data stored in this blob.
+        :raises: :class:`google.cloud.exceptions.NotFound`
+        """
+        if self.size is None:
+            self.reload(client=client)
+
+        if self.content_encoding == 'gzip':
+            return memoryview(self.download_as_string(client=client))
+
+        buffer = bytearray(self.size)
+        written = self.download_into(buffer, client=client)
+        return memoryview(buffer)[:written]
+
+    def open(self, mode='r', chunk_size=None, encoding=None, errors=None,
+             newline=None, client=None):
+        """Create a file-like object for reading or writing this blob.
+
+        In binary read mode (``'rb'``), returns a
+        :class:`~google.cloud.storage.fileio.BlobReader`, which fetches the
+        blob in ranged chunks and supports ``seek`` / ``tell``. Such readers
+        can be passed directly to parsers such as :mod:`csv` or :mod:`gzip`,
+        without staging the blob on disk.
+
+        In binary write mode (``'wb'``), returns a
+        :class:`~google.cloud.storage.fileio.BlobWriter`, which sends the
+        written bytes through a resumable upload as full chunks become
+        available, so that streams of unknown size can be uploaded with
+        constant memory. The blob is created when the writer is closed.
+
+        In text modes (``'r'`` and ``'w'``), the reader or writer is wrapped
+        in an :class:`io.TextIOWrapper`. As with a binary writer, an
+        exception leaving a ``with`` block abandons the upload.
+
+        If :attr:`user_project` is set on the bucket, bills the API requests
+        to that project.
+
+        :type mode: str
+        :param mode: (Optional) One of ``'r'``, ``'rb'``, ``'w'`` or ``'wb'``.
+                     Defaults to ``'r'``.
+
+        :type chunk_size: int
+        :param chunk_size: (Optional) The number of bytes sent or fetched per
+                           request. Defaults to the blob's :attr:`chunk_size`,
+                           if set, else to 10 MB. When writing, it must be a
+                           multiple of 256 KB.
+
+        :type encoding: str
+        :param encoding: (Optional) Text modes only: passed to
+                         :class:`io.TextIOWrapper`.
+
+        :type errors: str
+        :param errors: (Optional) Text modes only: passed to
+                       :class:`io.TextIOWrapper`.
+
+        :type newline: str
+        :param newline: (Optional) Text modes only: passed to
+                        :class:`io.TextIOWrapper`.
+
+        :type client: :class:`~google.cloud.storage.client.Client` or
+                      ``NoneType``
+        :param client: Optional. The client to use.  If not passed, falls back
+                       to the ``client`` stored on the blob's bucket.
+
+        :rtype: :class:`~google.cloud.storage.fileio.BlobReader`,
+                :class:`~google.cloud.storage.fileio.BlobWriter` or
+                :class:`io.TextIOWrapper`
+        :returns: A file-like object for the blob.
+        :raises: :exc:`ValueError` if ``mode`` is not supported, or if text
+                 options are passed in a binary mode.
+        """
+        if mode in ('rb', 'wb'):
+            if (encoding, errors, newline) != (None, None, None):
+                raise ValueError(
+                    "'encoding', 'errors' and 'newline' are not supported "
+                    "in binary mode.")
+
+        if mode in ('r', 'rb'):
+            raw = BlobReader(self, chunk_size=chunk_size, client=client)
+        elif mode in ('w', 'wb'):
+            raw = BlobWriter(self, chunk_size=chunk_size, client=client)
+        else:
+            raise ValueError('Unsupported mode: %r' % (mode,))
+
+        if mode in ('rb', 'wb'):
+            return raw
+        if mode == 'w':
+            return _TextBlobWriter(
+                raw, encoding=encoding, errors=errors, newline=newline)
+        return io.TextIOWrapper(
+            raw, encoding=encoding, errors=errors, newline=newline)
+
     def _get_content_type(self, content_type, filename=None):
         """Determine the content type from the current object.
 
@@ -696,9 +1191,12 @@ class Blob(_PropertyMixin):
             upload._retry_strategy = resumable_media.RetryStrategy(
                 max_retries=num_retries)
 
+        checksums = Checksums()
+        checksums.update(data)
         response = upload.transmit(
             transport, data, object_metadata, content_type)
 
+        self._transfer_checksums = checksums
         return response
 
     def _initiate_resumable_upload(self, client, stream, content_type,
@@ -781,10 +1279,12 @@ class Blob(_PropertyMixin):
         return upload, transport
 
     def _do_resumable_upload(self, client, stream, content_type,
-                             size, num_retries):
+                             size, num_retries, session_file=None):
         """Perform a resumable upload.
 
-        Assumes ``chunk_size`` is not :data:`None` on the current blob.
+        Assumes ``chunk_size`` is not :data:`None` on the current blob,
+        unless ``session_file`` is passed or :attr:`adaptive_chunk_size` is
+        set.
 
         The content type of the upload will be determined in order
         of precedence:
@@ -812,18 +1312,172 @@ class Blob(_PropertyMixin):
         :param num_retries: Number of upload retries. (Deprecated: This
                             argument will be removed in a future release.)
 
+        :type session_file: str
+        :param session_file: (Optional) Path of a local file in which the
+                             upload session is recorded after every chunk,
+                             so that the upload can be continued with
+                             :meth:`resume_upload`.
+
         :rtype: :class:`~requests.Response`
         :returns: The "200 OK" response object returned after the final chunk
                   is uploaded.
         """
+        chunk_size = self.chunk_size
+        if chunk_size is None:
+            if self.adaptive_chunk_size:
+                chunk_size = _INITIAL_ADAPTIVE_CHUNK_SIZE
+            elif session_file is not None:
+                chunk_size = _DEFAULT_SESSION_CHUNK_SIZE
+
+        checksums = Checksums()
+        stream = _ChecksummingReader(stream, checksums)
         upload, transport = self._initiate_resumable_upload(
-            client, stream, content_type, size, num_retries)
+            client, stream, content_type, size, num_retries,
+            chunk_size=chunk_size)
+
+        response = self._finish_resumable_upload(
+            upload, transport, session_file)
+
+        if stream.complete:
+            self._transfer_checksums = checksums
+        return response
+
+    def _finish_resumable_upload(self, upload, transport, session_file=None):
+        """Send the remaining chunks of a resumable upload.
+
+        :type upload: :class:`~google.resumable_media.requests.ResumableUpload`
+        :param upload: An initiated (or recovered) upload.
+
+        :type transport:
+            :class:`~google.auth.transport.requests.AuthorizedSession`
+        :param transport: The transport used by the upload.
+
+        :type session_file: str
+        :param session_file: (Optional) Path of the file recording the upload
+                             session. It is updated after each chunk and
+                             removed once the upload is complete.
+
+        :rtype: :class:`~requests.Response`
+        :returns: The response to the final chunk.
+        """
+        sizer = None
+        if self.adaptive_chunk_size:
+            sizer = _AdaptiveChunkSizer(upload.chunk_size)
 
         while not upload.finished:
+            if session_file is not None:
+                _save_session_state(session_file, self, upload)
+            bytes_before = upload.bytes_uploaded
+            started = _monotonic()
             response = upload.transmit_next_chunk(transport)
-
+            if sizer is not None:
+                chunk_size = sizer.update(
+                    upload.bytes_uploaded - bytes_before,
+                    _monotonic() - started)
+                if not _set_chunk_size(upload, chunk_size):
+                    # The library no longer lets us resize: keep its size.
+                    sizer = None
+
+        if session_file is not None:
+            os.remove(session_file)
         return response
 
+    def resume_upload(self, file_obj, session_file, client=None):
+        """Continue an upload started with a ``session_file``.
+
+        Uploads started by :meth:`upload_from_file` or
+        :meth:`upload_from_filename` with a ``session_file`` record their
+        resumable session in that file. If the process dies before the
+        upload completes, this method asks the server how many bytes it
+        committed and sends the rest of ``file_obj`` from there, instead of
+        starting over from the first byte.
+
+        .. note::
+
+           Upload sessions expire one week after they are started.
+
+        If :attr:`user_project` is set on the bucket, bills the API request
+        to that project.
+
+        :type file_obj: file
+        :param file_obj: A seekable file handle open for reading, holding the
+                         same data as the interrupted upload.
+
+        :type session_file: str
+        :param session_file: The path of the session file written by the
+                             interrupted upload. It is removed once the
+                             upload completes.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: (Optional) The client to use.  If not passed, falls back
+                       to the ``client`` stored on the blob's bucket.
+
+        :raises: :exc:`ValueError` if the session file belongs to another
+                 blob; :class:`~google.cloud.exceptions.GoogleCloudError`
+                 if the upload response returns an error status (e.g.
+                 :class:`~google.cloud.exceptions.NotFound` if the session
+                 expired).
+        """
+        with open(session_file, 'r') as state_file:
+            state = json.load(state_file)
+        if (state['bucket'], state['name']) != (self.bucket.name, self.name):
+            raise ValueError(
+                'Session file is for another blob', session_file,
+                state['bucket'], state['name'])
+
+        transport = self._get_transport(client)
+        headers, _, content_type = self._get_upload_arguments(
+            state['content_type'])
+        upload = ResumableUpload(
+            state['resumable_url'], state['chunk_size'], headers=headers)
+        # NOTE: ``ResumableUpload`` has no public API to attach to an
+        #       existing session, so restore the state ``initiate()`` sets.
+        #       These private fields are why ``setup.py`` caps the
+        #       ``google-resumable-media`` version.
+        upload._stream = file_obj
+        upload._content_type = content_type
+        upload._total_bytes = state['total_bytes']
+        upload._resumable_url = state['resumable_url']
+        # ``recover()`` refuses to run on a valid upload. Like one whose
+        # request failed, an upload attached to an interrupted session does
+        # not know how many bytes the server committed: marking it invalid
+        # makes ``recover()`` query that offset and seek the stream to it.
+        upload._invalid = True
+
+        try:
+            try:
+                upload.recover(transport)
+            except resumable_media.InvalidResponse as exc:
+                if exc.response.status_code not in _COMPLETED_STATUSES:
+                    raise
+                # The final chunk went through before the session file
+                # could be removed.
+                os.remove(session_file)
+                self._set_properties(exc.response.json())
+            else:
+                response = self._finish_resumable_upload(
+                    upload, transport, session_file)
+                self._set_properties(response.json())
+        except resumable_media.InvalidResponse as exc:
+            _raise_from_invalid_response(exc)
+
+        self._invalidate_cached(client)
+
+    def _use_multipart(self, size):
+        """Check if an upload should be sent in a single request.
+
+        :type size: int
+        :param size: The number of bytes to be uploaded (or :data:`None`).
+
+        :rtype: bool
+        :returns: :data:`True` for a multipart upload, :data:`False` for a
+                  resumable one.
+        """
+        if self.adaptive_chunk_size:
+            initial = self.chunk_size or _INITIAL_ADAPTIVE_CHUNK_SIZE
+            return size is not None and size <= initial
+        return self.chunk_size is None
+
     def _do_upload(self, client, stream, content_type, size, num_retries):
         """Determine an upload strategy and then perform the upload.
 
@@ -862,7 +1516,7 @@ class Blob(_PropertyMixin):
                   **only** response in the multipart case and it will be the
                   **final** response in the resumable case.
         """
-        if self.chunk_size is None:
+        if self._use_multipart(size):
             response = self._do_multipart_upload(
                 client, stream, content_type, size, num_retries)
         else:
@@ -872,7 +1526,8 @@ class Blob(_PropertyMixin):
         return response.json()
 
     def upload_from_file(self, file_obj, rewind=False, size=None,
-                         content_type=None, num_retries=None, client=None):
+                         content_type=None, num_retries=None, client=None,
+                         session_file=None, compress=False):
         """Upload the contents of this blob from a file-like object.
 
         The content type of the upload will be determined in order
@@ -930,8 +1585,26 @@ class Blob(_PropertyMixin):
         :param client: (Optional) The client to use.  If not passed, falls back
                        to the ``client`` stored on the blob's bucket.
 
+        :type session_file: str
+        :param session_file: (Optional) Path of a local file in which to
+                             record the progress of the upload, which then
+                             always uses a resumable session. If the process
+                             is interrupted, the upload can be continued
+                             with :meth:`resume_upload`.
+
+        :type compress: bool
+        :param compress: (Optional) Compress the data with gzip while it is
+                         being uploaded, and store the blob with a ``gzip``
+                         :attr:`content_encoding`. The compressed size is
+                         not known in advance, so a multipart upload holds
+                         the compressed data in memory; set
+                         :attr:`chunk_size` to stream it in chunks instead.
+                         Cannot be combined with ``session_file``.
+
         :raises: :class:`~google.cloud.exceptions.GoogleCloudError`
-                 if the upload response returns an error status.
+                 if the upload response returns an error status;
+                 :exc:`ValueError` if both ``compress`` and
+                 ``session_file`` are passed.
 
         .. _object versioning: https://cloud.google.com/storage/\
                                docs/object-versioning
@@ -941,14 +1614,39 @@ class Blob(_PropertyMixin):
             warnings.warn(_NUM_RETRIES_MESSAGE, DeprecationWarning)
 
         _maybe_rewind(file_obj, rewind=rewind)
+        saved_properties = None
+        if compress:
+            if session_file is not None:
+                raise ValueError(
+                    'A compressed upload cannot be resumed.')
+            file_obj = _GzipReader(file_obj, size)
+            size = None
+            # The encoding is sent with the upload metadata, but only kept
+            # on the blob once the server has stored the compressed data.
+            saved_properties = self._properties.copy(), self._changes.copy()
+            self.content_encoding = 'gzip'
+
         try:
-            created_json = self._do_upload(
-                client, file_obj, content_type, size, num_retries)
-            self._set_properties(created_json)
-        except resumable_media.InvalidResponse as exc:
-            _raise_from_invalid_response(exc)
+            try:
+                if session_file is None:
+                    created_json = self._do_upload(
+                        client, file_obj, content_type, size, num_retries)
+                else:
+                    created_json = self._do_resumable_upload(
+                        client, file_obj, content_type, size, num_retries,
+                        session_file=session_file).json()
+                self._set_properties(created_json)
+            except resumable_media.InvalidResponse as exc:
+                _raise_from_invalid_response(exc)
+        except Exception:
+            if saved_properties is not None:
+                self._properties, self._changes = saved_properties
+            raise
+
+        self._invalidate_cached(client)
 
-    def upload_from_filename(self, filename, content_type=None, client=None):
+    def upload_from_filename(self, filename, content_type=None, client=None,
+                             session_file=None, compress=False):
         """Upload this blob's contents from the content of a named file.
 
         The content type of the upload will be determined in order
@@ -982,14 +1680,28 @@ class Blob(_PropertyMixin):
         :type client: :class:`~google.cloud.storage.client.Client`
         :param client: (Optional) The client to use.  If not passed, falls back
                        to the ``client`` stored on the blob's bucket.
+
+        :type session_file: str
+        :param session_file: (Optional) Path of a local file in which to
+                             record the progress of the upload. See
+                             :meth:`upload_from_file`.
+
+        :type compress: bool
+        :param compress: (Optional) Compress the data with gzip while it is
+                         being uploaded. See :meth:`upload_from_file`.
         """
         content_type = self._get_content_type(content_type, filename=filename)
+        kwargs = {}
+        if session_file is not None:
+            kwargs['session_file'] = session_file
+        if compress:
+            kwargs['compress'] = True
 
         with open(filename, 'rb') as file_obj:
             total_bytes = os.fstat(file_obj.fileno()).st_size
             self.upload_from_file(
                 file_obj, content_type=content_type, client=client,
-                size=total_bytes)
+                size=total_bytes, **kwargs)
 
     def upload_from_string(self, data, content_type='text/plain', client=None):
         """Upload contents of this blob from the provided string.
@@ -1270,6 +1982,7 @@ class Blob(_PropertyMixin):
             data=request,
             _target_object=self)
         self._set_properties(api_response)
+        self._invalidate_cached(client)
 
     def rewrite(self, source, token=None, client=None):
         """Rewrite source blob into this one.
@@ -1325,6 +2038,7 @@ class Blob(_PropertyMixin):
         # in this case.
         if api_response['done']:
             self._set_properties(api_response['resource'])
+            self._invalidate_cached(client)
             return None, rewritten, size
 
         return api_response['rewriteToken'], rewritten, size
@@ -1658,6 +2372,398 @@ class Blob(_PropertyMixin):
             return _rfc3339_to_datetime(value)
 
 
+class BlobRecord(object):
+    """Compact, read-only summary of a blob returned by a listing.
+
+    Yielded by :meth:`google.cloud.storage.bucket.Bucket.list_blobs` when
+    ``compact=True``. Records only hold the handful of properties needed to
+    inventory a bucket, in ``__slots__``, so millions of them can be
+    iterated over far more cheaply than full :class:`Blob` instances.
+    Properties not included in the listing's ``fields`` are :data:`None`.
+
+    :type name: str
+    :param name: The name of the blob.
+
+    :type size: int
+    :param size: (Optional) The size of the blob, in bytes.
+
+    :type generation: int
+    :param generation: (Optional) The generation of the blob.
+
+    :type updated: str
+    :param updated: (Optional) RFC3339 timestamp of the last update.
+
+    :type crc32c: str
+    :param crc32c: (Optional) The base64-encoded CRC32C checksum.
+
+    :type md5_hash: str
+    :param md5_hash: (Optional) The base64-encoded MD5 hash.
+    """
+
+    __slots__ = (
+        'name', 'size', 'generation', '_updated', 'crc32c', 'md5_hash')
+
+    def __init__(self, name, size=None, generation=None, updated=None,
+                 crc32c=None, md5_hash=None):
+        self.name = name
+        self.size = size
+        self.generation = generation
+        self._updated = updated
+        self.crc32c = crc32c
+        self.md5_hash = md5_hash
+
+    @classmethod
+    def from_api_repr(cls, resource):
+        """Create a record from an object resource.
+
+        :type resource: dict
+        :param resource: An item of an ``objects.list`` response.
+
+        :rtype: :class:`BlobRecord`
+        :returns: The record.
+        """
+        size = resource.get('size')
+        if size is not None:
+            size = int(size)
+        generation = resource.get('generation')
+        if generation is not None:
+            generation = int(generation)
+        return cls(
+            resource.get('name'), size=size, generation=generation,
+            updated=resource.get('updated'), crc32c=resource.get('crc32c'),
+            md5_hash=resource.get('md5Hash'))
+
+    @property
+    def updated(self):
+        """Retrieve the timestamp at which the object was updated.
+
+        The timestamp is only parsed when accessed.
+
+        :rtype: :class:`datetime.datetime` or ``NoneType``
+        :returns: Datetime object parsed from RFC3339 valid timestamp, or
+                  ``None`` if the property was not listed.
+        """
+        if self._updated is not None:
+            return _rfc3339_to_datetime(self._updated)
+
+    def __repr__(self):
+        return '<BlobRecord: %s, %s, %s>' % (
+            self.name, self.size, self.generation)
+
+
+class _AdaptiveChunkSizer(object):
+    """Pick the size of each chunk of a resumable upload from the last one.
+
+    The next chunk is sized to be sent in about
+    :data:`_ADAPTIVE_CHUNK_SECONDS` at the measured throughput, growing by
+    at most a factor of two per chunk. Sizes are rounded down to a multiple
+    of the upload granularity (256 KB) and kept within
+    :data:`_MIN_ADAPTIVE_CHUNK_SIZE` and :data:`_MAX_ADAPTIVE_CHUNK_SIZE`.
+
+    :type chunk_size: int
+    :param chunk_size: The size of the first chunk.
+    """
+
+    def __init__(self, chunk_size):
+        self.chunk_size = chunk_size
+
+    def update(self, num_bytes, seconds):
+        """Record the time taken by a chunk and pick the next size.
+
+        :type num_bytes: int
+        :param num_bytes: The number of bytes the chunk committed.
+
+        :type seconds: float
+        :param seconds: The time the chunk took (including retries).
+
+        :rtype: int
+        :returns: The size of the next chunk.
+        """
+        if num_bytes <= 0:
+            # Nothing was committed: fall back to the smallest chunks.
+            target = 0
+        elif seconds <= 0:
+            target = 2 * self.chunk_size
+        else:
+            target = min(
+                num_bytes / seconds * _ADAPTIVE_CHUNK_SECONDS,
+                2 * self.chunk_size)
+
+        multiple = resumable_media.UPLOAD_CHUNK_SIZE
+        target = int(target) // multiple * multiple
+        minimum = max(_MIN_ADAPTIVE_CHUNK_SIZE // multiple, 1) * multiple
+        self.chunk_size = min(max(target, minimum), _MAX_ADAPTIVE_CHUNK_SIZE)
+        return self.chunk_size
+
+
+def _set_chunk_size(upload, chunk_size):
+    """Change the size of the next chunks of a resumable upload.
+
+    :type upload: :class:`~google.resumable_media.requests.ResumableUpload`
+    :param upload: The upload in progress.
+
+    :type chunk_size: int
+    :param chunk_size: The new chunk size, a multiple of 256 KB.
+
+    :rtype: bool
+    :returns: :data:`True` if the upload uses the new size.
+
+    :raises: :exc:`ValueError` if ``chunk_size`` is not a multiple of
+             256 KB.
+    """
+    if chunk_size % resumable_media.UPLOAD_CHUNK_SIZE != 0:
+        raise ValueError(
+            'Chunk size must be a multiple of %d.' % (
+                resumable_media.UPLOAD_CHUNK_SIZE,))
+    # NOTE: ``ResumableUpload`` has no public API to change the chunk
+    #       size, which is only read when sending a chunk. This private
+    #       field is why ``setup.py`` caps the ``google-resumable-media``
+    #       version; the public property shows whether it still applies.
+    if not hasattr(upload, '_chunk_size'):
+        return False
+    upload._chunk_size = chunk_size
+    return upload.chunk_size == chunk_size
+
+
+def _get_md5_header(response):
+    """Find the MD5 hash sent with a download.
+
+    :type response: :class:`~requests.Response`
+    :param response: The response of the download.
+
+    :rtype: str or ``NoneType``
+    :returns: The base64-encoded hash from the ``X-Goog-Hash`` header, if
+              any.
+    """
+    for checksum in response.headers.get('x-goog-hash', '').split(','):
+        name, _, value = checksum.strip().partition('=')
+        if name == 'md5':
+            return value
+    return None
+
+
+class _BufferWriter(object):
+    """Minimal writable stream filling a pre-allocated buffer in place.
+
+    :type buffer: bytearray, :class:`memoryview` or :class:`mmap.mmap`
+    :param buffer: A writable object supporting the buffer protocol. On
+                   Python 3, buffers of other item types (e.g. an
+                   ``array('i')`` or a NumPy array of floats) are filled
+                   byte by byte, if contiguous.
+
+    :raises: :exc:`ValueError` if ``buffer`` is read-only or cannot be
+             addressed as bytes.
+    """
+
+    def __init__(self, buffer):
+        view = memoryview(buffer)
+        if view.readonly:
+            raise ValueError('Buffer must be writable.')
+        if view.ndim != 1 or view.format != 'B':
+            if six.PY2:
+                if view.ndim != 1 or view.itemsize != 1:
+                    raise ValueError('Buffer items must be single bytes.')
+            elif not view.c_contiguous:
+                raise ValueError('Buffer must be contiguous.')
+            else:
+                view = view.cast('B')
+        self._view = view
+        self.position = 0
+
+    @property
+    def capacity(self):
+        """The total number of bytes the buffer can hold.
+
+        :rtype: int
+        :returns: The buffer length.
+        """
+        return len(self._view)
+
+    def write(self, data):
+        """Copy bytes into the buffer after those already written.
+
+        :type data: bytes
+        :param data: The bytes to be written.
+
+        :rtype: int
+        :returns: The number of bytes written.
+        :raises: :exc:`ValueError` if ``data`` does not fit in the buffer.
+        """
+        end = self.position + len(data)
+        if end > self.capacity:
+            raise ValueError(_BUFFER_TOO_SMALL.format(self.capacity, end))
+        self._view[self.position:end] = data
+        self.position = end
+        return len(data)
+
+
+class _GzipReader(object):
+    """Readable stream yielding the gzip compression of another stream.
+
+    Data is compressed block by block as it is read, so the compressed
+    stream is never held in full. The output is deterministic (the gzip
+    header carries no timestamp).
+
+    :type stream: IO[bytes]
+    :param stream: The uncompressed data.
+
+    :type size: int
+    :param size: (Optional) The number of bytes to read from ``stream``.
+                 Defaults to reading until it is exhausted.
+    """
+
+    def __init__(self, stream, size=None):
+        self._stream = stream
+        self._remaining = size
+        self._compressor = zlib.compressobj(
+            zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, _GZIP_WBITS)
+        self._buffer = bytearray()
+        self._position = 0
+        self._done = False
+
+    def _fill(self):
+        """Compress the next block of input into the buffer."""
+        block_size = _GZIP_READ_BLOCK_SIZE
+        if self._remaining is not None:
+            block_size = min(block_size, self._remaining)
+        block = self._stream.read(block_size) if block_size else b''
+        if block:
+            if self._remaining is not None:
+                self._remaining -= len(block)
+            self._buffer.extend(self._compressor.compress(block))
+        else:
+            self._buffer.extend(self._compressor.flush())
+            self._done = True
+
+    def read(self, size=-1):
+        """Read compressed bytes.
+
+        :type size: int
+        :param size: (Optional) The maximum number of bytes to read. Fewer
+                     bytes are only returned at the end of the stream.
+
+        :rtype: bytes
+        :returns: The compressed data.
+        """
+        while not self._done and (size < 0 or len(self._buffer) < size):
+            self._fill()
+
+        if size < 0:
+            size = len(self._buffer)
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        self._position += len(data)
+        return data
+
+    def tell(self):
+        """The number of compressed bytes read so far.
+
+        :rtype: int
+        :returns: The stream position.
+        """
+        return self._position
+
+
+class _GunzipWriter(object):
+    """Writable stream inflating gzip data into another stream.
+
+    If the data does not start with the gzip magic number, it is written
+    through unchanged.
+
+    :type stream: IO[bytes]
+    :param stream: Receives the inflated data.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._head = b''
+        self._decompressor = None
+        self._passthrough = False
+
+    def write(self, data):
+        """Inflate and write the next piece of the data.
+
+        :type data: bytes
+        :param data: The received bytes.
+
+        :rtype: int
+        :returns: The number of bytes consumed (i.e. ``len(data)``).
+        :raises: :exc:`ValueError` if the data is not valid gzip.
+        """
+        if self._passthrough:
+            self._stream.write(data)
+            return len(data)
+
+        if self._decompressor is None:
+            # Wait for enough bytes to check the magic number.
+            self._head += data
+            if len(self._head) < len(_GZIP_MAGIC):
+                return len(data)
+            if not self._head.startswith(_GZIP_MAGIC):
+                self._passthrough = True
+                pending, self._head = self._head, b''
+                self._stream.write(pending)
+                return len(data)
+            self._decompressor = zlib.decompressobj(_GZIP_WBITS)
+            pending, self._head = self._head, b''
+        else:
+            pending = data
+
+        while pending:
+            try:
+                self._stream.write(self._decompressor.decompress(pending))
+            except zlib.error as exc:
+                raise ValueError('Invalid gzip data', exc)
+            # Concatenated gzip members are inflated one after the other.
+            pending = self._decompressor.unused_data
+            if pending:
+                self._decompressor = zlib.decompressobj(_GZIP_WBITS)
+        return len(data)
+
+    def finish(self):
+        """Write out the remaining data once the download is complete.
+
+        :raises: :exc:`ValueError` if the gzip data is truncated.
+        """
+        if self._decompressor is None:
+            self._stream.write(self._head)
+            return
+
+        self._stream.write(self._decompressor.flush())
+        # NOTE: ``eof`` is only available on Python 3.3+.
+        if not getattr(self._decompressor, 'eof', True):
+            raise ValueError('Truncated gzip data.')
+
+
+def _save_session_state(session_file, blob, upload):
+    """Record the state of a resumable upload in a local file.
+
+    The file is replaced atomically, so that it is never left truncated.
+
+    :type session_file: str
+    :param session_file: The path of the file.
+
+    :type blob: :class:`Blob`
+    :param blob: The blob being uploaded.
+
+    :type upload: :class:`~google.resumable_media.requests.ResumableUpload`
+    :param upload: The upload in progress.
+    """
+    state = {
+        'bucket': blob.bucket.name,
+        'name': blob.name,
+        'resumable_url': upload.resumable_url,
+        'chunk_size': upload.chunk_size,
+        'total_bytes': upload.total_bytes,
+        'bytes_uploaded': upload.bytes_uploaded,
+        'content_type': upload._content_type,
+    }
+    temp_file = session_file + '.tmp'
+    with open(temp_file, 'w') as state_file:
+        json.dump(state, state_file)
+    _replace_file(temp_file, session_file)
+
+
 def _get_encryption_headers(key, source=False):
     """Builds customer encryption key headers
 
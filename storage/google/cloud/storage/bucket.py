@@ -15,16 +15,23 @@
 """Create / interact with Google Cloud Storage buckets."""
 
 import base64
+import concurrent.futures
 import copy
 import datetime
 import json
+import threading
 
+import requests
 import six
+from six.moves import queue
+from six.moves.urllib.parse import quote
 
 from google.api_core import page_iterator
+from google.auth import exceptions as auth_exceptions
 from google.cloud._helpers import _datetime_to_rfc3339
 from google.cloud._helpers import _NOW
 from google.cloud._helpers import _rfc3339_to_datetime
+from google.cloud import exceptions
 from google.cloud.exceptions import NotFound
 from google.cloud.iam import Policy
 from google.cloud.storage import _signing
@@ -33,12 +40,42 @@ from google.cloud.storage._helpers import _scalar_property
 from google.cloud.storage._helpers import _validate_name
 from google.cloud.storage.acl import BucketACL
 from google.cloud.storage.acl import DefaultObjectACL
+from google.cloud.storage.acl import ObjectACL
+from google.cloud.storage.batch import Batch
+from google.cloud.storage.blob import _API_ACCESS_ENDPOINT
 from google.cloud.storage.blob import Blob
+from google.cloud.storage.blob import BlobRecord
 from google.cloud.storage.blob import _get_encryption_headers
+from google.cloud.storage.cache import _get_metadata_cache
+from google.cloud.storage.cache import _invalidate
 from google.cloud.storage.notification import BucketNotification
 from google.cloud.storage.notification import NONE_PAYLOAD_FORMAT
 
 
+_COMPACT_LIST_FIELDS = (
+    'items(name,size,generation,updated,crc32c,md5Hash),'
+    'prefixes,nextPageToken')
+"""Fields requested by :meth:`Bucket.list_blobs` for compact records."""
+_PARTITION_QUEUE_PAGES = 4
+"""Pages buffered per partition by :meth:`Bucket.list_blobs_parallel`."""
+_QUEUE_POLL_INTERVAL = 0.1
+"""Seconds between checks for a cancelled listing while a queue is full."""
+_DEFAULT_REWRITE_WORKERS = 8
+"""Rewrites run at once by :meth:`Bucket.rewrite_blobs`."""
+_ACL_BATCH_SIZE = 100
+"""Requests per batch sent by :meth:`Bucket.update_blob_acls` (the API
+accepts at most 100 calls in a batch)."""
+_BATCH_ERRORS = (
+    exceptions.GoogleCloudError,
+    ValueError,
+    requests.exceptions.RequestException,
+    auth_exceptions.TransportError,
+)
+"""Errors failing all the requests of a batch, reported for each one."""
+_DEFAULT_ACL_WORKERS = 4
+"""Batches sent at once by :meth:`Bucket.update_blob_acls`."""
+
+
 def _blobs_page_start(iterator, page, response):
     """Grab prefixes after a :class:`~google.cloud.iterator.Page` started.
 
@@ -78,6 +115,214 @@ def _item_to_blob(iterator, item):
     return blob
 
 
+def _item_to_blob_record(iterator, item):
+    """Convert a JSON blob to a compact record.
+
+    :type iterator: :class:`~google.api_core.page_iterator.Iterator`
+    :param iterator: The iterator that has retrieved the item.
+
+    :type item: dict
+    :param item: An item to be converted to a record.
+
+    :rtype: :class:`.BlobRecord`
+    :returns: The next record in the page.
+    """
+    return BlobRecord.from_api_repr(item)
+
+
+def _put_until_stopped(out_queue, value, stop):
+    """Put a value on a bounded queue, unless the consumer has gone away.
+
+    :type out_queue: :class:`~queue.Queue`
+    :param out_queue: The queue to put the value on.
+
+    :type value: object
+    :param value: The value to be put.
+
+    :type stop: :class:`threading.Event`
+    :param stop: Set once the consumer stops reading.
+
+    :rtype: bool
+    :returns: Flag indicating if the value was put on the queue.
+    """
+    while not stop.is_set():
+        try:
+            out_queue.put(value, timeout=_QUEUE_POLL_INTERVAL)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _list_partition(iterator, out_queue, stop):
+    """Push the pages of a listing onto a queue.
+
+    Puts a list of items for each page, :data:`None` once the listing is
+    exhausted, or the exception which interrupted it.
+
+    :type iterator: :class:`~google.api_core.page_iterator.Iterator`
+    :param iterator: The listing of a partition.
+
+    :type out_queue: :class:`~queue.Queue`
+    :param out_queue: Receives the pages.
+
+    :type stop: :class:`threading.Event`
+    :param stop: Set once the consumer stops reading.
+    """
+    try:
+        for page in iterator.pages:
+            if not _put_until_stopped(out_queue, list(page), stop):
+                return
+    except Exception as exc:  # pylint: disable=broad-except
+        _put_until_stopped(out_queue, exc, stop)
+    else:
+        _put_until_stopped(out_queue, None, stop)
+
+
+def _drain_partition(out_queue):
+    """Yield the items pushed by :func:`_list_partition`.
+
+    :type out_queue: :class:`~queue.Queue`
+    :param out_queue: Queue of pages for a single partition.
+
+    :rtype: generator
+    :returns: The items in the partition.
+    """
+    while True:
+        page = out_queue.get()
+        if page is None:
+            return
+        if isinstance(page, Exception):
+            raise page
+        for item in page:
+            yield item
+
+
+def _iterate_partitions(list_partition, items, prefixes, max_workers, sort):
+    """Merge listings of disjoint prefixes run in a thread pool.
+
+    When sorting, each partition fills its own bounded queue and the
+    partitions are drained in name order; since the pool starts them in
+    the same order, the partition being drained is always running.
+    Otherwise, all partitions share one queue and pages are yielded in
+    whatever order they arrive.
+
+    :type list_partition: callable
+    :param list_partition: Returns the listing iterator for a prefix.
+
+    :type items: list
+    :param items: Blobs outside of the partitions.
+
+    :type prefixes: list of str
+    :param prefixes: Sorted, disjoint partition prefixes.
+
+    :type max_workers: int
+    :param max_workers: Number of partitions listed at once.
+
+    :type sort: bool
+    :param sort: Whether to yield the blobs in name order.
+
+    :rtype: generator
+    :returns: The blobs in ``items`` and in all partitions.
+    """
+    stop = threading.Event()
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers)
+    shared_queue = queue.Queue(_PARTITION_QUEUE_PAGES * max_workers)
+    queues = []
+    try:
+        for partition in prefixes:
+            if sort:
+                out_queue = queue.Queue(_PARTITION_QUEUE_PAGES)
+            else:
+                out_queue = shared_queue
+            queues.append(out_queue)
+            executor.submit(
+                _list_partition, list_partition(partition), out_queue, stop)
+
+        if sort:
+            # Partition prefixes never prefix one another, so an item
+            # sorts before a partition exactly when it sorts before its
+            # prefix.
+            units = [(item.name, None, item) for item in items]
+            units.extend(
+                (partition, index, None)
+                for index, partition in enumerate(prefixes))
+            units.sort(key=lambda unit: unit[0])
+            for _, index, item in units:
+                if index is None:
+                    yield item
+                else:
+                    for item in _drain_partition(queues[index]):
+                        yield item
+        else:
+            for item in items:
+                yield item
+            remaining = len(prefixes)
+            while remaining:
+                page = shared_queue.get()
+                if page is None:
+                    remaining -= 1
+                elif isinstance(page, Exception):
+                    raise page
+                else:
+                    for item in page:
+                        yield item
+    finally:
+        stop.set()
+        executor.shutdown(wait=False)
+
+
+def _rewrite_until_done(source, destination, client, on_progress):
+    """Rewrite a blob, following rewrite tokens until it is complete.
+
+    :type source: :class:`~google.cloud.storage.blob.Blob`
+    :param source: The blob to be copied.
+
+    :type destination: :class:`~google.cloud.storage.blob.Blob`
+    :param destination: The blob to be written.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: The client to use (or :data:`None`).
+
+    :type on_progress: callable
+    :param on_progress: Called (if not :data:`None`) after each rewrite
+                        request, with ``source``, ``destination``, the bytes
+                        rewritten so far and the total bytes.
+    """
+    token = None
+    while True:
+        token, rewritten, total = destination.rewrite(
+            source, token=token, client=client)
+        if on_progress is not None:
+            on_progress(source, destination, rewritten, total)
+        if token is None:
+            return
+
+
+def _send_acl_batch(client, acl_requests):
+    """Send object ACL requests in a single batch.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: The client making the requests.
+
+    :type acl_requests: list of tuple
+    :param acl_requests: ``(blob, api_request_kwargs)`` pairs.
+
+    :rtype: list
+    :returns: A :class:`~requests.Response` for each request, or the
+              exception raised if the batch itself failed (including a
+              :exc:`ValueError` for a batch response which is not
+              multi-part, as returned when the batch request is rejected).
+    """
+    batch = Batch(client)
+    for _, kwargs in acl_requests:
+        batch.api_request(_target_object=None, **kwargs)
+    try:
+        return batch.finish(raise_exception=False)
+    except _BATCH_ERRORS as exc:
+        return [exc] * len(acl_requests)
+
+
 def _item_to_notification(iterator, item):
     """Convert a JSON blob to the native object.
 
@@ -386,6 +631,13 @@ class Bucket(_PropertyMixin):
             query_params['userProject'] = self.user_project
         blob = Blob(bucket=self, name=blob_name, encryption_key=encryption_key,
                     **kwargs)
+        cache = _get_metadata_cache(client)
+        if cache is not None:
+            properties = cache.get(blob.path)
+            if properties is not None:
+                blob._set_properties(properties)
+                return blob
+
         try:
             headers = _get_encryption_headers(encryption_key)
             response = client._connection.api_request(
@@ -397,6 +649,8 @@ class Bucket(_PropertyMixin):
             )
             # NOTE: We assume response.get('name') matches `blob_name`.
             blob._set_properties(response)
+            if cache is not None:
+                cache.put(blob.path, response)
             # NOTE: This will not fail immediately in a batch. However, when
             #       Batch.finish() is called, the resulting `NotFound` will be
             #       raised.
@@ -406,11 +660,18 @@ class Bucket(_PropertyMixin):
 
     def list_blobs(self, max_results=None, page_token=None, prefix=None,
                    delimiter=None, versions=None,
-                   projection='noAcl', fields=None, client=None):
+                   projection='noAcl', fields=None, client=None,
+                   compact=False):
         """Return an iterator used to find blobs in the bucket.
 
         If :attr:`user_project` is set, bills the API request to that project.
 
+        To inventory large buckets, pass ``compact=True``: only the
+        properties of :class:`~google.cloud.storage.blob.BlobRecord` are
+        requested from the API, and each item is returned as such a
+        lightweight record rather than a full
+        :class:`~google.cloud.storage.blob.Blob`.
+
         :type max_results: int
         :param max_results: (Optional) Maximum number of blobs to return.
 
@@ -446,12 +707,26 @@ class Bucket(_PropertyMixin):
         :param client: (Optional) The client to use.  If not passed, falls back
                        to the ``client`` stored on the current bucket.
 
+        :type compact: bool
+        :param compact: (Optional) If :data:`True`, yield
+                        :class:`~google.cloud.storage.blob.BlobRecord`
+                        instances and, unless ``fields`` is passed, only
+                        request the fields they hold.
+
         :rtype: :class:`~google.api_core.page_iterator.Iterator`
         :returns: Iterator of all :class:`~google.cloud.storage.blob.Blob`
+                  (or :class:`~google.cloud.storage.blob.BlobRecord`)
                   in this bucket matching the arguments.
         """
         extra_params = {'projection': projection}
 
+        if compact:
+            item_to_value = _item_to_blob_record
+            if fields is None:
+                fields = _COMPACT_LIST_FIELDS
+        else:
+            item_to_value = _item_to_blob
+
         if prefix is not None:
             extra_params['prefix'] = prefix
 
@@ -473,7 +748,7 @@ class Bucket(_PropertyMixin):
             client=client,
             api_request=client._connection.api_request,
             path=path,
-            item_to_value=_item_to_blob,
+            item_to_value=item_to_value,
             page_token=page_token,
             max_results=max_results,
             extra_params=extra_params,
@@ -482,6 +757,153 @@ class Bucket(_PropertyMixin):
         iterator.prefixes = set()
         return iterator
 
+    def list_blobs_parallel(self, prefix=None, delimiter='/', prefixes=None,
+                            split_depth=1, max_workers=8, sort=False,
+                            versions=None, projection='noAcl', fields=None,
+                            compact=False, client=None):
+        """Iterate over the blobs in the bucket, listing prefixes in parallel.
+
+        A single :meth:`list_blobs` call follows one chain of page tokens,
+        which is slow for buckets holding hundreds of millions of objects.
+        This method splits the key space into disjoint prefixes, lists each
+        one with its own page-token chain in a pool of threads, and merges
+        the results into a single stream.
+
+        The partitions are either passed as ``prefixes``, or discovered by
+        listing ``prefix`` with ``delimiter`` and taking the "directories"
+        returned, ``split_depth`` levels deep. Objects found while
+        discovering partitions (those not under any partition) are part of
+        the result as well.
+
+        If :attr:`user_project` is set, bills the API requests to that
+        project.
+
+        :type prefix: str
+        :param prefix: (Optional) Only list blobs whose names begin with this
+                       prefix.
+
+        :type delimiter: str
+        :param delimiter: (Optional) Delimiter used to discover partitions.
+                          Defaults to ``'/'``.
+
+        :type prefixes: list of str
+        :param prefixes: (Optional) Partitions to be listed, instead of
+                         discovering them. No prefix may be a prefix of
+                         another.
+
+        :type split_depth: int
+        :param split_depth: (Optional) Number of ``delimiter`` levels to
+                            expand when discovering partitions. Defaults
+                            to 1.
+
+        :type max_workers: int
+        :param max_workers: (Optional) Number of partitions listed at once.
+                            Defaults to 8.
+
+        :type sort: bool
+        :param sort: (Optional) If :data:`True`, yield blobs in name order,
+                     as :meth:`list_blobs` would. Otherwise, pages are
+                     yielded as soon as any partition returns them.
+
+        :type versions: bool
+        :param versions: (Optional) Whether object versions should be returned
+                         as separate blobs.
+
+        :type projection: str
+        :param projection: (Optional) If used, must be 'full' or 'noAcl'.
+                           Defaults to ``'noAcl'``.
+
+        :type fields: str
+        :param fields: (Optional) Selector specifying which fields to include
+                       in a partial response. When discovering partitions,
+                       it must include ``prefixes`` and ``nextPageToken``.
+
+        :type compact: bool
+        :param compact: (Optional) If :data:`True`, yield
+                        :class:`~google.cloud.storage.blob.BlobRecord`
+                        instances, as with :meth:`list_blobs`.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: (Optional) The client to use.  If not passed, falls back
+                       to the ``client`` stored on the current bucket.
+
+        :rtype: generator
+        :returns: All :class:`~google.cloud.storage.blob.Blob` (or
+                  :class:`~google.cloud.storage.blob.BlobRecord`) in the
+                  matching partitions.
+        :raises: :exc:`ValueError` if ``prefixes`` overlap.
+        """
+        client = self._require_client(client)
+        list_kwargs = {
+            'versions': versions,
+            'projection': projection,
+            'fields': fields,
+            'compact': compact,
+            'client': client,
+        }
+
+        if prefixes is None:
+            items, prefixes = self._discover_partitions(
+                prefix, delimiter, split_depth, max_workers,
+                list_kwargs)
+        else:
+            items = []
+            prefixes = sorted(prefixes)
+            for first, second in zip(prefixes, prefixes[1:]):
+                if second.startswith(first):
+                    raise ValueError(
+                        'Prefixes must not overlap', first, second)
+
+        def list_partition(partition):
+            return self.list_blobs(prefix=partition, **list_kwargs)
+
+        return _iterate_partitions(
+            list_partition, items, prefixes, max_workers, sort)
+
+    def _discover_partitions(self, prefix, delimiter, depth, max_workers,
+                             list_kwargs):
+        """List the "directories" below a prefix, to be used as partitions.
+
+        :type prefix: str
+        :param prefix: The prefix to be split (or :data:`None`).
+
+        :type delimiter: str
+        :param delimiter: Delimiter separating "directory" levels.
+
+        :type depth: int
+        :param depth: Number of levels to expand.
+
+        :type max_workers: int
+        :param max_workers: Number of prefixes listed at once.
+
+        :type list_kwargs: dict
+        :param list_kwargs: Other arguments passed to :meth:`list_blobs`.
+
+        :rtype: tuple
+        :returns: Pair of the blobs found above the partitions and the
+                  sorted list of partition prefixes.
+        """
+        def list_level(level_prefix):
+            iterator = self.list_blobs(
+                prefix=level_prefix, delimiter=delimiter, **list_kwargs)
+            items = list(iterator)
+            return items, iterator.prefixes
+
+        items = []
+        level = [prefix]
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            for _ in range(depth):
+                next_level = set()
+                for level_items, level_prefixes in executor.map(
+                        list_level, level):
+                    items.extend(level_items)
+                    next_level.update(level_prefixes)
+                level = sorted(next_level)
+                if not level:
+                    break
+
+        return items, level
+
     def list_notifications(self, client=None):
         """List Pub / Sub notifications for this bucket.
 
@@ -611,11 +1033,15 @@ class Bucket(_PropertyMixin):
         # We intentionally pass `_target_object=None` since a DELETE
         # request has no response value (whether in a standard request or
         # in a batch request).
-        client._connection.api_request(
-            method='DELETE',
-            path=blob_path,
-            query_params=query_params,
-            _target_object=None)
+        try:
+            client._connection.api_request(
+                method='DELETE',
+                path=blob_path,
+                query_params=query_params,
+                _target_object=None)
+        finally:
+            # Also drop blobs which turn out to be already deleted.
+            _invalidate(client, blob_path)
 
     def delete_blobs(self, blobs, on_error=None, client=None):
         """Deletes a list of blobs from the current bucket.
@@ -710,6 +1136,7 @@ class Bucket(_PropertyMixin):
             new_blob.acl.save(acl={}, client=client)
 
         new_blob._set_properties(copy_result)
+        _invalidate(client, new_blob.path)
         return new_blob
 
     def rename_blob(self, blob, new_name, client=None):
@@ -744,6 +1171,82 @@ class Bucket(_PropertyMixin):
         blob.delete(client=client)
         return new_blob
 
+    def rewrite_blobs(self, blobs, destination_bucket, new_names=None,
+                      max_workers=_DEFAULT_REWRITE_WORKERS, on_progress=None,
+                      client=None):
+        """Copy many blobs of this bucket using concurrent rewrites.
+
+        Unlike :meth:`copy_blob`, each copy is made with
+        :meth:`~google.cloud.storage.blob.Blob.rewrite`, which can copy
+        objects of any size (and between locations or storage classes) in
+        several requests: the rewrite tokens returned for large objects are
+        followed automatically.
+
+        If :attr:`user_project` is set on the destination bucket, bills the
+        API requests to that project.
+
+        :type blobs: list
+        :param blobs: A list of :class:`~google.cloud.storage.blob.Blob`-s or
+                      blob names to copy.
+
+        :type destination_bucket: :class:`google.cloud.storage.bucket.Bucket`
+        :param destination_bucket: The bucket into which the blobs should be
+                                   copied (which may be this bucket).
+
+        :type new_names: list of str
+        :param new_names: (Optional) The name of each copy, in the same order
+                          as ``blobs``. Defaults to the source names.
+
+        :type max_workers: int
+        :param max_workers: (Optional) The number of rewrites run at once.
+
+        :type on_progress: callable
+        :param on_progress: (Optional) Called after each rewrite request, with
+                            the source blob, the new blob, the number of
+                            bytes rewritten so far and the size of the
+                            object. It is called from worker threads.
+
+        :type client: :class:`~google.cloud.storage.client.Client` or
+                      ``NoneType``
+        :param client: Optional. The client to use.  If not passed, falls back
+                       to the ``client`` stored on the current bucket.
+
+        :rtype: list of :class:`google.cloud.storage.blob.Blob`
+        :returns: The new blobs, in the same order as ``blobs``.
+        :raises: :exc:`ValueError` if ``new_names`` does not match ``blobs``;
+                 otherwise, the first error raised by a rewrite, once all
+                 rewrites have completed.
+        """
+        sources = []
+        for blob in blobs:
+            if isinstance(blob, six.string_types):
+                blob = self.blob(blob)
+            sources.append(blob)
+
+        if new_names is None:
+            new_names = [source.name for source in sources]
+        elif len(new_names) != len(sources):
+            raise ValueError(
+                'Expected {} new names, got {}.'.format(
+                    len(sources), len(new_names)))
+
+        new_blobs = [
+            Blob(name=new_name, bucket=destination_bucket)
+            for new_name in new_names]
+        if not sources:
+            return new_blobs
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            futures = [
+                executor.submit(
+                    _rewrite_until_done, source, new_blob, client,
+                    on_progress)
+                for source, new_blob in zip(sources, new_blobs)]
+
+        for future in futures:
+            future.result()
+        return new_blobs
+
     @property
     def cors(self):
         """Retrieve or set CORS policies configured for this bucket.
@@ -1298,6 +1801,229 @@ class Bucket(_PropertyMixin):
                 blob.acl.all().grant_read()
                 blob.acl.save(client=client)
 
+    def update_blob_acls(self, blobs, acl=None, predefined=None, grants=(),
+                         revokes=(), batch_size=_ACL_BATCH_SIZE,
+                         max_workers=_DEFAULT_ACL_WORKERS, client=None):
+        """Apply the same ACL change to many blobs of this bucket.
+
+        Unlike editing ``blob.acl`` and calling
+        :meth:`~google.cloud.storage.acl.ACL.save` for each blob, which
+        first loads each ACL and then patches it, the requests are sent in
+        :class:`~google.cloud.storage.batch.Batch`-es of up to 100 calls,
+        several batches at a time, and existing ACLs are never loaded:
+
+        * ``acl`` or ``predefined`` replace each ACL outright;
+        * ``grants`` add (or update) single entries, e.g.
+          ``grants=[('allUsers', 'READER')]``;
+        * ``revokes`` remove every role of an entity, e.g.
+          ``revokes=['allUsers']``.
+
+        For example:
+
+        .. code-block:: python
+
+           failed = bucket.update_blob_acls(
+               names, grants=[('group-team@example.com', 'READER')])
+           for name, error in failed.items():
+               print(name, error)
+
+        If :attr:`user_project` is set, bills the API requests to that
+        project.
+
+        :type blobs: list
+        :param blobs: A list of :class:`~google.cloud.storage.blob.Blob`-s or
+                      blob names. The ACLs of the blobs passed are updated
+                      (when a full ACL is saved) or reset, to be loaded
+                      again on next use.
+
+        :type acl: :class:`google.cloud.storage.acl.ACL`, or a compatible list.
+        :param acl: (Optional) The complete ACL to save for each blob.
+
+        :type predefined: str
+        :param predefined: (Optional) A predefined ACL to apply to each blob
+                           (see :meth:`~.ACL.save_predefined`).
+
+        :type grants: list of tuple
+        :param grants: (Optional) ``(entity, role)`` pairs to add to each
+                       ACL. Entities may be given as strings (e.g.
+                       ``'user-someone@example.com'``) or ACL entities.
+
+        :type revokes: list
+        :param revokes: (Optional) Entities to remove from each ACL.
+
+        :type batch_size: int
+        :param batch_size: (Optional) The maximum number of requests sent in
+                           one batch, at most 100.
+
+        :type max_workers: int
+        :param max_workers: (Optional) The number of batches sent at once.
+
+        :type client: :class:`~google.cloud.storage.client.Client` or
+                      ``NoneType``
+        :param client: Optional. The client to use.  If not passed, falls back
+                       to the ``client`` stored on the current bucket.
+
+        :rtype: dict
+        :returns: Maps the name of each blob which could not be updated to
+                  the (first) error raised for it: usually a
+                  :class:`~google.cloud.exceptions.GoogleCloudError`, or the
+                  error of the whole batch if the batch request failed.
+                  Empty if every blob was updated.
+        :raises: :exc:`ValueError` if the requested change is empty,
+                 ambiguous or invalid, or if ``batch_size`` is out of range.
+        """
+        if not 1 <= batch_size <= _ACL_BATCH_SIZE:
+            raise ValueError(
+                'batch_size must be between 1 and %d.' % (_ACL_BATCH_SIZE,))
+        replace = acl is not None or predefined is not None
+        if acl is not None and predefined is not None:
+            raise ValueError('Pass either an ACL or a predefined ACL.')
+        if replace and (grants or revokes):
+            raise ValueError(
+                'Cannot combine a complete ACL with grants or revokes.')
+        if not (replace or grants or revokes):
+            raise ValueError('No ACL change requested.')
+        if predefined is not None:
+            predefined = ObjectACL.PREDEFINED_XML_ACLS.get(
+                predefined, predefined)
+            if predefined not in ObjectACL.PREDEFINED_JSON_ACLS:
+                raise ValueError('Invalid predefined ACL: %s' % (predefined,))
+        if acl is not None:
+            acl = list(acl)
+
+        client = self._require_client(client)
+        query_params = {}
+        if self.user_project is not None:
+            query_params['userProject'] = self.user_project
+
+        acl_requests = []
+        targets = []
+        for blob in blobs:
+            if isinstance(blob, six.string_types):
+                blob = self.blob(blob)
+            targets.append(blob)
+            if replace:
+                patch_params = dict(query_params, projection='full')
+                if predefined is not None:
+                    patch_params['predefinedAcl'] = predefined
+                acl_requests.append((blob, {
+                    'method': 'PATCH',
+                    'path': blob.path,
+                    'data': {'acl': acl or []},
+                    'query_params': patch_params,
+                }))
+            for entity, role in grants:
+                acl_requests.append((blob, {
+                    'method': 'POST',
+                    'path': blob.path + '/acl',
+                    'data': {'entity': str(entity), 'role': role},
+                    'query_params': query_params,
+                }))
+            for entity in revokes:
+                acl_requests.append((blob, {
+                    'method': 'DELETE',
+                    'path': '%s/acl/%s' % (
+                        blob.path, quote(str(entity), safe='')),
+                    'query_params': query_params,
+                }))
+
+        chunks = [
+            acl_requests[index:index + batch_size]
+            for index in range(0, len(acl_requests), batch_size)]
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            results = list(executor.map(
+                lambda chunk: _send_acl_batch(client, chunk), chunks))
+
+        errors = {}
+        for chunk, responses in zip(chunks, results):
+            for (blob, _), response in zip(chunk, responses):
+                if isinstance(response, Exception):
+                    errors.setdefault(blob.name, response)
+                elif not 200 <= response.status_code < 300:
+                    errors.setdefault(
+                        blob.name, exceptions.from_http_response(response))
+                elif replace:
+                    blob.acl.entities.clear()
+                    blob.acl.loaded = True
+                    for entry in response.json().get('acl', ()):
+                        blob.acl.add_entity(blob.acl.entity_from_dict(entry))
+
+        for blob in targets:
+            _invalidate(client, blob.path)
+            if not replace or blob.name in errors:
+                blob.acl.reset()
+        return errors
+
+    def generate_signed_urls(self, blobs, expiration, method='GET',
+                             content_type=None, response_disposition=None,
+                             response_type=None, client=None,
+                             credentials=None, max_workers=None):
+        """Generate signed URLs for many blobs of this bucket at once.
+
+        Equivalent to calling
+        :meth:`~google.cloud.storage.blob.Blob.generate_signed_url` for each
+        blob, but much faster for large batches: the signing credentials
+        and the expiration are resolved once, and credentials which sign
+        remotely (through the IAM ``signBlob`` API) sign concurrently.
+
+        :type blobs: list
+        :param blobs: A list of :class:`~google.cloud.storage.blob.Blob`-s or
+                      blob names.
+
+        :type expiration: int, long, datetime.datetime, datetime.timedelta
+        :param expiration: When the signed URLs should expire. All URLs
+                           expire at the same time.
+
+        :type method: str
+        :param method: The HTTP verb that will be used when requesting the
+                       URLs.
+
+        :type content_type: str
+        :param content_type: (Optional) The content type of the objects.
+
+        :type response_disposition: str
+        :param response_disposition: (Optional) Content disposition of
+                                     responses to requests for the signed URLs.
+
+        :type response_type: str
+        :param response_type: (Optional) Content type of responses to requests
+                              for the signed URLs.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: (Optional) The client to use.  If not passed, falls back
+                       to the ``client`` stored on the current bucket.
+
+        :type credentials: :class:`google.auth.credentials.Signing`
+        :param credentials: (Optional) The credentials used to sign the URLs.
+                            Defaults to the credentials stored on the client.
+
+        :type max_workers: int
+        :param max_workers: (Optional) The number of URLs signed concurrently.
+                            Defaults to 1, unless the credentials sign
+                            remotely.
+
+        :rtype: list of str
+        :returns: Signed URLs, in the same order as ``blobs``.
+        """
+        if credentials is None:
+            client = self._require_client(client)
+            credentials = client._credentials
+
+        resources = []
+        for blob in blobs:
+            blob_name = blob
+            if not isinstance(blob_name, six.string_types):
+                blob_name = blob.name
+            resources.append('/{bucket_name}/{quoted_name}'.format(
+                bucket_name=self.name, quoted_name=quote(blob_name)))
+
+        return _signing.generate_signed_urls(
+            credentials, resources, expiration,
+            api_access_endpoint=_API_ACCESS_ENDPOINT, method=method,
+            content_type=content_type, response_type=response_type,
+            response_disposition=response_disposition,
+            max_workers=max_workers)
+
     def generate_upload_policy(
             self, conditions, expiration=None, client=None):
         """Create a signed upload policy for uploading objects.
@@ -0,0 +1,157 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Client-side cache of blob metadata.
+
+Reading the metadata of the same "hot" blobs over and over costs an API
+request each time. A :class:`MetadataCache` attached to a client lets
+:meth:`~google.cloud.storage.bucket.Bucket.get_blob`,
+:meth:`~google.cloud.storage.blob.Blob.exists` and
+:meth:`~google.cloud.storage.blob.Blob.reload` answer from memory:
+
+.. code-block:: python
+
+   from google.cloud import storage
+   from google.cloud.storage.cache import MetadataCache
+
+   client = storage.Client(metadata_cache=MetadataCache(ttl=30))
+   bucket = client.bucket('my-bucket')
+   blob = bucket.get_blob('config.json')  # API request.
+   blob = bucket.get_blob('config.json')  # Cached.
+
+Entries expire after ``ttl`` seconds, and the least recently used entries
+are evicted once the cache is full. Writes made through the same client
+(uploads, :meth:`~google.cloud.storage.blob.Blob.patch`, deletes,
+rewrites, etc.) invalidate the entries they affect, but changes made by
+other clients go unnoticed until the entries expire.
+"""
+
+import collections
+import copy
+import threading
+import time
+
+
+_DEFAULT_MAX_SIZE = 1024
+_DEFAULT_TTL = 60.0  # Seconds.
+_monotonic = getattr(time, 'monotonic', time.time)
+
+
+class MetadataCache(object):
+    """Thread-safe LRU cache of blob properties, with a time to live.
+
+    :type max_size: int
+    :param max_size: (Optional) The maximum number of blobs cached.
+
+    :type ttl: float
+    :param ttl: (Optional) The number of seconds an entry stays valid.
+    """
+
+    def __init__(self, max_size=_DEFAULT_MAX_SIZE, ttl=_DEFAULT_TTL):
+        if max_size < 1:
+            raise ValueError('max_size must be positive.')
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, path):
+        """Look up the cached properties of a blob.
+
+        :type path: str
+        :param path: The blob's API path (see
+                     :attr:`~google.cloud.storage.blob.Blob.path`).
+
+        :rtype: dict or ``NoneType``
+        :returns: A copy of the properties, or :data:`None` if they are not
+                  cached or have expired.
+        """
+        with self._lock:
+            entry = self._entries.pop(path, None)
+            if entry is None:
+                return None
+            expires, properties = entry
+            if _monotonic() >= expires:
+                return None
+            # Re-insert as the most recently used entry.
+            self._entries[path] = entry
+        return copy.deepcopy(properties)
+
+    def put(self, path, properties):
+        """Cache the properties of a blob.
+
+        :type path: str
+        :param path: The blob's API path.
+
+        :type properties: dict
+        :param properties: The blob's properties, as returned by the API.
+        """
+        entry = (_monotonic() + self.ttl, copy.deepcopy(properties))
+        with self._lock:
+            self._entries.pop(path, None)
+            self._entries[path] = entry
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, path):
+        """Drop the cached properties of a blob, if any.
+
+        :type path: str
+        :param path: The blob's API path.
+        """
+        with self._lock:
+            self._entries.pop(path, None)
+
+    def clear(self):
+        """Drop all cached properties."""
+        with self._lock:
+            self._entries.clear()
+
+
+def _get_metadata_cache(client):
+    """Find the metadata cache to be used for a client's requests.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: The client making the requests.
+
+    :rtype: :class:`MetadataCache` or ``NoneType``
+    :returns: The client's cache, or :data:`None` if it has none or if a
+              batch is active (batched responses are only known once the
+              batch is finished).
+    """
+    cache = getattr(client, 'metadata_cache', None)
+    if cache is None or getattr(client, 'current_batch', None) is not None:
+        return None
+    return cache
+
+
+def _invalidate(client, path):
+    """Drop a blob from a client's metadata cache, if it has one.
+
+    Unlike :func:`_get_metadata_cache`, this also applies while a batch is
+    active: the write is then only deferred.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: The client making the write.
+
+    :type path: str
+    :param path: The blob's API path.
+    """
+    cache = getattr(client, 'metadata_cache', None)
+    if cache is not None:
+        cache.invalidate(path)
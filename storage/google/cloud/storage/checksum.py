@@ -0,0 +1,354 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Checksums computed while transferring blob data.
+
+Uploads and downloads feed every byte through a :class:`Checksums`
+instance as it passes by, so the digests are available as soon as the
+transfer finishes without reading the data a second time:
+
+.. code-block:: python
+
+   blob.download_to_filename('local.bin')
+   assert blob.transfer_checksums.matches(blob)
+
+The CRC32C checksum is only computed when the ``crcmod`` package is
+installed with its C extension (``pip install google-cloud-storage[crc32c]``);
+the pure-Python fallback of ``crcmod`` is far too slow to be run inline.
+"""
+
+import base64
+from hashlib import md5
+import struct
+
+try:
+    from crcmod.crcmod import _usingExtension as _CRCMOD_EXTENSION
+    import crcmod.predefined
+except ImportError:  # pragma: NO COVER
+    crcmod = None
+    _CRCMOD_EXTENSION = False
+
+
+_CRC32C_POLYNOMIAL = 0x82f63b78
+"""Bit-reversed CRC32C (Castagnoli) polynomial."""
+
+
+def _crc32c_available():
+    """Check if a fast CRC32C implementation can be used.
+
+    :rtype: bool
+    :returns: Flag indicating if ``crcmod`` is installed with its C
+              extension.
+    """
+    return crcmod is not None and _CRCMOD_EXTENSION
+
+
+def _gf2_matrix_times(matrix, vector):
+    """Multiply a GF(2) 32x32 matrix by a 32-bit vector."""
+    result = 0
+    index = 0
+    while vector:
+        if vector & 1:
+            result ^= matrix[index]
+        vector >>= 1
+        index += 1
+    return result
+
+
+def _gf2_matrix_square(matrix):
+    """Square a GF(2) 32x32 matrix."""
+    return [_gf2_matrix_times(matrix, row) for row in matrix]
+
+
+def _crc32c_combine(crc1, crc2, length2):
+    """Combine the CRC32C checksums of two adjacent pieces of data.
+
+    Computes the checksum of ``data1 + data2`` from the checksum of each
+    part, using the same "zero operator" technique as zlib's
+    ``crc32_combine``; it runs in ``O(log(length2))`` time.
+
+    :type crc1: int
+    :param crc1: The CRC32C of the first piece.
+
+    :type crc2: int
+    :param crc2: The CRC32C of the second piece.
+
+    :type length2: int
+    :param length2: The length, in bytes, of the second piece.
+
+    :rtype: int
+    :returns: The CRC32C of the concatenated data.
+    """
+    if length2 <= 0:
+        return crc1
+
+    # Operator for a single zero bit, then two and four zero bits.
+    odd = [_CRC32C_POLYNOMIAL] + [1 << bit for bit in range(31)]
+    even = _gf2_matrix_square(odd)
+    odd = _gf2_matrix_square(even)
+
+    # Apply ``length2`` zero bytes to ``crc1``, one bit of the length at
+    # a time (the first squaring gives the operator for one zero byte).
+    while True:
+        even = _gf2_matrix_square(odd)
+        if length2 & 1:
+            crc1 = _gf2_matrix_times(even, crc1)
+        length2 >>= 1
+        if not length2:
+            break
+
+        odd = _gf2_matrix_square(even)
+        if length2 & 1:
+            crc1 = _gf2_matrix_times(odd, crc1)
+        length2 >>= 1
+        if not length2:
+            break
+
+    return crc1 ^ crc2
+
+
+def _encode_crc32c(value):
+    """Encode a CRC32C value the way the API reports it.
+
+    :type value: int
+    :param value: The checksum.
+
+    :rtype: str
+    :returns: The base64-encoded, big-endian checksum.
+    """
+    return base64.b64encode(struct.pack('>I', value)).decode('ascii')
+
+
+class Checksums(object):
+    """Running MD5 and CRC32C checksums of a stream of bytes.
+
+    :type md5_enabled: bool
+    :param md5_enabled: (Optional) Compute an MD5 hash. Defaults to
+                        :data:`True`.
+
+    :type crc32c_enabled: bool
+    :param crc32c_enabled: (Optional) Compute a CRC32C checksum. Defaults to
+                           :data:`True`, but the checksum is skipped if no
+                           fast implementation is installed.
+    """
+
+    def __init__(self, md5_enabled=True, crc32c_enabled=True):
+        self._md5 = md5() if md5_enabled else None
+        self._md5_value = None
+        if crc32c_enabled and _crc32c_available():
+            self._crc32c = crcmod.predefined.Crc('crc-32c')
+        else:
+            self._crc32c = None
+        self._crc32c_value = None
+        self._size = 0
+
+    @property
+    def size(self):
+        """The number of bytes checksummed so far.
+
+        :rtype: int
+        :returns: The byte count.
+        """
+        return self._size
+
+    @property
+    def md5_hash(self):
+        """The base64-encoded MD5 hash of the data seen so far.
+
+        Compare with :attr:`google.cloud.storage.blob.Blob.md5_hash`.
+
+        :rtype: str or ``NoneType``
+        :returns: The hash, or :data:`None` if MD5 is not being computed
+                  (nor known from a validated download).
+        """
+        if self._md5 is None:
+            return self._md5_value
+        return base64.b64encode(self._md5.digest()).decode('ascii')
+
+    def set_md5(self, value):
+        """Record an MD5 hash validated by another means.
+
+        Used when the hash is not computed here, e.g. for a download
+        whose MD5 was already checked against the one the server sent.
+
+        :type value: str or ``NoneType``
+        :param value: The base64-encoded MD5 hash.
+        """
+        self._md5_value = value
+
+    @property
+    def crc32c_value(self):
+        """The CRC32C checksum of the data seen so far, as an integer.
+
+        :rtype: int or ``NoneType``
+        :returns: The checksum, or :data:`None` if CRC32C is not being
+                  computed.
+        """
+        if self._crc32c is not None:
+            return self._crc32c.crcValue
+        return self._crc32c_value
+
+    @property
+    def crc32c(self):
+        """The base64-encoded CRC32C checksum of the data seen so far.
+
+        Compare with :attr:`google.cloud.storage.blob.Blob.crc32c`.
+
+        :rtype: str or ``NoneType``
+        :returns: The checksum, or :data:`None` if CRC32C is not being
+                  computed.
+        """
+        value = self.crc32c_value
+        if value is None:
+            return None
+        return _encode_crc32c(value)
+
+    def update(self, data):
+        """Feed more data into the checksums.
+
+        :type data: bytes
+        :param data: The next piece of the stream.
+        """
+        if self._md5 is not None:
+            self._md5.update(data)
+        if self._crc32c is not None:
+            self._crc32c.update(data)
+        self._size += len(data)
+
+    def combine(self, other):
+        """Combine with the checksums of the data that follows this one.
+
+        This is intended for sliced transfers, where each slice of a blob
+        is checksummed separately: combining the slices in order gives the
+        CRC32C of the whole blob. MD5 hashes cannot be combined, so the
+        result only carries a CRC32C.
+
+        :type other: :class:`Checksums`
+        :param other: The checksums of the data immediately following the
+                      data checksummed by this instance.
+
+        :rtype: :class:`Checksums`
+        :returns: New checksums covering both pieces of data.
+        """
+        result = Checksums(md5_enabled=False, crc32c_enabled=False)
+        result._size = self._size + other._size
+        crc1 = self.crc32c_value
+        crc2 = other.crc32c_value
+        if crc1 is not None and crc2 is not None:
+            result._crc32c_value = _crc32c_combine(crc1, crc2, other._size)
+        return result
+
+    def matches(self, blob):
+        """Check the checksums against those reported for a blob.
+
+        Every checksum available on both sides is compared.
+
+        .. note::
+
+           A blob served with decompressive transcoding (i.e. one with a
+           ``gzip`` content encoding, downloaded uncompressed) will not
+           match, since the server-side checksums describe the stored,
+           compressed bytes.
+
+        :type blob: :class:`google.cloud.storage.blob.Blob`
+        :param blob: The blob the data was transferred to or from. Its
+                     properties must be loaded.
+
+        :rtype: bool
+        :returns: :data:`True` if all compared checksums agree.
+        :raises: :class:`ValueError` if there is no checksum to compare.
+        """
+        pairs = [
+            (self.md5_hash, blob.md5_hash),
+            (self.crc32c, blob.crc32c),
+        ]
+        compared = [
+            (local, remote) for local, remote in pairs
+            if local is not None and remote is not None]
+        if not compared:
+            raise ValueError('No checksum available to compare.')
+        return all(local == remote for local, remote in compared)
+
+
+class _ChecksummingReader(object):
+    """Wrap a readable stream, checksumming the bytes read from it.
+
+    Uploads may rewind the stream to re-send data (e.g. while recovering
+    a resumable upload), so only bytes beyond the furthest position
+    already checksummed are fed to the checksums.
+
+    :type stream: IO[bytes]
+    :param stream: The wrapped stream.
+
+    :type checksums: :class:`Checksums`
+    :param checksums: Receives the bytes read.
+    """
+
+    def __init__(self, stream, checksums):
+        self._stream = stream
+        self._checksums = checksums
+        self._hashed_to = stream.tell()
+        self._skipped = False
+
+    @property
+    def complete(self):
+        """Whether every byte read has been checksummed exactly once.
+
+        :rtype: bool
+        :returns: :data:`False` if a read started beyond the checksummed
+                  data, leaving a gap.
+        """
+        return not self._skipped
+
+    def read(self, size=-1):
+        start = self._stream.tell()
+        data = self._stream.read(size)
+        end = start + len(data)
+        if start > self._hashed_to:
+            self._skipped = True
+        elif end > self._hashed_to:
+            self._checksums.update(data[self._hashed_to - start:])
+            self._hashed_to = end
+        return data
+
+    def tell(self):
+        return self._stream.tell()
+
+    def seek(self, offset, whence=0):
+        return self._stream.seek(offset, whence)
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+class _ChecksummingWriter(object):
+    """Wrap a writable stream, checksumming the bytes written to it.
+
+    :type stream: IO[bytes]
+    :param stream: The wrapped stream.
+
+    :type checksums: :class:`Checksums`
+    :param checksums: Receives the bytes written.
+    """
+
+    def __init__(self, stream, checksums):
+        self._stream = stream
+        self._checksums = checksums
+
+    def write(self, data):
+        self._checksums.update(data)
+        return self._stream.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
@@ -51,6 +51,13 @@ class Client(ClientWithProject):
                   ``credentials`` for the current object.
                   This parameter should be considered private, and could
                   change in the future.
+
+    :type metadata_cache: :class:`~google.cloud.storage.cache.MetadataCache`
+    :param metadata_cache: (Optional) Cache of blob metadata consulted by
+                           :meth:`~google.cloud.storage.bucket.Bucket.get_blob`,
+                           :meth:`~google.cloud.storage.blob.Blob.exists` and
+                           :meth:`~google.cloud.storage.blob.Blob.reload`.
+                           Not used by default.
     """
 
     SCOPE = ('https://www.googleapis.com/auth/devstorage.full_control',
@@ -58,7 +65,8 @@ class Client(ClientWithProject):
              'https://www.googleapis.com/auth/devstorage.read_write')
     """The scopes required for authenticating as a Cloud Storage consumer."""
 
-    def __init__(self, project=_marker, credentials=None, _http=None):
+    def __init__(self, project=_marker, credentials=None, _http=None,
+                 metadata_cache=None):
         self._base_connection = None
         if project is None:
             no_project = True
@@ -73,6 +81,7 @@ class Client(ClientWithProject):
             self.project = None
         self._connection = Connection(self)
         self._batch_stack = _LocalStack()
+        self.metadata_cache = metadata_cache
 
     @classmethod
     def create_anonymous_client(cls):
@@ -0,0 +1,527 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""File-like objects for streaming Google Cloud Storage blobs.
+
+Instances are usually created via
+:meth:`google.cloud.storage.blob.Blob.open` rather than directly.
+"""
+
+import concurrent.futures
+import io
+import os
+
+from google import resumable_media
+from google.cloud import exceptions
+from google.cloud.storage.checksum import Checksums
+
+
+_DEFAULT_CHUNK_SIZE = 10 * 1024 * 1024  # 10 MB
+_BAD_WHENCE = 'Invalid whence value: {!r}'
+
+
+class BlobReader(io.BufferedIOBase):
+    """A file-like object which reads a blob in ranged chunks.
+
+    Each chunk is fetched with a single ranged ``GET`` request. When
+    ``prefetch`` is enabled, the chunk following the one being read is
+    requested in a background thread, so that sequential reads overlap
+    network I/O with the caller's processing.
+
+    :type blob: :class:`google.cloud.storage.blob.Blob`
+    :param blob: The blob to be read.
+
+    :type chunk_size: int
+    :param chunk_size: (Optional) The number of bytes requested per ``GET``.
+                       Defaults to the blob's ``chunk_size``, if set, else
+                       to 10 MB.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: (Optional) The client to use.  If not passed, falls back
+                   to the ``client`` stored on the blob's bucket.
+
+    :type prefetch: bool
+    :param prefetch: (Optional) Whether to request the next chunk in the
+                     background. Defaults to :data:`True`.
+    """
+
+    def __init__(self, blob, chunk_size=None, client=None, prefetch=True):
+        super(BlobReader, self).__init__()
+        if chunk_size is None:
+            chunk_size = blob.chunk_size or _DEFAULT_CHUNK_SIZE
+        if chunk_size <= 0:
+            raise ValueError('Chunk size must be positive.')
+
+        self._blob = blob
+        self._chunk_size = chunk_size
+        self._client = client
+        self._prefetch = prefetch
+        self._position = 0
+        self._buffer = b''
+        self._buffer_start = 0
+        self._pending = None
+        self._executor = None
+
+    @property
+    def blob(self):
+        """The blob being read.
+
+        :rtype: :class:`google.cloud.storage.blob.Blob`
+        """
+        return self._blob
+
+    def readable(self):
+        """Reader objects are always readable.
+
+        :rtype: bool
+        :returns: :data:`True`
+        """
+        return True
+
+    def seekable(self):
+        """Reader objects are always seekable.
+
+        :rtype: bool
+        :returns: :data:`True`
+        """
+        return True
+
+    def tell(self):
+        """Return the current position in the blob.
+
+        :rtype: int
+        :returns: The offset (in bytes) of the next byte to be read.
+        """
+        self._check_not_closed()
+        return self._position
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        """Change the position in the blob.
+
+        Seeking is a local operation: no request is sent until the next
+        read, and buffered data is reused when the new position falls
+        inside of it.
+
+        :type offset: int
+        :param offset: Offset (in bytes), relative to ``whence``.
+
+        :type whence: int
+        :param whence: (Optional) One of :data:`os.SEEK_SET`,
+                       :data:`os.SEEK_CUR` or :data:`os.SEEK_END`.
+
+        :rtype: int
+        :returns: The new absolute position.
+        :raises: :exc:`ValueError` if ``whence`` is invalid or the new
+                 position would be negative.
+        """
+        self._check_not_closed()
+        if whence == os.SEEK_SET:
+            position = offset
+        elif whence == os.SEEK_CUR:
+            position = self._position + offset
+        elif whence == os.SEEK_END:
+            position = self._get_size() + offset
+        else:
+            raise ValueError(_BAD_WHENCE.format(whence))
+
+        if position < 0:
+            raise ValueError('Negative seek position {:d}'.format(position))
+
+        self._position = position
+        return position
+
+    def read(self, size=-1):
+        """Read up to ``size`` bytes from the blob.
+
+        :type size: int
+        :param size: (Optional) The maximum number of bytes to read. If
+                     negative or omitted, reads until the end of the blob.
+
+        :rtype: bytes
+        :returns: The bytes read; empty once the end of the blob is reached.
+        :raises: :class:`google.cloud.exceptions.NotFound`
+        """
+        self._check_not_closed()
+        total_size = self._get_size()
+        if size is None or size < 0:
+            size = total_size - self._position
+
+        pieces = []
+        while size > 0 and self._position < total_size:
+            self._fill(self._position)
+            offset = self._position - self._buffer_start
+            piece = self._buffer[offset:offset + size]
+            if not piece:
+                # The blob is shorter than its recorded size.
+                break
+            pieces.append(piece)
+            self._position += len(piece)
+            size -= len(piece)
+
+        return b''.join(pieces)
+
+    read1 = read
+
+    def close(self):
+        """Close the reader and release buffered data."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self._pending = None
+        self._buffer = b''
+        super(BlobReader, self).close()
+
+    def _check_not_closed(self):
+        """Raise if the reader has been closed.
+
+        :raises: :exc:`ValueError` if the reader is closed.
+        """
+        if self.closed:
+            raise ValueError('I/O operation on closed file.')
+
+    def _get_size(self):
+        """Determine the size of the blob, loading it if needed.
+
+        Loading the blob's properties also pins later ranged reads to the
+        current generation, via its ``mediaLink``.
+
+        :rtype: int
+        :returns: The size of the blob, in bytes.
+        """
+        if self._blob.size is None:
+            self._blob.reload(client=self._client)
+        return self._blob.size
+
+    def _fill(self, position):
+        """Make sure the buffer contains the byte at ``position``.
+
+        Uses the prefetched chunk when it begins at ``position``, otherwise
+        downloads the chunk synchronously. Afterwards, schedules a prefetch
+        of the chunk following the buffer.
+
+        :type position: int
+        :param position: The offset of the byte which must be buffered.
+        """
+        buffer_end = self._buffer_start + len(self._buffer)
+        if self._buffer_start <= position < buffer_end:
+            return
+
+        pending, self._pending = self._pending, None
+        if pending is not None and pending[0] == position:
+            self._buffer = pending[1].result()
+        else:
+            self._buffer = self._fetch(position)
+        self._buffer_start = position
+
+        next_start = position + len(self._buffer)
+        if self._prefetch and next_start < self._get_size():
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=1)
+            future = self._executor.submit(self._fetch, next_start)
+            self._pending = (next_start, future)
+
+    def _fetch(self, start):
+        """Download one chunk of the blob.
+
+        :type start: int
+        :param start: The offset of the first byte in the chunk.
+
+        :rtype: bytes
+        :returns: The downloaded chunk.
+        """
+        end = min(start + self._chunk_size, self._get_size()) - 1
+        buffer = io.BytesIO()
+        self._blob._download_range(
+            buffer, start, end, client=self._client)
+        return buffer.getvalue()
+
+
+class BlobWriter(io.BufferedIOBase):
+    """A file-like object which uploads written bytes to a blob.
+
+    Bytes are buffered in memory until a full chunk is available, then
+    sent through a resumable upload, so data of unknown size (e.g. from a
+    generator or a pipe) can be uploaded with constant memory. If fewer
+    than ``chunk_size`` bytes are written in total, :meth:`close` sends them
+    in a single multipart upload instead.
+
+    The upload is finalized by :meth:`close`; nothing is visible in the
+    bucket before then. When used as a context manager, an exception
+    raised in the ``with`` block abandons the upload rather than
+    finalizing a truncated blob.
+
+    :type blob: :class:`google.cloud.storage.blob.Blob`
+    :param blob: The blob to be written. Its properties are updated from
+                 the server's response once the upload is finalized.
+
+    :type chunk_size: int
+    :param chunk_size: (Optional) The number of bytes sent per request.
+                       Must be a multiple of 256 KB. Defaults to the blob's
+                       ``chunk_size``, if set, else to 10 MB.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: (Optional) The client to use.  If not passed, falls back
+                   to the ``client`` stored on the blob's bucket.
+
+    :raises: :exc:`ValueError` if ``chunk_size`` is not a multiple of
+             256 KB.
+    """
+
+    def __init__(self, blob, chunk_size=None, client=None):
+        super(BlobWriter, self).__init__()
+        if chunk_size is None:
+            chunk_size = blob.chunk_size or _DEFAULT_CHUNK_SIZE
+        if chunk_size <= 0 or chunk_size % blob._CHUNK_SIZE_MULTIPLE != 0:
+            raise ValueError('Chunk size must be a multiple of %d.' % (
+                blob._CHUNK_SIZE_MULTIPLE,))
+
+        self._blob = blob
+        self._chunk_size = chunk_size
+        self._client = client
+        self._buffer = _SlidingBuffer()
+        self._upload = None
+        self._transport = None
+        self._checksums = Checksums()
+
+    @property
+    def blob(self):
+        """The blob being written.
+
+        :rtype: :class:`google.cloud.storage.blob.Blob`
+        """
+        return self._blob
+
+    def writable(self):
+        """Writer objects are always writable.
+
+        :rtype: bool
+        :returns: :data:`True`
+        """
+        return True
+
+    def tell(self):
+        """Return the number of bytes written so far.
+
+        :rtype: int
+        :returns: The offset of the next byte to be written.
+        """
+        self._check_not_closed()
+        return self._buffer.size
+
+    def write(self, data):
+        """Write bytes, sending every full chunk to the server.
+
+        :type data: bytes
+        :param data: The bytes to be appended to the blob.
+
+        :rtype: int
+        :returns: The number of bytes written.
+        :raises: :class:`~google.cloud.exceptions.GoogleCloudError`
+                 if an upload request returns an error status.
+        """
+        self._check_not_closed()
+        self._buffer.write(data)
+        self._checksums.update(data)
+
+        while self._buffer.remaining >= self._chunk_size:
+            self._transmit_next_chunk()
+
+        return len(data)
+
+    def close(self):
+        """Send any buffered bytes and finalize the upload.
+
+        :raises: :class:`~google.cloud.exceptions.GoogleCloudError`
+                 if an upload request returns an error status.
+        """
+        if not self.closed:
+            try:
+                self._finalize()
+            finally:
+                self._buffer = None
+                super(BlobWriter, self).close()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            # Abandon the upload: the session expires without creating
+            # a (truncated) blob.
+            self._buffer = None
+            super(BlobWriter, self).close()
+
+    def _check_not_closed(self):
+        """Raise if the writer has been closed.
+
+        :raises: :exc:`ValueError` if the writer is closed.
+        """
+        if self.closed:
+            raise ValueError('I/O operation on closed file.')
+
+    def _initiate_upload(self):
+        """Start the resumable upload session."""
+        self._upload, self._transport = self._blob._initiate_resumable_upload(
+            self._client, self._buffer, None, None, None,
+            chunk_size=self._chunk_size)
+
+    def _transmit_next_chunk(self):
+        """Send one chunk of the buffer to the server.
+
+        The final chunk (smaller than ``chunk_size``) concludes the upload.
+
+        :rtype: :class:`~requests.Response`
+        :returns: The response for the chunk.
+        """
+        try:
+            if self._upload is None:
+                self._initiate_upload()
+            response = self._upload.transmit_next_chunk(self._transport)
+        except resumable_media.InvalidResponse as exc:
+            raise exceptions.from_http_response(exc.response)
+
+        self._buffer.discard(self._upload.bytes_uploaded)
+        return response
+
+    def _finalize(self):
+        """Upload the remaining bytes and update the blob's properties.
+
+        The checksums of the bytes written are recorded on the blob as
+        :attr:`~google.cloud.storage.blob.Blob.transfer_checksums`.
+        """
+        if self._upload is None:
+            size = self._buffer.remaining
+            try:
+                response = self._blob._do_multipart_upload(
+                    self._client, self._buffer, None, size, None)
+            except resumable_media.InvalidResponse as exc:
+                raise exceptions.from_http_response(exc.response)
+        else:
+            response = self._transmit_next_chunk()
+
+        self._blob._set_properties(response.json())
+        self._blob._invalidate_cached(self._client)
+        self._blob._transfer_checksums = self._checksums
+
+
+class _TextBlobWriter(io.TextIOWrapper):
+    """Text wrapper of a :class:`BlobWriter`, for :meth:`Blob.open('w')`.
+
+    A plain :class:`io.TextIOWrapper` closes its buffer when leaving a
+    ``with`` block, even if the block raised, which would finalize a
+    truncated blob: the writer's own ``__exit__`` decides instead.
+    """
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.buffer.__exit__(exc_type, exc_value, traceback)
+
+
+class _SlidingBuffer(object):
+    """Readable in-memory stream which forgets bytes once they are sent.
+
+    Acts as the ``stream`` of a resumable upload: offsets reported by
+    :meth:`tell` and accepted by :meth:`seek` are absolute positions in the
+    upload, while only bytes not yet acknowledged by the server are kept.
+    """
+
+    def __init__(self):
+        self._data = bytearray()
+        self._start = 0
+        self._position = 0
+
+    @property
+    def size(self):
+        """Total number of bytes ever written.
+
+        :rtype: int
+        """
+        return self._start + len(self._data)
+
+    @property
+    def remaining(self):
+        """Number of bytes which have been written but not yet read.
+
+        :rtype: int
+        """
+        return self.size - self._position
+
+    def write(self, data):
+        """Append bytes to the buffer.
+
+        :type data: bytes
+        :param data: The bytes to append.
+        """
+        self._data.extend(data)
+
+    def read(self, size=-1):
+        """Read bytes from the current position.
+
+        :type size: int
+        :param size: (Optional) The maximum number of bytes to read.
+
+        :rtype: bytes
+        :returns: The bytes read.
+        """
+        offset = self._position - self._start
+        if size is None or size < 0:
+            result = bytes(self._data[offset:])
+        else:
+            result = bytes(self._data[offset:offset + size])
+        self._position += len(result)
+        return result
+
+    def tell(self):
+        """Return the current (absolute) position.
+
+        :rtype: int
+        """
+        return self._position
+
+    def seek(self, position, whence=os.SEEK_SET):
+        """Move to an absolute position which is still buffered.
+
+        :type position: int
+        :param position: The new position.
+
+        :type whence: int
+        :param whence: (Optional) Only :data:`os.SEEK_SET` is supported.
+
+        :rtype: int
+        :returns: The new position.
+        :raises: :exc:`ValueError` if the position was already discarded or
+                 is past the end of the buffer.
+        """
+        if whence != os.SEEK_SET:
+            raise ValueError(_BAD_WHENCE.format(whence))
+        if not self._start <= position <= self.size:
+            raise ValueError(
+                'Cannot seek to {:d}, buffer holds bytes {:d} to {:d}.'.format(
+                    position, self._start, self.size))
+        self._position = position
+        return position
+
+    def discard(self, position):
+        """Forget the bytes before an (absolute) position.
+
+        :type position: int
+        :param position: The first position to keep. Clamped to the
+                         current read position.
+        """
+        position = min(position, self._position)
+        if position > self._start:
+            del self._data[:position - self._start]
+            self._start = position
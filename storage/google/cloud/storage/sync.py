@@ -0,0 +1,430 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Synchronize a local directory tree with blobs under a bucket prefix.
+
+Like ``rsync``, only files which are new or have changed are transferred:
+
+.. code-block:: python
+
+   from google.cloud.storage import sync
+
+   result = sync.sync_to_bucket('build/', bucket, prefix='static/')
+   print(result.transferred)
+
+A file and a blob of different sizes always differ. Otherwise, they are
+compared by modification time (the blob's ``updated`` timestamp, which
+:meth:`~google.cloud.storage.blob.Blob.download_to_filename` copies to the
+files it writes) or, with ``checksum=True``, by the MD5 hash or CRC32C
+checksum reported for the blob in the listing.
+"""
+
+import calendar
+import concurrent.futures
+import os
+import time
+
+from google.cloud.storage.checksum import Checksums
+
+
+_DEFAULT_MAX_WORKERS = 8
+_READ_BLOCK_SIZE = 1024 * 1024  # 1 MB
+
+
+class SyncResult(object):
+    """Outcome of a synchronization.
+
+    Paths are blob names relative to the prefix, using ``/`` separators.
+    """
+
+    def __init__(self):
+        self.transferred = []
+        """Paths copied because they were new or changed."""
+        self.unchanged = []
+        """Paths found identical on both sides."""
+        self.deleted = []
+        """Paths removed from the destination."""
+        self.skipped = []
+        """Paths of blobs not downloaded, because their names (e.g.
+        containing ``..`` segments) lead outside the local directory."""
+
+    def __repr__(self):
+        return '<SyncResult: %d transferred, %d unchanged, %d deleted>' % (
+            len(self.transferred), len(self.unchanged), len(self.deleted))
+
+
+def sync_to_bucket(directory, bucket, prefix=None, checksum=False,
+                   delete=False, max_workers=_DEFAULT_MAX_WORKERS,
+                   client=None):
+    """Upload the new and changed files of a directory tree.
+
+    :type directory: str
+    :param directory: The local directory to be uploaded.
+
+    :type bucket: :class:`~google.cloud.storage.bucket.Bucket`
+    :param bucket: The destination bucket.
+
+    :type prefix: str
+    :param prefix: (Optional) Prefix prepended to the relative path of each
+                   file to form its blob name (e.g. ``'static/'``).
+
+    :type checksum: bool
+    :param checksum: (Optional) Compare files of the same size by content
+                     hash rather than modification time. Each such file is
+                     read locally, but never downloaded.
+
+    :type delete: bool
+    :param delete: (Optional) Delete the blobs under ``prefix`` which have
+                   no matching local file.
+
+    :type max_workers: int
+    :param max_workers: (Optional) The number of concurrent transfers.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: (Optional) The client to use.  If not passed, falls back
+                   to the ``client`` stored on the bucket.
+
+    :rtype: :class:`SyncResult`
+    :returns: The paths uploaded, found unchanged and deleted.
+    """
+    prefix = _normalize_prefix(prefix)
+    local_files = _walk(directory)
+    records = _list_records(bucket, prefix, client)
+    result = SyncResult()
+
+    def upload(path):
+        blob = bucket.blob(prefix + path)
+        blob.upload_from_filename(local_files[path], client=client)
+
+    def delete_blob(path):
+        bucket.blob(prefix + path).delete(client=client)
+
+    to_upload = []
+    for path in sorted(local_files):
+        record = records.get(path)
+        if record is None or _differs(local_files[path], record, checksum,
+                                      _is_newer_than):
+            to_upload.append(path)
+        else:
+            result.unchanged.append(path)
+
+    to_delete = []
+    if delete:
+        to_delete = sorted(set(records) - set(local_files))
+
+    _run_all(upload, to_upload, max_workers)
+    result.transferred.extend(to_upload)
+    _run_all(delete_blob, to_delete, max_workers)
+    result.deleted.extend(to_delete)
+    return result
+
+
+def sync_from_bucket(bucket, directory, prefix=None, checksum=False,
+                     delete=False, max_workers=_DEFAULT_MAX_WORKERS,
+                     client=None):
+    """Download the new and changed blobs under a prefix.
+
+    Blobs are downloaded at the generation found by the listing. Blobs
+    whose names end with ``/`` (placeholders for "directories") are
+    ignored. Blobs whose names would lead outside ``directory`` are never
+    written, but reported in :attr:`SyncResult.skipped`.
+
+    :type bucket: :class:`~google.cloud.storage.bucket.Bucket`
+    :param bucket: The source bucket.
+
+    :type directory: str
+    :param directory: The local directory to be updated. It is created
+                      if needed.
+
+    :type prefix: str
+    :param prefix: (Optional) Only download blobs whose names begin with
+                   this prefix, which is stripped from the local paths.
+
+    :type checksum: bool
+    :param checksum: (Optional) Compare files of the same size by content
+                     hash rather than modification time.
+
+    :type delete: bool
+    :param delete: (Optional) Delete the local files which have no matching
+                   blob.
+
+    :type max_workers: int
+    :param max_workers: (Optional) The number of concurrent transfers.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: (Optional) The client to use.  If not passed, falls back
+                   to the ``client`` stored on the bucket.
+
+    :rtype: :class:`SyncResult`
+    :returns: The paths downloaded, found unchanged, deleted and skipped.
+    """
+    prefix = _normalize_prefix(prefix)
+    local_files = _walk(directory)
+    records = _list_records(bucket, prefix, client)
+    result = SyncResult()
+    filenames = {}
+    for path in sorted(records):
+        filename = _local_filename(directory, path)
+        if filename is None:
+            result.skipped.append(path)
+        else:
+            filenames[path] = filename
+
+    def download(path):
+        record = records[path]
+        filename = filenames[path]
+        parent = os.path.dirname(filename)
+        if not os.path.isdir(parent):
+            try:
+                os.makedirs(parent)
+            except OSError:  # pragma: NO COVER
+                # Created concurrently by another download.
+                if not os.path.isdir(parent):
+                    raise
+        blob = bucket.blob(record.name)
+        # Pin the listed generation, and let ``download_to_filename`` copy
+        # the ``updated`` timestamp to the file for the next comparison.
+        blob._set_properties({
+            'generation': record.generation,
+            'updated': record._updated,
+        })
+        blob.download_to_filename(filename, client=client)
+
+    to_download = []
+    for path in sorted(filenames):
+        filename = local_files.get(path)
+        if filename is None or _differs(filename, records[path], checksum,
+                                        _has_other_mtime):
+            to_download.append(path)
+        else:
+            result.unchanged.append(path)
+
+    to_delete = []
+    if delete:
+        to_delete = sorted(set(local_files) - set(records))
+
+    _run_all(download, to_download, max_workers)
+    result.transferred.extend(to_download)
+    for path in to_delete:
+        os.remove(local_files[path])
+    result.deleted.extend(to_delete)
+    return result
+
+
+def _normalize_prefix(prefix):
+    """Make sure a non-empty prefix ends with a ``/``.
+
+    :type prefix: str
+    :param prefix: The prefix (or :data:`None`).
+
+    :rtype: str
+    :returns: The normalized prefix.
+    """
+    if not prefix:
+        return ''
+    if not prefix.endswith('/'):
+        prefix += '/'
+    return prefix
+
+
+def _local_filename(directory, path):
+    """Find the file to be written for a relative blob path.
+
+    :type directory: str
+    :param directory: The local directory.
+
+    :type path: str
+    :param path: The blob name relative to the prefix, with ``/``
+                 separators.
+
+    :rtype: str
+    :returns: The file name, or :data:`None` if it is not within
+              ``directory`` (for ``..`` or absolute path segments).
+    """
+    filename = os.path.join(directory, *path.split('/'))
+    root = os.path.realpath(directory)
+    if not os.path.realpath(filename).startswith(
+            os.path.join(root, '')):
+        return None
+    return filename
+
+
+def _walk(directory):
+    """Find the files in a directory tree.
+
+    :type directory: str
+    :param directory: The root of the tree. It need not exist.
+
+    :rtype: dict
+    :returns: Mapping of relative paths (with ``/`` separators) to full
+              file names.
+    """
+    files = {}
+    for dirpath, _, filenames in os.walk(directory):
+        relative_dir = os.path.relpath(dirpath, directory)
+        for filename in filenames:
+            relative = os.path.normpath(os.path.join(relative_dir, filename))
+            files[relative.replace(os.sep, '/')] = os.path.join(
+                dirpath, filename)
+    return files
+
+
+def _list_records(bucket, prefix, client):
+    """List the blobs under a prefix.
+
+    :type bucket: :class:`~google.cloud.storage.bucket.Bucket`
+    :param bucket: The bucket to be listed.
+
+    :type prefix: str
+    :param prefix: The normalized prefix.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: The client to use (or :data:`None`).
+
+    :rtype: dict
+    :returns: Mapping of paths relative to ``prefix`` to
+              :class:`~google.cloud.storage.blob.BlobRecord` instances.
+    """
+    records = {}
+    for record in bucket.list_blobs(
+            prefix=prefix or None, compact=True, client=client):
+        if not record.name.endswith('/'):
+            records[record.name[len(prefix):]] = record
+    return records
+
+
+def _download_mtime(updated):
+    """Compute the modification time set by ``download_to_filename``.
+
+    :type updated: :class:`datetime.datetime`
+    :param updated: The blob's ``updated`` timestamp.
+
+    :rtype: float
+    :returns: The file modification time.
+    """
+    return time.mktime(updated.timetuple())
+
+
+def _is_newer_than(mtime, updated):
+    """Check if a local file was modified after a blob was uploaded.
+
+    Files written by ``download_to_filename`` carry the blob's timestamp
+    and are not considered newer.
+
+    :type mtime: float
+    :param mtime: The file modification time.
+
+    :type updated: :class:`datetime.datetime`
+    :param updated: The blob's ``updated`` timestamp.
+
+    :rtype: bool
+    :returns: Flag indicating if the file should be uploaded.
+    """
+    if int(mtime) == int(_download_mtime(updated)):
+        return False
+    return mtime > calendar.timegm(updated.utctimetuple()) + 1
+
+
+def _has_other_mtime(mtime, updated):
+    """Check if a local file was not written from the blob's current data.
+
+    :type mtime: float
+    :param mtime: The file modification time.
+
+    :type updated: :class:`datetime.datetime`
+    :param updated: The blob's ``updated`` timestamp.
+
+    :rtype: bool
+    :returns: Flag indicating if the file should be downloaded.
+    """
+    return int(mtime) != int(_download_mtime(updated))
+
+
+def _differs(filename, record, checksum, mtime_differs):
+    """Check if a local file and a blob hold different data.
+
+    :type filename: str
+    :param filename: The local file.
+
+    :type record: :class:`~google.cloud.storage.blob.BlobRecord`
+    :param record: The listed blob.
+
+    :type checksum: bool
+    :param checksum: Compare content hashes rather than timestamps.
+
+    :type mtime_differs: callable
+    :param mtime_differs: Compares the file modification time with the
+                          blob's ``updated`` timestamp.
+
+    :rtype: bool
+    :returns: Flag indicating if the file needs to be transferred.
+    """
+    stat = os.stat(filename)
+    if stat.st_size != record.size:
+        return True
+
+    if checksum:
+        try:
+            return not _file_checksums(filename).matches(record)
+        except ValueError:
+            # Nothing to compare against.
+            return True
+
+    updated = record.updated
+    if updated is None:
+        return True
+    return mtime_differs(stat.st_mtime, updated)
+
+
+def _file_checksums(filename):
+    """Compute the checksums of a local file.
+
+    :type filename: str
+    :param filename: The file to be read.
+
+    :rtype: :class:`~google.cloud.storage.checksum.Checksums`
+    :returns: The file's checksums.
+    """
+    checksums = Checksums()
+    with open(filename, 'rb') as file_obj:
+        block = file_obj.read(_READ_BLOCK_SIZE)
+        while block:
+            checksums.update(block)
+            block = file_obj.read(_READ_BLOCK_SIZE)
+    return checksums
+
+
+def _run_all(function, paths, max_workers):
+    """Call a function for each path in a thread pool.
+
+    :type function: callable
+    :param function: Transfers or deletes a single path.
+
+    :type paths: list of str
+    :param paths: The paths to be processed.
+
+    :type max_workers: int
+    :param max_workers: The number of concurrent calls.
+
+    :raises: The first exception raised by ``function``, once all calls
+             have completed.
+    """
+    if not paths:
+        return
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        futures = [executor.submit(function, path) for path in paths]
+
+    for future in futures:
+        future.result()
@@ -31,9 +31,11 @@ release_status = 'Development Status :: 5 - Production/Stable'
 dependencies = [
     'google-cloud-core<0.29dev,>=0.28.0',
     'google-api-core<0.2.0dev,>=0.1.1',
-    'google-resumable-media>=0.3.1',
+    'google-resumable-media<0.4dev,>=0.3.1',
 ]
 extras = {
+    ':python_version < "3.2"': 'futures>=3.2.0',
+    'crc32c': 'crcmod>=1.7',
 }
 
 
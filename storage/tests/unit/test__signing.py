@@ -211,6 +211,86 @@ class Test_generate_signed_url(unittest.TestCase):
                           resource=resource, expiration=expiration)
 
 
+class Test_generate_signed_urls(unittest.TestCase):
+
+    @staticmethod
+    def _call_fut(*args, **kwargs):
+        from google.cloud.storage._signing import generate_signed_urls
+
+        return generate_signed_urls(*args, **kwargs)
+
+    def _sign_helper(self, credentials, **kwargs):
+        from google.cloud.storage._signing import generate_signed_url
+
+        credentials.sign_bytes.side_effect = lambda value: value.encode()
+        resources = ['/name/a', '/name/b', '/name/c']
+        expiration = 1000
+
+        urls = self._call_fut(
+            credentials, resources, expiration,
+            api_access_endpoint='http://api.example.com',
+            response_type='text/plain', **kwargs)
+
+        expected = [
+            generate_signed_url(
+                credentials, resource, expiration,
+                api_access_endpoint='http://api.example.com',
+                response_type='text/plain')
+            for resource in resources]
+        self.assertEqual(urls, expected)
+        return credentials
+
+    def test_local_signer(self):
+        credentials = _make_credentials(
+            signing=True, signer_email='service@example.com')
+        self._sign_helper(credentials)
+
+    def test_remote_signer(self):
+        import google.auth.iam
+
+        credentials = _make_credentials(
+            signing=True, signer_email='service@example.com')
+        credentials.signer = mock.Mock(spec=google.auth.iam.Signer)
+        patch = mock.patch('concurrent.futures.ThreadPoolExecutor')
+
+        with patch as executor_class:
+            executor = executor_class.return_value.__enter__.return_value
+            executor.map.side_effect = lambda func, items: map(func, items)
+            self._sign_helper(credentials)
+
+        executor_class.assert_called_once_with(16)
+
+    def test_w_max_workers(self):
+        credentials = _make_credentials(
+            signing=True, signer_email='service@example.com')
+        self._sign_helper(credentials, max_workers=4)
+
+    def test_w_timedelta_expiration(self):
+        from google.cloud.storage import _signing
+
+        credentials = _make_credentials(
+            signing=True, signer_email='service@example.com')
+        credentials.sign_bytes.return_value = b'DEADBEEF'
+        utc_seconds = 1000
+        now = datetime.datetime.utcfromtimestamp(utc_seconds)
+        now_mock = mock.Mock(return_value=now, spec=[])
+
+        with mock.patch.object(_signing, 'NOW', new=now_mock):
+            urls = self._call_fut(
+                credentials, ['/name/a', '/name/b'],
+                datetime.timedelta(seconds=10))
+
+        # The expiration is computed once for all URLs.
+        now_mock.assert_called_once_with()
+        for url in urls:
+            self.assertIn('Expires=1010', url)
+
+    def test_with_google_credentials(self):
+        credentials = _make_credentials()
+        with self.assertRaises(AttributeError):
+            self._call_fut(credentials, ['/name/path'], 1000)
+
+
 def _make_credentials(signing=False, signer_email=None):
     import google.auth.credentials
 
@@ -414,6 +414,29 @@ class TestBatch(unittest.TestCase):
         self._check_subrequest_payload(chunks[0], 'GET', url, {})
         self._check_subrequest_payload(chunks[1], 'GET', url, {})
 
+    def test_finish_nonempty_with_status_failure_wo_raise(self):
+        url = 'http://api.example.com/other_api'
+        expected_response = _make_response(
+            content=_TWO_PART_MIME_RESPONSE_WITH_FAIL,
+            headers={'content-type': 'multipart/mixed; boundary="DEADBEEF="'})
+        http = _make_requests_session([expected_response])
+        connection = _Connection(http=http)
+        client = _Client(connection)
+        batch = self._make_one(client)
+        batch.API_BASE_URL = 'http://api.example.com'
+        target1 = _MockObject()
+        target2 = _MockObject()
+
+        batch._do_request('GET', url, {}, None, target1)
+        batch._do_request('GET', url, {}, None, target2)
+
+        responses = batch.finish(raise_exception=False)
+
+        self.assertEqual(
+            [response.status_code for response in responses],
+            [http_client.OK, http_client.NOT_FOUND])
+        self.assertEqual(target1._properties, {'foo': 1, 'bar': 2})
+
     def test_finish_nonempty_non_multipart_response(self):
         url = 'http://api.example.com/other_api'
         http = _make_requests_session([_make_response()])
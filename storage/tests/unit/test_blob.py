@@ -26,6 +26,13 @@ import six
 from six.moves import http_client
 
 
+def _base64_md5(data):
+    import base64
+    import hashlib
+
+    return base64.b64encode(hashlib.md5(data).digest()).decode('ascii')
+
+
 def _make_credentials():
     import google.auth.credentials
 
@@ -54,6 +61,7 @@ class Test_Blob(unittest.TestCase):
         self.assertFalse(blob._acl.loaded)
         self.assertIs(blob._acl.blob, blob)
         self.assertEqual(blob._encryption_key, None)
+        self.assertIsNone(blob.transfer_checksums)
 
     def test_ctor_with_encoded_unicode(self):
         blob_name = b'wet \xe2\x9b\xb5'
@@ -372,6 +380,84 @@ class Test_Blob(unittest.TestCase):
             '_target_object': None,
         })
 
+    def _cached_blob_setup(self, *responses):
+        from google.cloud.storage.cache import MetadataCache
+
+        connection = _Connection(*responses)
+        client = _Client(connection)
+        client.metadata_cache = MetadataCache()
+        blob = self._make_one('blob-name', bucket=_Bucket(client))
+        return blob, client, connection
+
+    def test_exists_w_metadata_cache(self):
+        blob, client, connection = self._cached_blob_setup()
+        client.metadata_cache.put(blob.path, {'name': 'blob-name'})
+
+        self.assertTrue(blob.exists())
+        self.assertEqual(connection._requested, [])
+
+    def test_reload_w_metadata_cache(self):
+        response = ({'status': http_client.OK}, {'generation': '7'})
+        blob, client, connection = self._cached_blob_setup(response)
+
+        blob.reload()
+        self.assertEqual(blob.generation, 7)
+        self.assertEqual(len(connection._requested), 1)
+
+        # A second blob object reads the cached properties.
+        other = self._make_one('blob-name', bucket=blob.bucket)
+        other.reload()
+        self.assertEqual(other.generation, 7)
+        self.assertEqual(len(connection._requested), 1)
+
+    def test_patch_invalidates_metadata_cache(self):
+        response = ({'status': http_client.OK}, {'metadata': {'a': 'b'}})
+        blob, client, connection = self._cached_blob_setup(response)
+        client.metadata_cache.put(blob.path, {'name': 'blob-name'})
+
+        blob.metadata = {'a': 'b'}
+        blob.patch()
+
+        self.assertIsNone(client.metadata_cache.get(blob.path))
+        kw, = connection._requested
+        self.assertEqual(kw['method'], 'PATCH')
+
+    def test_update_invalidates_metadata_cache(self):
+        response = ({'status': http_client.OK}, {'name': 'blob-name'})
+        blob, client, connection = self._cached_blob_setup(response)
+        client.metadata_cache.put(blob.path, {'name': 'blob-name'})
+
+        blob.update()
+
+        self.assertIsNone(client.metadata_cache.get(blob.path))
+        kw, = connection._requested
+        self.assertEqual(kw['method'], 'PUT')
+
+    def test_upload_from_string_invalidates_metadata_cache(self):
+        blob, client, _ = self._cached_blob_setup()
+        client.metadata_cache.put(blob.path, {'generation': '1'})
+        blob._do_upload = mock.Mock(
+            return_value={'generation': '2'}, spec=[])
+
+        blob.upload_from_string(b'data')
+
+        self.assertIsNone(client.metadata_cache.get(blob.path))
+        self.assertEqual(blob.generation, 2)
+
+    def test_open_write_invalidates_metadata_cache(self):
+        blob, client, _ = self._cached_blob_setup()
+        client.metadata_cache.put(blob.path, {'generation': '1'})
+        response = mock.Mock(spec=['json'])
+        response.json.return_value = {'generation': '2'}
+        blob._do_multipart_upload = mock.Mock(
+            return_value=response, spec=[])
+
+        with blob.open('wb') as writer:
+            writer.write(b'data')
+
+        self.assertIsNone(client.metadata_cache.get(blob.path))
+        self.assertEqual(blob.generation, 2)
+
     def test_delete(self):
         BLOB_NAME = 'blob-name'
         not_found_response = ({'status': http_client.NOT_FOUND}, b'')
@@ -564,6 +650,167 @@ class Test_Blob(unittest.TestCase):
             'GET', download_url, data=None, headers=headers)
         self.assertEqual(transport.request.mock_calls, [call, call])
 
+    def test__do_download_range_wo_chunk_size(self):
+        blob_name = 'blob-name'
+        client = mock.Mock(
+            _credentials=_make_credentials(), spec=['_credentials'])
+        bucket = _Bucket(client)
+        blob = self._make_one(blob_name, bucket=bucket)
+        self.assertIsNone(blob.chunk_size)
+
+        transport = mock.Mock(spec=['request'])
+        transport.request.return_value = self._mock_requests_response(
+            http_client.PARTIAL_CONTENT,
+            {'content-length': '3', 'content-range': 'bytes 2-4/6'},
+            content=b'cde')
+        file_obj = io.BytesIO()
+        download_url = 'http://test.invalid'
+        headers = {}
+        blob._do_download(
+            transport, file_obj, download_url, headers, start=2, end=4)
+        self.assertEqual(file_obj.getvalue(), b'cde')
+
+        # A single request covers the whole range.
+        transport.request.assert_called_once_with(
+            'GET', download_url, data=None, headers={'range': 'bytes=2-4'})
+
+    def test__do_download_range_wo_end(self):
+        from google.cloud.storage.blob import _DEFAULT_RANGE_CHUNK_SIZE
+
+        blob_name = 'blob-name'
+        client = mock.Mock(
+            _credentials=_make_credentials(), spec=['_credentials'])
+        bucket = _Bucket(client)
+        blob = self._make_one(blob_name, bucket=bucket)
+
+        transport = mock.Mock(spec=['request'])
+        transport.request.return_value = self._mock_requests_response(
+            http_client.PARTIAL_CONTENT,
+            {'content-length': '2', 'content-range': 'bytes 4-5/6'},
+            content=b'ef')
+        file_obj = io.BytesIO()
+        download_url = 'http://test.invalid'
+        headers = {}
+        blob._do_download(transport, file_obj, download_url, headers, start=4)
+        self.assertEqual(file_obj.getvalue(), b'ef')
+
+        expected_range = 'bytes=4-{:d}'.format(
+            4 + _DEFAULT_RANGE_CHUNK_SIZE - 1)
+        transport.request.assert_called_once_with(
+            'GET', download_url, data=None, headers={'range': expected_range})
+
+    def test__download_range(self):
+        blob_name = 'blob-name'
+        transport = mock.Mock(spec=['request'])
+        transport.request.return_value = self._mock_requests_response(
+            http_client.PARTIAL_CONTENT,
+            {'content-length': '2', 'content-range': 'bytes 1-2/6'},
+            content=b'bc')
+        client = mock.Mock(_http=transport, spec=[u'_http'])
+        bucket = _Bucket(client)
+        media_link = 'http://example.com/media/'
+        properties = {'mediaLink': media_link}
+        key = b'aa426195405adee2c8081bb9e7e74b19'
+        blob = self._make_one(
+            blob_name, bucket=bucket, properties=properties,
+            encryption_key=key)
+
+        file_obj = io.BytesIO()
+        blob._download_range(file_obj, 1, 2)
+        self.assertEqual(file_obj.getvalue(), b'bc')
+
+        headers = {
+            'X-Goog-Encryption-Key-Sha256':
+                'V3Kwe46nKc3xLv96+iJ707YfZfFvlObta8TQcx2gpm0=',
+            'X-Goog-Encryption-Algorithm': 'AES256',
+            'X-Goog-Encryption-Key':
+                'YWE0MjYxOTU0MDVhZGVlMmM4MDgxYmI5ZTdlNzRiMTk=',
+            'range': 'bytes=1-2',
+        }
+        transport.request.assert_called_once_with(
+            'GET', media_link, data=None, headers=headers)
+
+    def test__download_range_with_failure(self):
+        from google.cloud import exceptions
+
+        transport = mock.Mock(spec=['request'])
+        transport.request.return_value = self._mock_requests_response(
+            http_client.NOT_FOUND, {}, content=b'Not found')
+        client = mock.Mock(_http=transport, spec=[u'_http'])
+        bucket = _Bucket(client)
+        blob = self._make_one('blob-name', bucket=bucket)
+
+        with self.assertRaises(exceptions.NotFound):
+            blob._download_range(io.BytesIO(), 0, 2)
+
+    def test_open_binary(self):
+        from google.cloud.storage.fileio import BlobReader
+
+        client = object()
+        blob = self._make_one('blob-name', bucket=_Bucket())
+        reader = blob.open('rb', chunk_size=3, client=client)
+        self.assertIsInstance(reader, BlobReader)
+        self.assertIs(reader.blob, blob)
+        self.assertEqual(reader._chunk_size, 3)
+        self.assertIs(reader._client, client)
+
+    def test_open_binary_w_text_options(self):
+        blob = self._make_one('blob-name', bucket=_Bucket())
+        with self.assertRaises(ValueError):
+            blob.open('rb', encoding='utf-8')
+
+    def test_open_text(self):
+        from google.cloud.storage.fileio import BlobReader
+
+        blob = self._make_one('blob-name', bucket=_Bucket())
+        text = blob.open(encoding='utf-8', newline='')
+        self.assertIsInstance(text, io.TextIOWrapper)
+        self.assertIsInstance(text.buffer, BlobReader)
+        self.assertEqual(text.encoding, 'utf-8')
+
+    def test_open_binary_write(self):
+        from google.cloud.storage.fileio import BlobWriter
+
+        client = object()
+        blob = self._make_one('blob-name', bucket=_Bucket())
+        chunk_size = blob._CHUNK_SIZE_MULTIPLE
+        writer = blob.open('wb', chunk_size=chunk_size, client=client)
+        self.assertIsInstance(writer, BlobWriter)
+        self.assertIs(writer.blob, blob)
+        self.assertEqual(writer._chunk_size, chunk_size)
+        self.assertIs(writer._client, client)
+
+    def test_open_text_write(self):
+        from google.cloud.storage.fileio import BlobWriter
+
+        blob = self._make_one('blob-name', bucket=_Bucket())
+        text = blob.open('w', encoding='utf-8')
+        self.assertIsInstance(text, io.TextIOWrapper)
+        self.assertIsInstance(text.buffer, BlobWriter)
+
+    def test_open_text_write_w_exception(self):
+        blob = self._make_one('blob-name', bucket=_Bucket())
+        patch = mock.patch(
+            'google.cloud.storage.fileio.BlobWriter._finalize')
+        with patch as finalize:
+            with self.assertRaises(RuntimeError):
+                with blob.open('w') as text:
+                    text.write(u'partial')
+                    raise RuntimeError('boom')
+
+            self.assertTrue(text.closed)
+            finalize.assert_not_called()
+
+            # Without an exception, the upload is finalized.
+            with blob.open('w') as text:
+                text.write(u'complete')
+            finalize.assert_called_once_with()
+
+    def test_open_invalid_mode(self):
+        blob = self._make_one('blob-name', bucket=_Bucket())
+        with self.assertRaises(ValueError):
+            blob.open('a')
+
     def test_download_to_file_with_failure(self):
         from google.cloud import exceptions
 
@@ -614,14 +861,15 @@ class Test_Blob(unittest.TestCase):
             'name/o/blob-name?alt=media')
         self._check_session_mocks(client, transport, expected_url)
 
-    def _download_to_file_helper(self, use_chunks=False):
+    def _download_to_file_helper(self, use_chunks=False, hash_header=None,
+                                 properties=None):
         blob_name = 'blob-name'
         transport = self._mock_download_transport()
         # Create a fake client/bucket and use them in the Blob() constructor.
         client = mock.Mock(_http=transport, spec=[u'_http'])
         bucket = _Bucket(client)
         media_link = 'http://example.com/media/'
-        properties = {'mediaLink': media_link}
+        properties = dict(properties or {}, mediaLink=media_link)
         blob = self._make_one(blob_name, bucket=bucket, properties=properties)
         if use_chunks:
             # Modify the blob so there there will be 2 chunks of size 3.
@@ -629,17 +877,23 @@ class Test_Blob(unittest.TestCase):
             blob.chunk_size = 3
         else:
             # Modify the response.
+            response_headers = {
+                'content-length': '6', 'content-range': 'bytes 0-5/6'}
+            if hash_header is not None:
+                response_headers['x-goog-hash'] = hash_header
             single_chunk_response = self._mock_requests_response(
-                http_client.OK,
-                {'content-length': '6', 'content-range': 'bytes 0-5/6'},
-                content=b'abcdef',
+                http_client.OK, response_headers, content=b'abcdef',
                 stream=True,
             )
             transport.request.side_effect = [single_chunk_response]
 
         file_obj = io.BytesIO()
-        blob.download_to_file(file_obj)
+        with mock.patch(
+                'google.cloud.storage.checksum.md5',
+                side_effect=hashlib.md5) as md5:
+            blob.download_to_file(file_obj)
         self.assertEqual(file_obj.getvalue(), b'abcdef')
+        self.assertEqual(blob.transfer_checksums.size, 6)
 
         if use_chunks:
             self._check_session_mocks(client, transport, media_link)
@@ -647,12 +901,37 @@ class Test_Blob(unittest.TestCase):
             transport.request.assert_called_once_with(
                 'GET', media_link, data=None,
                 headers={'accept-encoding': 'gzip'}, stream=True)
+        return blob, md5
 
     def test_download_to_file_default(self):
-        self._download_to_file_helper()
+        blob, md5 = self._download_to_file_helper()
+
+        # Nothing to compare an MD5 hash with.
+        self.assertIsNone(blob.transfer_checksums.md5_hash)
+        md5.assert_not_called()
+
+    def test_download_to_file_w_hash_header(self):
+        expected = _base64_md5(b'abcdef')
+        blob, md5 = self._download_to_file_helper(
+            hash_header='crc32c=AAAAAA==,md5=' + expected)
+
+        # The hash checked by ``Download`` is not computed again.
+        self.assertEqual(blob.transfer_checksums.md5_hash, expected)
+        md5.assert_not_called()
 
     def test_download_to_file_with_chunk_size(self):
-        self._download_to_file_helper(use_chunks=True)
+        blob, _ = self._download_to_file_helper(use_chunks=True)
+
+        self.assertEqual(
+            blob.transfer_checksums.md5_hash, _base64_md5(b'abcdef'))
+
+    def test_download_to_file_with_chunk_size_wo_md5(self):
+        # A composite object only has a CRC32C checksum.
+        blob, md5 = self._download_to_file_helper(
+            use_chunks=True, properties={'crc32c': 'AAAAAA=='})
+
+        self.assertIsNone(blob.transfer_checksums.md5_hash)
+        md5.assert_not_called()
 
     def _download_to_filename_helper(self, updated=None):
         import os
@@ -831,6 +1110,320 @@ class Test_Blob(unittest.TestCase):
 
         self._check_session_mocks(client, transport, media_link)
 
+    def _download_range_setup(self, content, content_range, size=None):
+        transport = mock.Mock(spec=['request'])
+        transport.request.return_value = self._mock_requests_response(
+            http_client.PARTIAL_CONTENT,
+            {'content-length': str(len(content)),
+             'content-range': content_range},
+            content=content)
+        client = mock.Mock(_http=transport, spec=['_http'])
+        bucket = _Bucket(client)
+        media_link = 'http://example.com/media/'
+        properties = {'mediaLink': media_link}
+        if size is not None:
+            properties['size'] = str(size)
+        blob = self._make_one(
+            'blob-name', bucket=bucket, properties=properties)
+        return blob, transport, media_link
+
+    def test_download_to_file_w_range(self):
+        blob, transport, media_link = self._download_range_setup(
+            b'cd', 'bytes 2-3/6')
+        file_obj = io.BytesIO()
+
+        blob.download_to_file(file_obj, start=2, end=3)
+
+        self.assertEqual(file_obj.getvalue(), b'cd')
+        self.assertEqual(blob.transfer_checksums.size, 2)
+        # The MD5 hash of a range cannot be compared with the blob's.
+        self.assertIsNone(blob.transfer_checksums.md5_hash)
+        # The stored bytes are requested: no ``accept-encoding`` header.
+        transport.request.assert_called_once_with(
+            'GET', media_link, data=None, headers={'range': 'bytes=2-3'})
+
+    def test_download_to_file_w_start_only(self):
+        from google.cloud.storage.blob import _DEFAULT_RANGE_CHUNK_SIZE
+
+        blob, transport, media_link = self._download_range_setup(
+            b'def', 'bytes 3-5/6')
+        file_obj = io.BytesIO()
+
+        blob.download_to_file(file_obj, start=3)
+
+        self.assertEqual(file_obj.getvalue(), b'def')
+        expected_range = 'bytes=3-{}'.format(_DEFAULT_RANGE_CHUNK_SIZE + 2)
+        transport.request.assert_called_once_with(
+            'GET', media_link, data=None, headers={'range': expected_range})
+
+    def test_download_to_file_w_end_only(self):
+        blob, transport, media_link = self._download_range_setup(
+            b'abc', 'bytes 0-2/6')
+        file_obj = io.BytesIO()
+
+        blob.download_to_file(file_obj, end=2)
+
+        self.assertEqual(file_obj.getvalue(), b'abc')
+        transport.request.assert_called_once_with(
+            'GET', media_link, data=None, headers={'range': 'bytes=0-2'})
+
+    def test_download_to_file_w_end_before_start(self):
+        blob, transport, _ = self._download_range_setup(b'', 'bytes */6')
+
+        with self.assertRaises(ValueError):
+            blob.download_to_file(io.BytesIO(), start=4, end=3)
+
+        transport.request.assert_not_called()
+
+    def test_download_to_file_w_negative_start_and_end(self):
+        blob, transport, _ = self._download_range_setup(b'', 'bytes */6')
+
+        with self.assertRaises(ValueError):
+            blob.download_to_file(io.BytesIO(), start=-2, end=5)
+
+        transport.request.assert_not_called()
+
+    def test_download_as_string_w_negative_start(self):
+        blob, transport, media_link = self._download_range_setup(
+            b'ef', 'bytes 4-5/6', size=6)
+
+        fetched = blob.download_as_string(start=-2)
+
+        self.assertEqual(fetched, b'ef')
+        headers = transport.request.call_args[1]['headers']
+        self.assertTrue(headers['range'].startswith('bytes=4-'))
+
+    def test_download_as_string_w_negative_start_wo_size(self):
+        blob, transport, _ = self._download_range_setup(
+            b'abcdef', 'bytes 0-5/6')
+
+        def reload(client=None):
+            blob._properties['size'] = '6'
+
+        with mock.patch.object(blob, 'reload', side_effect=reload) as patched:
+            fetched = blob.download_as_string(start=-10)
+
+        self.assertEqual(fetched, b'abcdef')
+        patched.assert_called_once_with(client=None)
+        headers = transport.request.call_args[1]['headers']
+        self.assertTrue(headers['range'].startswith('bytes=0-'))
+
+    def test_download_as_string_w_negative_start_empty_blob(self):
+        blob, transport, _ = self._download_range_setup(
+            b'', 'bytes */0', size=0)
+
+        fetched = blob.download_as_string(start=-8)
+
+        self.assertEqual(fetched, b'')
+        transport.request.assert_not_called()
+
+    def test_download_as_string_w_range_empty_blob_wo_size(self):
+        blob, transport, _ = self._download_range_setup(b'', 'bytes */0')
+        transport.request.return_value.status_code = (
+            http_client.REQUESTED_RANGE_NOT_SATISFIABLE)
+
+        fetched = blob.download_as_string(end=10)
+
+        self.assertEqual(fetched, b'')
+        transport.request.assert_called_once()
+
+    def test_download_as_string_w_range_not_satisfiable(self):
+        from google.cloud import exceptions
+
+        blob, transport, _ = self._download_range_setup(b'', 'bytes */6')
+        transport.request.return_value.status_code = (
+            http_client.REQUESTED_RANGE_NOT_SATISFIABLE)
+
+        with self.assertRaises(exceptions.RequestRangeNotSatisfiable):
+            blob.download_as_string(start=10)
+
+    def test_download_to_filename_w_range(self):
+        import os
+        import time
+        from google.cloud._testing import _NamedTemporaryFile
+
+        blob, transport, media_link = self._download_range_setup(
+            b'cd', 'bytes 2-3/6')
+        blob._properties['updated'] = '2014-12-06T13:13:50.690Z'
+
+        with _NamedTemporaryFile() as temp:
+            blob.download_to_filename(temp.name, start=2, end=3)
+            with open(temp.name, 'rb') as file_obj:
+                wrote = file_obj.read()
+            mtime = os.path.getmtime(temp.name)
+
+        self.assertEqual(wrote, b'cd')
+        # A partial copy does not carry the blob's timestamp.
+        self.assertNotEqual(mtime, time.mktime(blob.updated.timetuple()))
+        transport.request.assert_called_once_with(
+            'GET', media_link, data=None, headers={'range': 'bytes=2-3'})
+
+    def _download_gzip_helper(self, data):
+        compressed = _gzip(data)
+        split = len(compressed) // 2
+        total = len(compressed)
+        transport = mock.Mock(spec=['request'])
+        transport.request.side_effect = [
+            self._mock_requests_response(
+                http_client.PARTIAL_CONTENT,
+                {'content-length': str(split),
+                 'content-range': 'bytes 0-{}/{}'.format(split - 1, total)},
+                content=compressed[:split]),
+            self._mock_requests_response(
+                http_client.PARTIAL_CONTENT,
+                {'content-length': str(total - split),
+                 'content-range': 'bytes {}-{}/{}'.format(
+                     split, total - 1, total)},
+                content=compressed[split:]),
+        ]
+        client = mock.Mock(_http=transport, spec=['_http'])
+        properties = {'mediaLink': 'http://example.com/media/'}
+        blob = self._make_one(
+            'blob-name', bucket=_Bucket(client), properties=properties)
+        blob._CHUNK_SIZE_MULTIPLE = 1
+        blob.chunk_size = split
+        return blob, compressed
+
+    def test_download_as_string_w_decompress(self):
+        data = b'Hello, gzip! ' * 50
+        blob, compressed = self._download_gzip_helper(data)
+
+        fetched = blob.download_as_string(decompress=True)
+
+        self.assertEqual(fetched, data)
+        # The checksums describe the bytes received.
+        self.assertEqual(blob.transfer_checksums.size, len(compressed))
+        self.assertEqual(
+            blob.transfer_checksums.md5_hash, _base64_md5(compressed))
+
+    def test_download_to_file_w_decompress_and_range(self):
+        blob = self._make_one('blob-name', bucket=None)
+
+        with self.assertRaises(ValueError):
+            blob.download_to_file(io.BytesIO(), start=1, decompress=True)
+
+    def _download_into_setup(self, size=None):
+        transport = self._mock_download_transport()
+        client = mock.Mock(_http=transport, spec=['_http'])
+        bucket = _Bucket(client)
+        media_link = 'http://example.com/media/'
+        properties = {'mediaLink': media_link}
+        if size is not None:
+            properties['size'] = str(size)
+        blob = self._make_one(
+            'blob-name', bucket=bucket, properties=properties)
+        # Modify the blob so there there will be 2 chunks of size 3.
+        blob._CHUNK_SIZE_MULTIPLE = 1
+        blob.chunk_size = 3
+        return blob, client, transport, media_link
+
+    def test_download_into(self):
+        blob, client, transport, media_link = self._download_into_setup()
+        buffer = bytearray(8)
+
+        written = blob.download_into(memoryview(buffer))
+
+        self.assertEqual(written, 6)
+        self.assertEqual(buffer, bytearray(b'abcdef\x00\x00'))
+        self.assertEqual(blob.transfer_checksums.size, 6)
+        self._check_session_mocks(client, transport, media_link)
+
+    def test_download_into_w_size_too_small(self):
+        blob, _, transport, _ = self._download_into_setup(size=6)
+
+        with self.assertRaises(ValueError):
+            blob.download_into(bytearray(5))
+
+        transport.request.assert_not_called()
+
+    def test_download_into_overflow(self):
+        blob, _, _, _ = self._download_into_setup()
+        buffer = bytearray(4)
+
+        with self.assertRaises(ValueError):
+            blob.download_into(buffer)
+
+        self.assertEqual(buffer, bytearray(b'abc\x00'))
+
+    def test_download_into_read_only(self):
+        blob, _, transport, _ = self._download_into_setup()
+
+        with self.assertRaises(ValueError):
+            blob.download_into(b'\x00' * 6)
+
+        transport.request.assert_not_called()
+
+    @unittest.skipIf(six.PY2, 'Requires memoryview.cast')
+    def test_download_into_w_wide_items(self):
+        import array
+
+        blob, client, transport, media_link = self._download_into_setup(
+            size=6)
+        buffer = array.array('i', [0, 0])
+
+        written = blob.download_into(buffer)
+
+        # The capacity is counted in bytes (8), not items (2).
+        self.assertEqual(written, 6)
+        self.assertEqual(buffer.tobytes(), b'abcdef\x00\x00')
+        self._check_session_mocks(client, transport, media_link)
+
+    @unittest.skipIf(six.PY2, 'Requires memoryview.cast')
+    def test_download_into_w_wide_items_too_small(self):
+        import array
+
+        blob, _, transport, _ = self._download_into_setup(size=6)
+
+        with self.assertRaises(ValueError):
+            blob.download_into(array.array('h', [0, 0]))
+
+        transport.request.assert_not_called()
+
+    @unittest.skipIf(six.PY2, 'Requires memoryview.cast')
+    def test_download_into_not_contiguous(self):
+        import array
+
+        blob, _, transport, _ = self._download_into_setup()
+
+        with self.assertRaises(ValueError):
+            blob.download_into(memoryview(array.array('i', [0] * 4))[::2])
+
+        transport.request.assert_not_called()
+
+    def test_download_as_memoryview(self):
+        blob, client, transport, media_link = self._download_into_setup(
+            size=6)
+
+        fetched = blob.download_as_memoryview()
+
+        self.assertIsInstance(fetched, memoryview)
+        self.assertEqual(fetched.tobytes(), b'abcdef')
+        self._check_session_mocks(client, transport, media_link)
+
+    def test_download_as_memoryview_wo_size(self):
+        blob, client, transport, media_link = self._download_into_setup()
+
+        def _reload(client=None):
+            blob._properties['size'] = '6'
+
+        blob.reload = mock.Mock(side_effect=_reload, spec=[])
+
+        fetched = blob.download_as_memoryview(client=client)
+
+        blob.reload.assert_called_once_with(client=client)
+        self.assertEqual(fetched.tobytes(), b'abcdef')
+
+    def test_download_as_memoryview_w_gzip(self):
+        blob = self._make_one('blob-name', bucket=None, properties={
+            'size': '3', 'contentEncoding': 'gzip'})
+        blob.download_as_string = mock.Mock(
+            return_value=b'abcdef', spec=[])
+
+        fetched = blob.download_as_memoryview()
+
+        self.assertEqual(fetched.tobytes(), b'abcdef')
+        blob.download_as_string.assert_called_once_with(client=None)
+
     def test__get_content_type_explicit(self):
         blob = self._make_one(u'blob-name', bucket=None)
 
@@ -949,6 +1542,8 @@ class Test_Blob(unittest.TestCase):
         else:
             data_read = data[:size]
             self.assertEqual(stream.tell(), size)
+        self.assertEqual(
+            blob.transfer_checksums.md5_hash, _base64_md5(data_read))
 
         mock_get_boundary.assert_called_once_with()
 
@@ -1212,6 +1807,9 @@ class Test_Blob(unittest.TestCase):
         # Check the returned values.
         self.assertIs(response, responses[2])
         self.assertEqual(stream.tell(), total_bytes)
+        self.assertEqual(blob.transfer_checksums.size, total_bytes)
+        self.assertEqual(
+            blob.transfer_checksums.md5_hash, _base64_md5(data))
 
         # Check the mocks.
         call0 = self._do_resumable_upload_call0(blob, content_type, size=size)
@@ -1231,6 +1829,165 @@ class Test_Blob(unittest.TestCase):
     def test__do_resumable_upload_with_retry(self):
         self._do_resumable_helper(num_retries=6)
 
+    def test__do_resumable_upload_w_session_file(self):
+        import os
+        import tempfile
+        from google.cloud.storage import blob as blob_module
+
+        bucket = _Bucket(name='yesterday')
+        blob = self._make_one(u'blob-name', bucket=bucket)
+        self.assertIsNone(blob.chunk_size)
+        chunk_size = blob._CHUNK_SIZE_MULTIPLE
+        data = b'<html>' + (b'A' * chunk_size) + b'</html>'
+        total_bytes = len(data)
+
+        resumable_url = 'http://test.invalid?upload_id=and-then-there-was-1'
+        headers1 = {'location': resumable_url}
+        headers2 = {'range': 'bytes=0-{:d}'.format(chunk_size - 1)}
+        transport, responses = self._make_resumable_transport(
+            headers1, headers2, {}, total_bytes)
+        session_file = os.path.join(tempfile.mkdtemp(), 'session.json')
+        states = []
+
+        def request(*args, **kwargs):
+            # Record the session state before each chunk is sent.
+            if args[0] == 'PUT':
+                with open(session_file) as state_file:
+                    states.append(json.load(state_file))
+            return responses[len(transport.request.mock_calls) - 1]
+
+        transport.request.side_effect = request
+        client = mock.Mock(_http=transport, spec=['_http'])
+        stream = io.BytesIO(data)
+
+        patch = mock.patch.object(
+            blob_module, '_DEFAULT_SESSION_CHUNK_SIZE', new=chunk_size)
+        with patch:
+            response = blob._do_resumable_upload(
+                client, stream, u'text/html', total_bytes, None,
+                session_file=session_file)
+
+        self.assertIs(response, responses[2])
+        self.assertFalse(os.path.exists(session_file))
+        expected_state = {
+            'bucket': 'yesterday',
+            'name': 'blob-name',
+            'resumable_url': resumable_url,
+            'chunk_size': chunk_size,
+            'total_bytes': total_bytes,
+            'bytes_uploaded': 0,
+            'content_type': u'text/html',
+        }
+        self.assertEqual(states[0], expected_state)
+        expected_state['bytes_uploaded'] = chunk_size
+        self.assertEqual(states[1], expected_state)
+        os.rmdir(os.path.dirname(session_file))
+
+    def _resume_upload_helper(self, state=None):
+        import os
+        import tempfile
+
+        bucket = _Bucket(name='yesterday')
+        blob = self._make_one(u'blob-name', bucket=bucket)
+        if state is None:
+            state = {
+                'bucket': 'yesterday',
+                'name': 'blob-name',
+                'resumable_url': 'http://test.invalid?upload_id=abc',
+                'chunk_size': 4,
+                'total_bytes': 10,
+                'bytes_uploaded': 0,
+                'content_type': u'text/plain',
+            }
+        fd, session_file = tempfile.mkstemp()
+        with os.fdopen(fd, 'w') as state_file:
+            json.dump(state, state_file)
+        # Allow tiny chunks.
+        patch = mock.patch('google.resumable_media.UPLOAD_CHUNK_SIZE', new=2)
+        patch.start()
+        self.addCleanup(patch.stop)
+        self.addCleanup(
+            lambda: os.path.exists(session_file) and os.remove(session_file))
+        return blob, session_file
+
+    def test_resume_upload(self):
+        import os
+        from google import resumable_media
+
+        blob, session_file = self._resume_upload_helper()
+        resumable_url = 'http://test.invalid?upload_id=abc'
+        transport = mock.Mock(spec=['request'])
+        transport.request.side_effect = [
+            # The server committed the first chunk only.
+            self._mock_requests_response(
+                resumable_media.PERMANENT_REDIRECT, {'range': 'bytes=0-3'}),
+            self._mock_requests_response(
+                resumable_media.PERMANENT_REDIRECT, {'range': 'bytes=0-7'}),
+            self._mock_requests_response(
+                http_client.OK, {}, content=b'{"size": "10"}'),
+        ]
+        client = mock.Mock(_http=transport, spec=['_http'])
+        stream = io.BytesIO(b'0123456789')
+
+        blob.resume_upload(stream, session_file, client=client)
+
+        self.assertEqual(blob.size, 10)
+        self.assertFalse(os.path.exists(session_file))
+        self.assertEqual(transport.request.mock_calls, [
+            mock.call(
+                'PUT', resumable_url, data=None,
+                headers={'content-range': 'bytes */*'}),
+            mock.call(
+                'PUT', resumable_url, data=b'4567',
+                headers={
+                    'content-type': u'text/plain',
+                    'content-range': 'bytes 4-7/10',
+                }),
+            mock.call(
+                'PUT', resumable_url, data=b'89',
+                headers={
+                    'content-type': u'text/plain',
+                    'content-range': 'bytes 8-9/10',
+                }),
+        ])
+
+    def test_resume_upload_already_complete(self):
+        import os
+
+        blob, session_file = self._resume_upload_helper()
+        transport = mock.Mock(spec=['request'])
+        transport.request.return_value = self._mock_requests_response(
+            http_client.OK, {}, content=b'{"size": "10"}')
+        client = mock.Mock(_http=transport, spec=['_http'])
+
+        blob.resume_upload(io.BytesIO(b'0123456789'), session_file, client)
+
+        self.assertEqual(blob.size, 10)
+        self.assertFalse(os.path.exists(session_file))
+        transport.request.assert_called_once()
+
+    def test_resume_upload_expired(self):
+        import os
+        from google.cloud import exceptions
+
+        blob, session_file = self._resume_upload_helper()
+        transport = mock.Mock(spec=['request'])
+        transport.request.return_value = self._mock_requests_response(
+            http_client.NOT_FOUND, {})
+        client = mock.Mock(_http=transport, spec=['_http'])
+
+        with self.assertRaises(exceptions.NotFound):
+            blob.resume_upload(io.BytesIO(b''), session_file, client)
+
+        self.assertTrue(os.path.exists(session_file))
+
+    def test_resume_upload_other_blob(self):
+        blob, session_file = self._resume_upload_helper(state={
+            'bucket': 'yesterday', 'name': 'other'})
+
+        with self.assertRaises(ValueError):
+            blob.resume_upload(io.BytesIO(b''), session_file)
+
     def _do_upload_helper(self, chunk_size=None, num_retries=None):
         blob = self._make_one(u'blob-name', bucket=None)
 
@@ -1276,6 +2033,59 @@ class Test_Blob(unittest.TestCase):
     def test__do_upload_with_retry(self):
         self._do_upload_helper(num_retries=20)
 
+    def _do_upload_adaptive_helper(self, size):
+        blob = self._make_one(u'blob-name', bucket=None)
+        blob.adaptive_chunk_size = True
+        response = mock.Mock(spec=[u'json'])
+        blob._do_multipart_upload = mock.Mock(return_value=response, spec=[])
+        blob._do_resumable_upload = mock.Mock(return_value=response, spec=[])
+
+        blob._do_upload(
+            mock.sentinel.client, mock.sentinel.stream, None, size, None)
+        return blob
+
+    def test__do_upload_adaptive_small(self):
+        blob = self._do_upload_adaptive_helper(1024)
+        blob._do_multipart_upload.assert_called_once()
+        blob._do_resumable_upload.assert_not_called()
+
+    def test__do_upload_adaptive_large(self):
+        blob = self._do_upload_adaptive_helper(64 * 1024 * 1024)
+        blob._do_multipart_upload.assert_not_called()
+        blob._do_resumable_upload.assert_called_once()
+
+    def test__do_upload_adaptive_wo_size(self):
+        blob = self._do_upload_adaptive_helper(None)
+        blob._do_resumable_upload.assert_called_once()
+
+    def test__finish_resumable_upload_adaptive(self):
+        from google.cloud.storage import blob as blob_module
+
+        mb = 1024 * 1024
+        blob = self._make_one(u'blob-name', bucket=None)
+        blob.adaptive_chunk_size = True
+        upload = _FakeResumableUpload(chunk_size=mb, total_bytes=20 * mb)
+        # Each chunk takes one second, so the chunks keep doubling (the
+        # 5-second target is never reached) until the data runs out.
+        clock = iter(range(100))
+
+        patch = mock.patch.object(
+            blob_module, '_monotonic', new=lambda: next(clock))
+        with patch:
+            response = blob._finish_resumable_upload(upload, None)
+
+        self.assertIs(response, mock.sentinel.response)
+        self.assertEqual(
+            upload.sent, [mb, 2 * mb, 4 * mb, 8 * mb, 5 * mb])
+
+    def test__finish_resumable_upload_fixed(self):
+        blob = self._make_one(u'blob-name', bucket=None)
+        upload = _FakeResumableUpload(chunk_size=4, total_bytes=10)
+
+        blob._finish_resumable_upload(upload, None)
+
+        self.assertEqual(upload.sent, [4, 4, 2])
+
     def _upload_from_file_helper(self, side_effect=None, **kwargs):
         from google.cloud._helpers import UTC
 
@@ -1327,6 +2137,75 @@ class Test_Blob(unittest.TestCase):
         stream = self._upload_from_file_helper(rewind=True)
         assert stream.tell() == 0
 
+    def test_upload_from_file_w_session_file(self):
+        blob = self._make_one('blob-name', bucket=None)
+        response = mock.Mock(spec=['json'])
+        response.json.return_value = {'size': '3'}
+        blob._do_resumable_upload = mock.Mock(
+            return_value=response, spec=[])
+        blob._do_upload = mock.Mock(spec=[])
+        stream = io.BytesIO(b'abc')
+        client = mock.sentinel.client
+
+        blob.upload_from_file(
+            stream, client=client, size=3, session_file='session.json')
+
+        self.assertEqual(blob.size, 3)
+        blob._do_upload.assert_not_called()
+        blob._do_resumable_upload.assert_called_once_with(
+            client, stream, None, 3, None, session_file='session.json')
+
+    def test_upload_from_file_w_compress(self):
+        blob = self._make_one('blob-name', bucket=None)
+        uploaded = []
+
+        def do_upload(client, stream, content_type, size, num_retries):
+            # The metadata sent with the upload carries the encoding.
+            self.assertEqual(blob.content_encoding, 'gzip')
+            uploaded.append(stream.read())
+            return {'contentEncoding': 'gzip'}
+
+        blob._do_upload = mock.Mock(side_effect=do_upload, spec=[])
+        data = b'abcdef' * 100
+        stream = io.BytesIO(data + b'not uploaded')
+
+        blob.upload_from_file(
+            stream, size=len(data), client=mock.sentinel.client,
+            compress=True)
+
+        self.assertEqual(_gunzip(uploaded[0]), data)
+        self.assertLess(len(uploaded[0]), len(data))
+        # The compressed size is unknown up front.
+        self.assertIsNone(blob._do_upload.call_args[0][3])
+
+    def test_upload_from_file_w_compress_failure(self):
+        from google.cloud import exceptions
+
+        blob = self._make_one('blob-name', bucket=None)
+        blob.content_encoding = 'identity'
+        blob._do_upload = mock.Mock(
+            side_effect=exceptions.ServiceUnavailable('down'), spec=[])
+
+        with self.assertRaises(exceptions.ServiceUnavailable):
+            blob.upload_from_file(
+                io.BytesIO(b'abc'), client=mock.sentinel.client,
+                compress=True)
+
+        # The blob keeps the encoding it had before the upload.
+        self.assertEqual(blob.content_encoding, 'identity')
+        self.assertEqual(blob._changes, set(['contentEncoding']))
+
+    def test_upload_from_file_w_compress_and_session_file(self):
+        blob = self._make_one('blob-name', bucket=None)
+        blob._do_upload = mock.Mock(spec=[])
+
+        with self.assertRaises(ValueError):
+            blob.upload_from_file(
+                io.BytesIO(b'abc'), compress=True,
+                session_file='session.json')
+
+        blob._do_upload.assert_not_called()
+
     def test_upload_from_file_failure(self):
         import requests
 
@@ -1392,6 +2271,41 @@ class Test_Blob(unittest.TestCase):
         self.assertEqual(stream.mode, 'rb')
         self.assertEqual(stream.name, temp.name)
 
+    def test_upload_from_filename_w_session_file(self):
+        from google.cloud._testing import _NamedTemporaryFile
+
+        blob = self._make_one('blob-name', bucket=None)
+        blob.upload_from_file = mock.Mock(spec=[])
+
+        with _NamedTemporaryFile() as temp:
+            with open(temp.name, 'wb') as file_obj:
+                file_obj.write(b'abc')
+
+            blob.upload_from_filename(
+                temp.name, content_type=u'text/plain',
+                session_file='session.json')
+
+        call_kwargs = blob.upload_from_file.call_args[1]
+        self.assertEqual(call_kwargs['session_file'], 'session.json')
+        self.assertEqual(call_kwargs['size'], 3)
+
+    def test_upload_from_filename_w_compress(self):
+        from google.cloud._testing import _NamedTemporaryFile
+
+        blob = self._make_one('blob-name', bucket=None)
+        blob.upload_from_file = mock.Mock(spec=[])
+
+        with _NamedTemporaryFile() as temp:
+            with open(temp.name, 'wb') as file_obj:
+                file_obj.write(b'abc')
+
+            blob.upload_from_filename(
+                temp.name, content_type=u'text/plain', compress=True)
+
+        call_kwargs = blob.upload_from_file.call_args[1]
+        self.assertTrue(call_kwargs['compress'])
+        self.assertNotIn('session_file', call_kwargs)
+
     def _upload_from_string_helper(self, data, **kwargs):
         from google.cloud._helpers import _to_bytes
 
@@ -2454,6 +3368,217 @@ class Test_Blob(unittest.TestCase):
         self.assertIsNone(blob.updated)
 
 
+class TestBlobRecord(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage.blob import BlobRecord
+
+        return BlobRecord
+
+    def test_from_api_repr(self):
+        from google.cloud._helpers import UTC
+
+        resource = {
+            'name': 'blob-name',
+            'size': '1024',
+            'generation': '1512565576797178',
+            'updated': '2017-01-01T09:09:09.081Z',
+            'crc32c': 'AAAAAA==',
+            'md5Hash': 'MTIz',
+            'contentType': 'text/plain',
+        }
+        record = self._get_target_class().from_api_repr(resource)
+
+        self.assertEqual(record.name, 'blob-name')
+        self.assertEqual(record.size, 1024)
+        self.assertEqual(record.generation, 1512565576797178)
+        self.assertEqual(
+            record.updated,
+            datetime.datetime(2017, 1, 1, 9, 9, 9, 81000, tzinfo=UTC))
+        self.assertEqual(record.crc32c, 'AAAAAA==')
+        self.assertEqual(record.md5_hash, 'MTIz')
+        self.assertFalse(hasattr(record, '__dict__'))
+
+    def test_from_api_repr_name_only(self):
+        record = self._get_target_class().from_api_repr({'name': 'b'})
+
+        self.assertEqual(record.name, 'b')
+        self.assertIsNone(record.size)
+        self.assertIsNone(record.generation)
+        self.assertIsNone(record.updated)
+        self.assertIsNone(record.crc32c)
+        self.assertIsNone(record.md5_hash)
+
+    def test___repr__(self):
+        record = self._get_target_class()('b', size=3, generation=4)
+        self.assertEqual(repr(record), '<BlobRecord: b, 3, 4>')
+
+
+class Test__AdaptiveChunkSizer(unittest.TestCase):
+
+    MB = 1024 * 1024
+
+    @staticmethod
+    def _make_one(chunk_size):
+        from google.cloud.storage.blob import _AdaptiveChunkSizer
+
+        return _AdaptiveChunkSizer(chunk_size)
+
+    def test_grows_at_most_twofold(self):
+        sizer = self._make_one(self.MB)
+        self.assertEqual(sizer.update(self.MB, 0.001), 2 * self.MB)
+        self.assertEqual(sizer.chunk_size, 2 * self.MB)
+
+    def test_wo_elapsed_time(self):
+        sizer = self._make_one(self.MB)
+        self.assertEqual(sizer.update(self.MB, 0.0), 2 * self.MB)
+
+    def test_shrinks_to_target(self):
+        sizer = self._make_one(16 * self.MB)
+        # 1 MB/s: the next chunk should take 5 seconds.
+        self.assertEqual(sizer.update(16 * self.MB, 16.0), 5 * self.MB)
+
+    def test_rounds_down_to_multiple(self):
+        sizer = self._make_one(4 * self.MB)
+        size = sizer.update(self.MB, 3.0)
+        self.assertEqual(size % (256 * 1024), 0)
+        self.assertLessEqual(size, self.MB * 5 // 3)
+
+    def test_bounds(self):
+        from google.cloud.storage.blob import _MAX_ADAPTIVE_CHUNK_SIZE
+        from google.cloud.storage.blob import _MIN_ADAPTIVE_CHUNK_SIZE
+
+        sizer = self._make_one(_MAX_ADAPTIVE_CHUNK_SIZE)
+        self.assertEqual(
+            sizer.update(_MAX_ADAPTIVE_CHUNK_SIZE, 1.0),
+            _MAX_ADAPTIVE_CHUNK_SIZE)
+        self.assertEqual(sizer.update(1, 100.0), _MIN_ADAPTIVE_CHUNK_SIZE)
+
+    def test_nothing_committed(self):
+        from google.cloud.storage.blob import _MIN_ADAPTIVE_CHUNK_SIZE
+
+        sizer = self._make_one(8 * self.MB)
+        self.assertEqual(sizer.update(0, 30.0), _MIN_ADAPTIVE_CHUNK_SIZE)
+
+
+class Test__set_chunk_size(unittest.TestCase):
+
+    @staticmethod
+    def _call_fut(upload, chunk_size):
+        from google.cloud.storage.blob import _set_chunk_size
+
+        return _set_chunk_size(upload, chunk_size)
+
+    def test_resumable_upload(self):
+        from google.resumable_media.requests import ResumableUpload
+
+        multiple = 256 * 1024
+        upload = ResumableUpload(u'http://example.com/', multiple)
+        self.assertTrue(self._call_fut(upload, 4 * multiple))
+        self.assertEqual(upload.chunk_size, 4 * multiple)
+
+    def test_not_multiple(self):
+        upload = _FakeResumableUpload(chunk_size=256 * 1024, total_bytes=0)
+        with self.assertRaises(ValueError):
+            self._call_fut(upload, 1000)
+        self.assertEqual(upload.chunk_size, 256 * 1024)
+
+    def test_wo_private_field(self):
+        upload = mock.Mock(chunk_size=256 * 1024, spec=['chunk_size'])
+        self.assertFalse(self._call_fut(upload, 512 * 1024))
+        self.assertEqual(upload.chunk_size, 256 * 1024)
+
+
+class Test__GzipReader(unittest.TestCase):
+
+    @staticmethod
+    def _make_one(stream, size=None):
+        from google.cloud.storage.blob import _GzipReader
+
+        return _GzipReader(stream, size)
+
+    def test_read_in_pieces(self):
+        from google.cloud.storage import blob as blob_module
+
+        data = b'0123456789' * 1000
+        reader = self._make_one(io.BytesIO(data))
+        self.assertEqual(reader.tell(), 0)
+
+        pieces = []
+        with mock.patch.object(blob_module, '_GZIP_READ_BLOCK_SIZE', new=7):
+            piece = reader.read(5)
+            while piece:
+                # Only the final piece can be short.
+                self.assertEqual(len(piece), 5)
+                pieces.append(piece)
+                piece = reader.read(5)
+                if len(piece) < 5:
+                    pieces.append(piece)
+                    break
+
+        compressed = b''.join(pieces)
+        self.assertEqual(reader.tell(), len(compressed))
+        self.assertEqual(reader.read(5), b'')
+        self.assertEqual(_gunzip(compressed), data)
+
+    def test_read_w_size(self):
+        reader = self._make_one(io.BytesIO(b'abcdef'), size=3)
+        self.assertEqual(_gunzip(reader.read()), b'abc')
+
+    def test_deterministic(self):
+        first = self._make_one(io.BytesIO(b'abc')).read()
+        second = self._make_one(io.BytesIO(b'abc')).read()
+        self.assertEqual(first, second)
+
+
+class Test__GunzipWriter(unittest.TestCase):
+
+    @staticmethod
+    def _make_one(stream):
+        from google.cloud.storage.blob import _GunzipWriter
+
+        return _GunzipWriter(stream)
+
+    def _write_all(self, data, piece_size=1):
+        stream = io.BytesIO()
+        writer = self._make_one(stream)
+        for index in range(0, len(data), piece_size):
+            piece = data[index:index + piece_size]
+            self.assertEqual(writer.write(piece), len(piece))
+        writer.finish()
+        return stream.getvalue()
+
+    def test_inflate(self):
+        data = b'inflate me ' * 100
+        self.assertEqual(self._write_all(_gzip(data)), data)
+
+    def test_concatenated_members(self):
+        compressed = _gzip(b'first, ') + _gzip(b'second')
+        self.assertEqual(
+            self._write_all(compressed, piece_size=1000), b'first, second')
+
+    def test_passthrough(self):
+        self.assertEqual(self._write_all(b'plain text'), b'plain text')
+
+    def test_passthrough_short(self):
+        self.assertEqual(self._write_all(b'x'), b'x')
+        self.assertEqual(self._write_all(b''), b'')
+
+    def test_truncated(self):
+        writer = self._make_one(io.BytesIO())
+        writer.write(_gzip(b'abcdef' * 10)[:-6])
+
+        with self.assertRaises(ValueError):
+            writer.finish()
+
+    def test_corrupt(self):
+        writer = self._make_one(io.BytesIO())
+
+        with self.assertRaises(ValueError):
+            writer.write(b'\x1f\x8b' + b'\xff' * 20)
+
+
 class Test__quote(unittest.TestCase):
 
     @staticmethod
@@ -2572,6 +3697,42 @@ class Test__add_query_parameters(unittest.TestCase):
             '{}&{}'.format(BASE_URL, expected))
 
 
+def _gzip(data):
+    from google.cloud.storage.blob import _GzipReader
+
+    return _GzipReader(io.BytesIO(data)).read()
+
+
+def _gunzip(data):
+    import zlib
+
+    return zlib.decompress(data, 16 + zlib.MAX_WBITS)
+
+
+class _FakeResumableUpload(object):
+    """Stand-in for ``ResumableUpload``, recording the size of each chunk."""
+
+    def __init__(self, chunk_size, total_bytes):
+        self._chunk_size = chunk_size
+        self._total_bytes = total_bytes
+        self.bytes_uploaded = 0
+        self.sent = []
+
+    @property
+    def chunk_size(self):
+        return self._chunk_size
+
+    @property
+    def finished(self):
+        return self.bytes_uploaded == self._total_bytes
+
+    def transmit_next_chunk(self, transport):
+        size = min(self._chunk_size, self._total_bytes - self.bytes_uploaded)
+        self.sent.append(size)
+        self.bytes_uploaded += size
+        return mock.sentinel.response
+
+
 class _Connection(object):
 
     API_BASE_URL = 'http://example.com'
@@ -376,6 +376,42 @@ class Test_Bucket(unittest.TestCase):
         self.assertEqual(kw['path'], '/b/%s/o/%s' % (NAME, BLOB_NAME))
         self.assertEqual(kw['query_params'], {'userProject': USER_PROJECT})
 
+    def test_get_blob_w_metadata_cache(self):
+        from google.cloud.exceptions import NotFound
+        from google.cloud.storage.cache import MetadataCache
+
+        connection = _Connection({'name': 'blob-name', 'generation': '7'})
+        client = _Client(connection)
+        client.metadata_cache = MetadataCache()
+        bucket = self._make_one(client=client, name='name')
+
+        blob = bucket.get_blob('blob-name')
+        cached = bucket.get_blob('blob-name')
+
+        self.assertEqual(len(connection._requested), 1)
+        self.assertIsNot(cached, blob)
+        self.assertEqual(cached.generation, 7)
+
+        # The blob was deleted by someone else.
+        with self.assertRaises(NotFound):
+            bucket.delete_blob('blob-name')
+        self.assertIsNone(client.metadata_cache.get(blob.path))
+
+    def test_get_blob_w_metadata_cache_in_batch(self):
+        from google.cloud.storage.cache import MetadataCache
+
+        connection = _Connection({'name': 'blob-name'})
+        client = _Client(connection)
+        client.metadata_cache = MetadataCache()
+        client.current_batch = object()
+        client.metadata_cache.put('/b/name/o/blob-name', {'name': 'stale'})
+        bucket = self._make_one(client=client, name='name')
+
+        blob = bucket.get_blob('blob-name')
+
+        self.assertEqual(blob._properties, {'name': 'blob-name'})
+        self.assertEqual(len(connection._requested), 1)
+
     def test_get_blob_hit_with_kwargs(self):
         from google.cloud.storage.blob import _get_encryption_headers
 
@@ -452,6 +488,47 @@ class Test_Bucket(unittest.TestCase):
         self.assertEqual(kw['path'], '/b/%s/o' % NAME)
         self.assertEqual(kw['query_params'], EXPECTED)
 
+    def test_list_blobs_compact(self):
+        from google.cloud.storage.blob import BlobRecord
+        from google.cloud.storage.bucket import _COMPACT_LIST_FIELDS
+
+        NAME = 'name'
+        items = [
+            {'name': 'a', 'size': '3', 'generation': '12'},
+            {'name': 'b', 'size': '0', 'generation': '13'},
+        ]
+        connection = _Connection({'items': items, 'prefixes': ['p/']})
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name=NAME)
+        iterator = bucket.list_blobs(compact=True)
+        records = list(iterator)
+
+        self.assertEqual(len(records), 2)
+        self.assertIsInstance(records[0], BlobRecord)
+        self.assertEqual(
+            [(record.name, record.size, record.generation)
+             for record in records],
+            [('a', 3, 12), ('b', 0, 13)])
+        self.assertEqual(iterator.prefixes, set(['p/']))
+        kw, = connection._requested
+        self.assertEqual(kw['query_params'], {
+            'projection': 'noAcl',
+            'fields': _COMPACT_LIST_FIELDS,
+        })
+
+    def test_list_blobs_compact_w_fields(self):
+        NAME = 'name'
+        FIELDS = 'items/name,nextPageToken'
+        connection = _Connection({'items': [{'name': 'a'}]})
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name=NAME)
+        records = list(bucket.list_blobs(compact=True, fields=FIELDS))
+
+        self.assertEqual(records[0].name, 'a')
+        self.assertIsNone(records[0].size)
+        kw, = connection._requested
+        self.assertEqual(kw['query_params']['fields'], FIELDS)
+
     def test_list_blobs(self):
         NAME = 'name'
         connection = _Connection({'items': []})
@@ -465,6 +542,101 @@ class Test_Bucket(unittest.TestCase):
         self.assertEqual(kw['path'], '/b/%s/o' % NAME)
         self.assertEqual(kw['query_params'], {'projection': 'noAcl'})
 
+    _PARALLEL_NAMES = (
+        'a.txt', 'a/1', 'a/2', 'a/3', 'a/b/1', 'b', 'c/1', 'c/d/1', 'c/d/2',
+    )
+
+    def _list_parallel_helper(self, **kw):
+        connection = _ListingConnection(self._PARALLEL_NAMES)
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name='name')
+        return bucket, connection, bucket.list_blobs_parallel(**kw)
+
+    def test_list_blobs_parallel_sorted(self):
+        from google.cloud.storage.blob import Blob
+
+        bucket, connection, blobs = self._list_parallel_helper(
+            sort=True, max_workers=2)
+        blobs = list(blobs)
+
+        self.assertIsInstance(blobs[0], Blob)
+        self.assertIs(blobs[0].bucket, bucket)
+        self.assertEqual(
+            [blob.name for blob in blobs], list(self._PARALLEL_NAMES))
+        # Discovery used the delimiter, partitions did not.
+        discovered = set(
+            request['query_params'].get('prefix')
+            for request in connection._requested
+            if 'delimiter' in request['query_params'])
+        self.assertEqual(discovered, set([None]))
+        partitions = set(
+            request['query_params']['prefix']
+            for request in connection._requested
+            if 'delimiter' not in request['query_params'])
+        self.assertEqual(partitions, set(['a/', 'c/']))
+
+    def test_list_blobs_parallel_unsorted(self):
+        _, _, blobs = self._list_parallel_helper()
+        names = [blob.name for blob in blobs]
+        self.assertEqual(sorted(names), list(self._PARALLEL_NAMES))
+
+    def test_list_blobs_parallel_w_split_depth(self):
+        _, connection, blobs = self._list_parallel_helper(
+            split_depth=2, sort=True, compact=True)
+        names = [record.name for record in blobs]
+
+        self.assertEqual(names, list(self._PARALLEL_NAMES))
+        partitions = set(
+            request['query_params']['prefix']
+            for request in connection._requested
+            if 'delimiter' not in request['query_params'])
+        self.assertEqual(partitions, set(['a/b/', 'c/d/']))
+
+    def test_list_blobs_parallel_w_prefix(self):
+        _, connection, blobs = self._list_parallel_helper(
+            prefix='c/', split_depth=3, sort=True)
+        names = [blob.name for blob in blobs]
+
+        self.assertEqual(names, ['c/1', 'c/d/1', 'c/d/2'])
+        for request in connection._requested:
+            self.assertIn('delimiter', request['query_params'])
+
+    def test_list_blobs_parallel_w_prefixes(self):
+        _, connection, blobs = self._list_parallel_helper(
+            prefixes=['c/', 'a/b/'], sort=True)
+        names = [blob.name for blob in blobs]
+
+        self.assertEqual(names, ['a/b/1', 'c/1', 'c/d/1', 'c/d/2'])
+        for request in connection._requested:
+            self.assertNotIn('delimiter', request['query_params'])
+
+    def test_list_blobs_parallel_w_overlapping_prefixes(self):
+        bucket = self._make_one(client=_Client(None), name='name')
+        with self.assertRaises(ValueError):
+            bucket.list_blobs_parallel(prefixes=['a/', 'a/b/'])
+
+    def test_list_blobs_parallel_w_error(self):
+        from google.cloud.exceptions import NotFound
+
+        for sort in (False, True):
+            connection = _ListingConnection(
+                self._PARALLEL_NAMES, fail_prefix='c/')
+            bucket = self._make_one(client=_Client(connection), name='name')
+            with self.assertRaises(NotFound):
+                list(bucket.list_blobs_parallel(sort=sort))
+
+    def test_list_blobs_parallel_close_early(self):
+        from google.cloud.storage import bucket as bucket_module
+
+        names = ['a/%03d' % (index,) for index in range(100)]
+        connection = _ListingConnection(names, page_size=1)
+        bucket = self._make_one(client=_Client(connection), name='name')
+        patch = mock.patch.object(bucket_module, '_QUEUE_POLL_INTERVAL', 0.01)
+        with patch:
+            blobs = bucket.list_blobs_parallel(sort=True)
+            self.assertEqual(next(blobs).name, 'a/000')
+            blobs.close()
+
     def test_list_notifications(self):
         from google.cloud.storage.notification import BucketNotification
         from google.cloud.storage.notification import _TOPIC_REF_FMT
@@ -727,6 +899,20 @@ class Test_Bucket(unittest.TestCase):
         self.assertEqual(kw['path'], COPY_PATH)
         self.assertEqual(kw['query_params'], {})
 
+    def test_copy_blob_invalidates_metadata_cache(self):
+        from google.cloud.storage.cache import MetadataCache
+
+        connection = _Connection({'name': 'blob-name'})
+        client = _Client(connection)
+        client.metadata_cache = MetadataCache()
+        client.metadata_cache.put('/b/dest/o/blob-name', {'name': 'old'})
+        source = self._make_one(client=client, name='source')
+        dest = self._make_one(client=client, name='dest')
+
+        source.copy_blob(source.blob('blob-name'), dest)
+
+        self.assertIsNone(client.metadata_cache.get('/b/dest/o/blob-name'))
+
     def test_copy_blobs_source_generation(self):
         SOURCE = 'source'
         DEST = 'dest'
@@ -814,6 +1000,251 @@ class Test_Bucket(unittest.TestCase):
         self.assertEqual(kw['path'], COPY_PATH)
         self.assertEqual(kw['query_params'], {'userProject': USER_PROJECT})
 
+    def test_rewrite_blobs(self):
+        connection = _RewriteConnection(sizes={'small': 3, 'large': 10})
+        client = _Client(connection)
+        source = self._make_one(client=client, name='source')
+        dest = self._make_one(
+            client=client, name='dest', user_project='user-project-123')
+        small = source.blob('small')
+        progress = []
+
+        def on_progress(old, new, rewritten, total):
+            progress.append((old.name, new.name, rewritten, total))
+
+        new_blobs = source.rewrite_blobs(
+            [small, 'large'], dest, new_names=['copy-small', 'copy-large'],
+            max_workers=2, on_progress=on_progress)
+
+        self.assertEqual(
+            [blob.name for blob in new_blobs], ['copy-small', 'copy-large'])
+        for blob in new_blobs:
+            self.assertIs(blob.bucket, dest)
+        self.assertEqual(new_blobs[1].size, 10)
+        self.assertEqual(sorted(progress), [
+            ('large', 'copy-large', 5, 10),
+            ('large', 'copy-large', 10, 10),
+            ('small', 'copy-small', 3, 3),
+        ])
+
+        requests = sorted(
+            connection._requested,
+            key=lambda kw: (kw['path'], len(kw['query_params'])))
+        self.assertEqual(
+            [(kw['path'], kw['query_params']) for kw in requests], [
+                ('/b/source/o/large/rewriteTo/b/dest/o/copy-large',
+                 {'userProject': 'user-project-123'}),
+                ('/b/source/o/large/rewriteTo/b/dest/o/copy-large',
+                 {'userProject': 'user-project-123',
+                  'rewriteToken': 'token-large'}),
+                ('/b/source/o/small/rewriteTo/b/dest/o/copy-small',
+                 {'userProject': 'user-project-123'}),
+            ])
+
+    def test_rewrite_blobs_wo_new_names(self):
+        connection = _RewriteConnection(sizes={'a': 1})
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name='name')
+
+        new_blobs = bucket.rewrite_blobs(['a'], bucket)
+
+        self.assertEqual([blob.name for blob in new_blobs], ['a'])
+        kw, = connection._requested
+        self.assertEqual(kw['path'], '/b/name/o/a/rewriteTo/b/name/o/a')
+
+    def test_rewrite_blobs_empty(self):
+        connection = _RewriteConnection(sizes={})
+        bucket = self._make_one(client=_Client(connection), name='name')
+
+        self.assertEqual(bucket.rewrite_blobs([], bucket), [])
+        self.assertEqual(connection._requested, [])
+
+    def test_rewrite_blobs_w_mismatched_names(self):
+        bucket = self._make_one(name='name')
+
+        with self.assertRaises(ValueError):
+            bucket.rewrite_blobs(['a', 'b'], bucket, new_names=['c'])
+
+    def test_rewrite_blobs_w_failure(self):
+        from google.cloud.exceptions import NotFound
+
+        connection = _RewriteConnection(sizes={'a': 1, 'c': 1})
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name='name')
+
+        with self.assertRaises(NotFound):
+            bucket.rewrite_blobs(['a', 'missing', 'c'], bucket)
+
+        # The other rewrites still ran.
+        self.assertEqual(len(connection._requested), 3)
+
+    def _update_blob_acls_helper(self, statuses=None, user_project=None,
+                                 **kw):
+        connection = _Connection()
+        client = _Client(connection)
+        bucket = self._make_one(
+            client=client, name='name', user_project=user_project)
+        batches = []
+
+        def make_batch(batch_client):
+            batch = _Batch(batch_client, statuses or {})
+            batches.append(batch)
+            return batch
+
+        with mock.patch('google.cloud.storage.bucket.Batch', new=make_batch):
+            errors = bucket.update_blob_acls(**kw)
+        return bucket, batches, errors
+
+    def test_update_blob_acls_w_grants_and_revokes(self):
+        from google.cloud.storage.blob import Blob
+
+        loaded = Blob('b', bucket=mock.Mock(path='/b/name', spec=['path']))
+        loaded.acl.loaded = True
+        bucket, batches, errors = self._update_blob_acls_helper(
+            blobs=['a/1', loaded], grants=[('allUsers', 'READER')],
+            revokes=['user-x@example.com'], user_project='user-project-123')
+
+        self.assertEqual(errors, {})
+        self.assertFalse(loaded.acl.loaded)
+        self.assertEqual(len(batches), 1)
+        self.assertTrue(batches[0].finished)
+        query_params = {'userProject': 'user-project-123'}
+        self.assertEqual(batches[0].requested, [
+            {'method': 'POST', 'path': '/b/name/o/a%2F1/acl',
+             'data': {'entity': 'allUsers', 'role': 'READER'},
+             'query_params': query_params, '_target_object': None},
+            {'method': 'DELETE',
+             'path': '/b/name/o/a%2F1/acl/user-x%40example.com',
+             'query_params': query_params, '_target_object': None},
+            {'method': 'POST', 'path': '/b/name/o/b/acl',
+             'data': {'entity': 'allUsers', 'role': 'READER'},
+             'query_params': query_params, '_target_object': None},
+            {'method': 'DELETE',
+             'path': '/b/name/o/b/acl/user-x%40example.com',
+             'query_params': query_params, '_target_object': None},
+        ])
+
+    def test_update_blob_acls_w_acl(self):
+        from google.cloud.storage.blob import Blob
+
+        acl = [{'entity': 'allUsers', 'role': 'READER'}]
+        blob = Blob('a', bucket=mock.Mock(path='/b/name', spec=['path']))
+        _, batches, errors = self._update_blob_acls_helper(
+            blobs=[blob], acl=acl)
+
+        self.assertEqual(errors, {})
+        self.assertEqual(batches[0].requested, [{
+            'method': 'PATCH', 'path': '/b/name/o/a', 'data': {'acl': acl},
+            'query_params': {'projection': 'full'}, '_target_object': None,
+        }])
+        self.assertTrue(blob.acl.loaded)
+        self.assertEqual(list(blob.acl), acl)
+
+    def test_update_blob_acls_w_predefined(self):
+        _, batches, errors = self._update_blob_acls_helper(
+            blobs=['a'], predefined='public-read')
+
+        self.assertEqual(errors, {})
+        self.assertEqual(batches[0].requested[0]['query_params'], {
+            'projection': 'full', 'predefinedAcl': 'publicRead'})
+        self.assertEqual(batches[0].requested[0]['data'], {'acl': []})
+
+    def test_update_blob_acls_w_failures(self):
+        from google.cloud.exceptions import Forbidden
+        from google.cloud.exceptions import NotFound
+
+        statuses = {'/b/name/o/b/acl': 404, '/b/name/o/c/acl/allUsers': 403}
+        _, batches, errors = self._update_blob_acls_helper(
+            blobs=['a', 'b', 'c'], grants=[('allUsers', 'READER')],
+            revokes=['allUsers'], statuses=statuses, batch_size=4,
+            max_workers=1)
+
+        self.assertEqual(len(batches), 2)
+        self.assertEqual(sorted(errors), ['b', 'c'])
+        self.assertIsInstance(errors['b'], NotFound)
+        self.assertIsInstance(errors['c'], Forbidden)
+
+    def test_update_blob_acls_w_batch_failure(self):
+        from google.cloud.exceptions import ServiceUnavailable
+
+        statuses = {'/b/name/o/b/acl': ServiceUnavailable('down')}
+        _, batches, errors = self._update_blob_acls_helper(
+            blobs=['a', 'b', 'c'], grants=[('allUsers', 'READER')],
+            statuses=statuses, batch_size=2)
+
+        self.assertEqual(len(batches), 2)
+        self.assertEqual(sorted(errors), ['a', 'b'])
+        self.assertIs(errors['a'], errors['b'])
+
+    def test_update_blob_acls_w_failed_batch_request(self):
+        import requests
+        from six.moves import http_client
+
+        response = requests.Response()
+        response.status_code = http_client.SERVICE_UNAVAILABLE
+        response.headers['content-type'] = 'text/html'
+        response._content = b'<html>Unavailable</html>'
+        connection = mock.Mock(spec=['_make_request'])
+        connection._make_request.return_value = response
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name='name')
+
+        errors = bucket.update_blob_acls(
+            ['a', 'b', 'c'], grants=[('allUsers', 'READER')], batch_size=2,
+            max_workers=1)
+
+        # Every blob of every failed batch is reported, none is dropped.
+        self.assertEqual(connection._make_request.call_count, 2)
+        self.assertEqual(sorted(errors), ['a', 'b', 'c'])
+        self.assertIsInstance(errors['a'], ValueError)
+        self.assertIs(errors['a'], errors['b'])
+
+    def test_update_blob_acls_w_transport_error(self):
+        import requests
+
+        statuses = {'/b/name/o/a/acl': requests.exceptions.ConnectionError()}
+        _, _, errors = self._update_blob_acls_helper(
+            blobs=['a', 'b'], grants=[('allUsers', 'READER')],
+            statuses=statuses, batch_size=1)
+
+        self.assertEqual(sorted(errors), ['a'])
+        self.assertIsInstance(
+            errors['a'], requests.exceptions.ConnectionError)
+
+    def test_update_blob_acls_invalidates_cache(self):
+        from google.cloud.storage.cache import MetadataCache
+
+        connection = _Connection()
+        client = _Client(connection)
+        client.metadata_cache = cache = MetadataCache()
+        cache.put('/b/name/o/a', {'name': 'a'})
+        bucket = self._make_one(client=client, name='name')
+
+        with mock.patch(
+                'google.cloud.storage.bucket.Batch',
+                new=lambda client: _Batch(client, {})):
+            bucket.update_blob_acls(['a'], revokes=['allUsers'])
+
+        self.assertIsNone(cache.get('/b/name/o/a'))
+
+    def test_update_blob_acls_w_invalid_arguments(self):
+        bucket = self._make_one(name='name')
+
+        with self.assertRaises(ValueError):
+            bucket.update_blob_acls(['a'])
+        with self.assertRaises(ValueError):
+            bucket.update_blob_acls(['a'], acl=[], predefined='private')
+        with self.assertRaises(ValueError):
+            bucket.update_blob_acls(
+                ['a'], predefined='private', revokes=['allUsers'])
+        with self.assertRaises(ValueError):
+            bucket.update_blob_acls(['a'], predefined='bogus')
+        with self.assertRaises(ValueError):
+            bucket.update_blob_acls(
+                ['a'], revokes=['allUsers'], batch_size=101)
+        with self.assertRaises(ValueError):
+            bucket.update_blob_acls(['a'], revokes=['allUsers'], batch_size=0)
+
     def test_rename_blob(self):
         BUCKET_NAME = 'BUCKET_NAME'
         BLOB_NAME = 'blob-name'
@@ -1671,6 +2102,41 @@ class Test_Bucket(unittest.TestCase):
         self.assertEqual(page2.num_items, 0)
         self.assertEqual(iterator.prefixes, set(['foo', 'bar']))
 
+    def test_generate_signed_urls(self):
+        from google.cloud.storage.blob import Blob
+
+        credentials = object()
+        bucket = self._make_one(name='name')
+        blobs = [Blob(u'a b', bucket=bucket), u'c/d']
+        patch = mock.patch(
+            'google.cloud.storage._signing.generate_signed_urls',
+            return_value=['url1', 'url2'])
+
+        with patch as signer:
+            urls = bucket.generate_signed_urls(
+                blobs, 1000, credentials=credentials,
+                response_type='text/plain', max_workers=4)
+
+        self.assertEqual(urls, ['url1', 'url2'])
+        signer.assert_called_once_with(
+            credentials, ['/name/a%20b', '/name/c/d'], 1000,
+            api_access_endpoint='https://storage.googleapis.com',
+            method='GET', content_type=None, response_type='text/plain',
+            response_disposition=None, max_workers=4)
+
+    def test_generate_signed_urls_w_client_credentials(self):
+        credentials = object()
+        client = mock.Mock(_credentials=credentials, spec=['_credentials'])
+        bucket = self._make_one(client=client, name='name')
+        patch = mock.patch(
+            'google.cloud.storage._signing.generate_signed_urls',
+            return_value=[])
+
+        with patch as signer:
+            bucket.generate_signed_urls([], 1000)
+
+        self.assertIs(signer.call_args[0][0], credentials)
+
     def _test_generate_upload_policy_helper(self, **kwargs):
         import base64
         import json
@@ -1784,6 +2250,135 @@ class _Connection(object):
             return response
 
 
+class _ListingConnection(object):
+    """Fake ``objects.list`` back-end, safe to call from several threads."""
+
+    def __init__(self, names, page_size=2, fail_prefix=None):
+        import threading
+
+        self._names = sorted(names)
+        self._page_size = page_size
+        self._fail_prefix = fail_prefix
+        self._lock = threading.Lock()
+        self._requested = []
+
+    def api_request(self, **kw):
+        from google.cloud.exceptions import NotFound
+
+        with self._lock:
+            self._requested.append(kw)
+
+        params = kw['query_params']
+        prefix = params.get('prefix', '')
+        delimiter = params.get('delimiter')
+        if prefix == self._fail_prefix:
+            raise NotFound('miss')
+
+        entries = []
+        for name in self._names:
+            if not name.startswith(prefix):
+                continue
+            rest = name[len(prefix):]
+            if delimiter is not None and delimiter in rest:
+                sub_prefix = prefix + rest[:rest.index(delimiter) + 1]
+                if (sub_prefix, True) not in entries:
+                    entries.append((sub_prefix, True))
+            else:
+                entries.append((name, False))
+
+        start = int(params.get('pageToken', 0))
+        end = start + self._page_size
+        page = entries[start:end]
+        response = {
+            'items': [{'name': name} for name, is_prefix in page
+                      if not is_prefix],
+            'prefixes': [name for name, is_prefix in page if is_prefix],
+        }
+        if end < len(entries):
+            response['nextPageToken'] = str(end)
+        return response
+
+
+class _RewriteConnection(object):
+    """Fake ``objects.rewrite`` back-end, rewriting 5 bytes per request."""
+
+    _BYTES_PER_CALL = 5
+
+    def __init__(self, sizes):
+        import threading
+
+        self._sizes = sizes
+        self._lock = threading.Lock()
+        self._requested = []
+
+    def api_request(self, **kw):
+        from google.cloud.exceptions import NotFound
+
+        with self._lock:
+            self._requested.append(kw)
+
+        source_name = kw['path'].split('/')[4]
+        if source_name not in self._sizes:
+            raise NotFound('miss')
+
+        size = self._sizes[source_name]
+        token = kw['query_params'].get('rewriteToken')
+        rewritten = self._BYTES_PER_CALL
+        if token is not None:
+            rewritten += self._BYTES_PER_CALL
+        response = {
+            'totalBytesRewritten': str(min(rewritten, size)),
+            'objectSize': str(size),
+        }
+        if rewritten < size:
+            response['done'] = False
+            response['rewriteToken'] = 'token-' + source_name
+        else:
+            response['done'] = True
+            response['resource'] = {'size': str(size)}
+        return response
+
+
+class _Batch(object):
+    """Fake :class:`~google.cloud.storage.batch.Batch`.
+
+    Responds with the status (or raises the exception) found in
+    ``statuses`` for a request path, and 200 otherwise.
+    """
+
+    def __init__(self, client, statuses):
+        self._client = client
+        self._statuses = statuses
+        self.requested = []
+        self.finished = False
+
+    def api_request(self, **kw):
+        self.requested.append(kw)
+
+    def finish(self, raise_exception=True):
+        import json
+        import requests
+
+        assert not raise_exception
+        self.finished = True
+        responses = []
+        for kw in self.requested:
+            status = self._statuses.get(kw['path'], 200)
+            if isinstance(status, Exception):
+                raise status
+            response = requests.Response()
+            response.status_code = status
+            response.request = requests.Request(
+                kw['method'], 'http://example.com' + kw['path']).prepare()
+            body = kw.get('data', {})
+            if status >= 300:
+                body = {'error': {'message': 'failed'}}
+            response._content = json.dumps(body).encode('utf-8')
+            response.headers['content-type'] = 'application/json'
+            responses.append(response)
+        return responses
+
+
 class _Client(object):
 
     def __init__(self, connection, project=None):
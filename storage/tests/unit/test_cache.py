@@ -0,0 +1,140 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import mock
+
+
+class TestMetadataCache(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage.cache import MetadataCache
+
+        return MetadataCache
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def test_ctor_defaults(self):
+        cache = self._make_one()
+        self.assertEqual(cache.max_size, 1024)
+        self.assertEqual(cache.ttl, 60.0)
+        self.assertEqual(len(cache), 0)
+
+    def test_ctor_invalid_size(self):
+        with self.assertRaises(ValueError):
+            self._make_one(max_size=0)
+
+    def test_put_and_get(self):
+        cache = self._make_one()
+        properties = {'name': 'a', 'metadata': {'color': 'red'}}
+        cache.put('/b/b/o/a', properties)
+
+        # Neither the stored value nor the returned copies are shared.
+        properties['metadata']['color'] = 'blue'
+        cached = cache.get('/b/b/o/a')
+        self.assertEqual(cached, {'name': 'a', 'metadata': {'color': 'red'}})
+        cached['metadata']['color'] = 'green'
+        self.assertEqual(cache.get('/b/b/o/a')['metadata']['color'], 'red')
+        self.assertIsNone(cache.get('/b/b/o/other'))
+
+    def test_expiry(self):
+        clock = mock.Mock(return_value=100.0)
+        cache = self._make_one(ttl=10)
+
+        with mock.patch('google.cloud.storage.cache._monotonic', new=clock):
+            cache.put('/b/b/o/a', {'name': 'a'})
+            clock.return_value = 109.0
+            self.assertIsNotNone(cache.get('/b/b/o/a'))
+            clock.return_value = 110.0
+            self.assertIsNone(cache.get('/b/b/o/a'))
+
+        # The expired entry was dropped.
+        self.assertEqual(len(cache), 0)
+
+    def test_lru_eviction(self):
+        cache = self._make_one(max_size=2)
+        cache.put('a', {'name': 'a'})
+        cache.put('b', {'name': 'b'})
+        # Use 'a', making 'b' the least recently used entry.
+        cache.get('a')
+        cache.put('c', {'name': 'c'})
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get('b'))
+        self.assertIsNotNone(cache.get('a'))
+        self.assertIsNotNone(cache.get('c'))
+
+    def test_put_replaces(self):
+        cache = self._make_one(max_size=2)
+        cache.put('a', {'generation': '1'})
+        cache.put('a', {'generation': '2'})
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.get('a'), {'generation': '2'})
+
+    def test_invalidate_and_clear(self):
+        cache = self._make_one()
+        cache.put('a', {})
+        cache.put('b', {})
+        cache.invalidate('a')
+        cache.invalidate('missing')
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(len(cache), 1)
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+
+class Test__get_metadata_cache(unittest.TestCase):
+
+    @staticmethod
+    def _call_fut(client):
+        from google.cloud.storage.cache import _get_metadata_cache
+
+        return _get_metadata_cache(client)
+
+    def test_wo_cache(self):
+        self.assertIsNone(self._call_fut(object()))
+        client = mock.Mock(
+            metadata_cache=None, current_batch=None,
+            spec=['metadata_cache', 'current_batch'])
+        self.assertIsNone(self._call_fut(client))
+
+    def test_w_cache(self):
+        client = mock.Mock(
+            current_batch=None, spec=['metadata_cache', 'current_batch'])
+        self.assertIs(self._call_fut(client), client.metadata_cache)
+
+    def test_w_batch(self):
+        client = mock.Mock(spec=['metadata_cache', 'current_batch'])
+        self.assertIsNone(self._call_fut(client))
+
+
+class Test__invalidate(unittest.TestCase):
+
+    @staticmethod
+    def _call_fut(client, path):
+        from google.cloud.storage.cache import _invalidate
+
+        return _invalidate(client, path)
+
+    def test_wo_cache(self):
+        self._call_fut(object(), '/b/b/o/a')
+
+    def test_w_batch(self):
+        client = mock.Mock(spec=['metadata_cache', 'current_batch'])
+        self._call_fut(client, '/b/b/o/a')
+        client.metadata_cache.invalidate.assert_called_once_with('/b/b/o/a')
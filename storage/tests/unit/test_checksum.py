@@ -0,0 +1,213 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import base64
+import hashlib
+import io
+import unittest
+
+import mock
+
+
+def _crc32c(data):
+    """Bit-at-a-time reference implementation of CRC32C."""
+    crc = 0xffffffff
+    for byte in bytearray(data):
+        crc ^= byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ (0x82f63b78 if crc & 1 else 0)
+    return crc ^ 0xffffffff
+
+
+def _base64_md5(data):
+    return base64.b64encode(hashlib.md5(data).digest()).decode('ascii')
+
+
+class Test__crc32c_combine(unittest.TestCase):
+
+    @staticmethod
+    def _call_fut(crc1, crc2, length2):
+        from google.cloud.storage.checksum import _crc32c_combine
+
+        return _crc32c_combine(crc1, crc2, length2)
+
+    def test_reference(self):
+        self.assertEqual(_crc32c(b'123456789'), 0xe3069283)
+
+    def test_empty_second_piece(self):
+        self.assertEqual(self._call_fut(0xe3069283, 0, 0), 0xe3069283)
+
+    def test_combine(self):
+        data = b'The quick brown fox jumps over the lazy dog' * 7
+        for split in (0, 1, 5, 64, len(data) - 1):
+            first, second = data[:split], data[split:]
+            combined = self._call_fut(
+                _crc32c(first), _crc32c(second), len(second))
+            self.assertEqual(combined, _crc32c(data))
+
+
+class TestChecksums(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage.checksum import Checksums
+
+        return Checksums
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def _skip_wo_crc32c(self):
+        from google.cloud.storage.checksum import _crc32c_available
+
+        if not _crc32c_available():  # pragma: NO COVER
+            self.skipTest('Fast CRC32C implementation not installed')
+
+    def test_ctor_defaults(self):
+        checksums = self._make_one()
+        self.assertEqual(checksums.size, 0)
+        self.assertEqual(checksums.md5_hash, _base64_md5(b''))
+
+    def test_ctor_disabled(self):
+        checksums = self._make_one(md5_enabled=False, crc32c_enabled=False)
+        checksums.update(b'abc')
+        self.assertEqual(checksums.size, 3)
+        self.assertIsNone(checksums.md5_hash)
+        self.assertIsNone(checksums.crc32c_value)
+        self.assertIsNone(checksums.crc32c)
+
+    def test_set_md5(self):
+        checksums = self._make_one(md5_enabled=False)
+        checksums.set_md5(_base64_md5(b'abc'))
+        self.assertEqual(checksums.md5_hash, _base64_md5(b'abc'))
+
+    def test_ctor_wo_crcmod(self):
+        patch = mock.patch(
+            'google.cloud.storage.checksum.crcmod', new=None)
+        with patch:
+            checksums = self._make_one()
+
+        checksums.update(b'abc')
+        self.assertIsNone(checksums.crc32c)
+        self.assertEqual(checksums.md5_hash, _base64_md5(b'abc'))
+
+    def test_update(self):
+        self._skip_wo_crc32c()
+        checksums = self._make_one()
+        checksums.update(b'12345')
+        checksums.update(b'6789')
+        self.assertEqual(checksums.size, 9)
+        self.assertEqual(checksums.md5_hash, _base64_md5(b'123456789'))
+        self.assertEqual(checksums.crc32c_value, 0xe3069283)
+        self.assertEqual(checksums.crc32c, u'4waSgw==')
+
+    def test_combine(self):
+        self._skip_wo_crc32c()
+        first = self._make_one()
+        first.update(b'1234')
+        second = self._make_one()
+        second.update(b'56789')
+
+        combined = first.combine(second)
+        self.assertEqual(combined.size, 9)
+        self.assertIsNone(combined.md5_hash)
+        self.assertEqual(combined.crc32c_value, 0xe3069283)
+
+    def test_combine_wo_crc32c(self):
+        first = self._make_one(crc32c_enabled=False)
+        first.update(b'1234')
+        combined = first.combine(self._make_one(crc32c_enabled=False))
+        self.assertEqual(combined.size, 4)
+        self.assertIsNone(combined.crc32c)
+
+    def test_matches(self):
+        self._skip_wo_crc32c()
+        checksums = self._make_one()
+        checksums.update(b'123456789')
+        blob = mock.Mock(
+            md5_hash=_base64_md5(b'123456789'), crc32c=u'4waSgw==',
+            spec=['md5_hash', 'crc32c'])
+        self.assertTrue(checksums.matches(blob))
+
+        blob.crc32c = u'AAAAAA=='
+        self.assertFalse(checksums.matches(blob))
+
+    def test_matches_partial(self):
+        checksums = self._make_one(crc32c_enabled=False)
+        checksums.update(b'abc')
+        blob = mock.Mock(
+            md5_hash=None, crc32c=u'AAAAAA==', spec=['md5_hash', 'crc32c'])
+        with self.assertRaises(ValueError):
+            checksums.matches(blob)
+
+        blob.md5_hash = _base64_md5(b'abc')
+        self.assertTrue(checksums.matches(blob))
+
+
+class Test_ChecksummingReader(unittest.TestCase):
+
+    @staticmethod
+    def _make_one(stream):
+        from google.cloud.storage.checksum import Checksums
+        from google.cloud.storage.checksum import _ChecksummingReader
+
+        return _ChecksummingReader(stream, Checksums())
+
+    def test_read_rewind_and_reread(self):
+        stream = io.BytesIO(b'abcdefgh')
+        reader = self._make_one(stream)
+        self.assertEqual(reader.read(5), b'abcde')
+        reader.seek(2)
+        self.assertEqual(reader.tell(), 2)
+        self.assertEqual(reader.read(), b'cdefgh')
+
+        self.assertTrue(reader.complete)
+        self.assertEqual(reader._checksums.size, 8)
+        self.assertEqual(
+            reader._checksums.md5_hash, _base64_md5(b'abcdefgh'))
+
+    def test_read_from_offset(self):
+        stream = io.BytesIO(b'abcdefgh')
+        stream.seek(3)
+        reader = self._make_one(stream)
+        self.assertEqual(reader.read(), b'defgh')
+        self.assertEqual(reader._checksums.md5_hash, _base64_md5(b'defgh'))
+
+    def test_read_w_gap(self):
+        reader = self._make_one(io.BytesIO(b'abcdefgh'))
+        reader.seek(4)
+        reader.read()
+        self.assertFalse(reader.complete)
+        self.assertEqual(reader._checksums.size, 0)
+
+    def test_delegates_attributes(self):
+        stream = io.BytesIO(b'')
+        reader = self._make_one(stream)
+        self.assertFalse(reader.closed)
+
+
+class Test_ChecksummingWriter(unittest.TestCase):
+
+    def test_write(self):
+        from google.cloud.storage.checksum import Checksums
+        from google.cloud.storage.checksum import _ChecksummingWriter
+
+        stream = io.BytesIO()
+        checksums = Checksums()
+        writer = _ChecksummingWriter(stream, checksums)
+        self.assertEqual(writer.write(b'abc'), 3)
+        writer.write(b'def')
+
+        self.assertEqual(writer.getvalue(), b'abcdef')
+        self.assertEqual(checksums.md5_hash, _base64_md5(b'abcdef'))
@@ -75,6 +75,16 @@ class TestClient(unittest.TestCase):
         self.assertIsNone(client.current_batch)
         self.assertEqual(list(client._batch_stack), [])
 
+    def test_ctor_w_metadata_cache(self):
+        from google.cloud.storage.cache import MetadataCache
+
+        cache = MetadataCache()
+        client = self._make_one(
+            project='PROJECT', credentials=_make_credentials(),
+            metadata_cache=cache)
+
+        self.assertIs(client.metadata_cache, cache)
+
     def test_ctor_wo_project(self):
         from google.cloud.storage._http import Connection
 
@@ -0,0 +1,429 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import base64
+import hashlib
+import io
+import os
+import unittest
+
+import mock
+
+
+class TestBlobReader(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage.fileio import BlobReader
+
+        return BlobReader
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def test_ctor_defaults(self):
+        from google.cloud.storage.fileio import _DEFAULT_CHUNK_SIZE
+
+        blob = _Blob(b'abcdef')
+        reader = self._make_one(blob)
+        self.assertIs(reader.blob, blob)
+        self.assertEqual(reader._chunk_size, _DEFAULT_CHUNK_SIZE)
+        self.assertIsNone(reader._client)
+        self.assertTrue(reader._prefetch)
+        self.assertTrue(reader.readable())
+        self.assertTrue(reader.seekable())
+        self.assertFalse(reader.writable())
+        self.assertEqual(reader.tell(), 0)
+
+    def test_ctor_w_blob_chunk_size(self):
+        blob = _Blob(b'abcdef', chunk_size=3)
+        reader = self._make_one(blob)
+        self.assertEqual(reader._chunk_size, 3)
+
+    def test_ctor_w_bad_chunk_size(self):
+        with self.assertRaises(ValueError):
+            self._make_one(_Blob(b'abcdef'), chunk_size=0)
+
+    def test_read_all_no_prefetch(self):
+        blob = _Blob(b'abcdefg')
+        client = object()
+        reader = self._make_one(
+            blob, chunk_size=3, client=client, prefetch=False)
+
+        self.assertEqual(reader.read(), b'abcdefg')
+        self.assertEqual(reader.tell(), 7)
+        self.assertEqual(reader.read(), b'')
+        self.assertEqual(
+            blob._ranges, [(0, 2, client), (3, 5, client), (6, 6, client)])
+        self.assertIsNone(reader._executor)
+
+    def test_read_w_size(self):
+        blob = _Blob(b'abcdefg')
+        reader = self._make_one(blob, chunk_size=3, prefetch=False)
+
+        self.assertEqual(reader.read(2), b'ab')
+        self.assertEqual(reader.read(2), b'cd')
+        self.assertEqual(reader.read(10), b'efg')
+        self.assertEqual(reader.read(1), b'')
+        # The first chunk is reused by the second read.
+        self.assertEqual(
+            blob._ranges, [(0, 2, None), (3, 5, None), (6, 6, None)])
+
+    def test_read_w_prefetch(self):
+        blob = _Blob(b'abcdefg')
+        reader = self._make_one(blob, chunk_size=3)
+
+        self.assertEqual(reader.read(3), b'abc')
+        self.assertEqual(reader._pending[0], 3)
+        self.assertEqual(reader.read(), b'defg')
+        self.assertIsNone(reader._pending)
+        self.assertEqual(
+            blob._ranges, [(0, 2, None), (3, 5, None), (6, 6, None)])
+
+    def test_read_discards_unused_prefetch(self):
+        blob = _Blob(b'abcdefg')
+        reader = self._make_one(blob, chunk_size=3)
+
+        self.assertEqual(reader.read(1), b'a')
+        reader._pending[1].result()
+        reader.seek(5)
+        self.assertEqual(reader.read(1), b'f')
+        self.assertIsNone(reader._pending)
+        self.assertEqual(blob._ranges, [
+            (0, 2, None), (3, 5, None), (5, 6, None)])
+
+    def test_read_reloads_missing_size(self):
+        blob = _Blob(b'abc', size=None)
+        client = object()
+        reader = self._make_one(blob, client=client, prefetch=False)
+
+        self.assertEqual(reader.read(), b'abc')
+        self.assertEqual(blob._reloaded, [client])
+
+    def test_read_short_blob(self):
+        blob = _Blob(b'abc', size=6)
+        reader = self._make_one(blob, chunk_size=3, prefetch=False)
+
+        self.assertEqual(reader.read(), b'abc')
+
+    def test_readinto(self):
+        blob = _Blob(b'abcdef')
+        reader = self._make_one(blob, chunk_size=4, prefetch=False)
+        buffer = bytearray(5)
+
+        self.assertEqual(reader.readinto(buffer), 5)
+        self.assertEqual(bytes(buffer), b'abcde')
+
+    def test_seek_and_tell(self):
+        blob = _Blob(b'abcdef')
+        reader = self._make_one(blob, chunk_size=2, prefetch=False)
+
+        self.assertEqual(reader.seek(4), 4)
+        self.assertEqual(reader.read(1), b'e')
+        self.assertEqual(reader.seek(-3, os.SEEK_CUR), 2)
+        self.assertEqual(reader.read(2), b'cd')
+        self.assertEqual(reader.seek(-1, os.SEEK_END), 5)
+        self.assertEqual(reader.read(), b'f')
+        self.assertEqual(reader.tell(), 6)
+        self.assertEqual(
+            blob._ranges, [(4, 5, None), (2, 3, None), (5, 5, None)])
+
+    def test_seek_invalid(self):
+        reader = self._make_one(_Blob(b'abcdef'))
+
+        with self.assertRaises(ValueError):
+            reader.seek(-1)
+
+        with self.assertRaises(ValueError):
+            reader.seek(0, 42)
+
+    def test_close(self):
+        blob = _Blob(b'abcdef')
+        reader = self._make_one(blob, chunk_size=3)
+        reader.read(1)
+        executor = reader._executor = mock.Mock(spec=['shutdown'])
+
+        reader.close()
+
+        self.assertTrue(reader.closed)
+        executor.shutdown.assert_called_once_with(wait=False)
+        self.assertIsNone(reader._executor)
+        self.assertIsNone(reader._pending)
+        with self.assertRaises(ValueError):
+            reader.read()
+        with self.assertRaises(ValueError):
+            reader.tell()
+
+    def test_context_manager_w_text_wrapper(self):
+        blob = _Blob(b'a,b\n1,2\n')
+        with io.TextIOWrapper(self._make_one(blob, chunk_size=3)) as text:
+            self.assertEqual(text.readlines(), ['a,b\n', '1,2\n'])
+        self.assertTrue(text.closed)
+
+
+class TestBlobWriter(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage.fileio import BlobWriter
+
+        return BlobWriter
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def test_ctor_defaults(self):
+        from google.cloud.storage.fileio import _DEFAULT_CHUNK_SIZE
+
+        blob = _Blob(b'')
+        writer = self._make_one(blob)
+        self.assertIs(writer.blob, blob)
+        self.assertEqual(writer._chunk_size, _DEFAULT_CHUNK_SIZE)
+        self.assertIsNone(writer._client)
+        self.assertIsNone(writer._upload)
+        self.assertTrue(writer.writable())
+        self.assertFalse(writer.readable())
+        self.assertEqual(writer.tell(), 0)
+
+    def test_ctor_w_blob_chunk_size(self):
+        blob = _Blob(b'', chunk_size=4)
+        writer = self._make_one(blob)
+        self.assertEqual(writer._chunk_size, 4)
+
+    def test_ctor_w_bad_chunk_size(self):
+        with self.assertRaises(ValueError):
+            self._make_one(_Blob(b''), chunk_size=5)
+
+    def test_small_upload_uses_multipart(self):
+        blob = _Blob(b'')
+        client = object()
+        writer = self._make_one(blob, chunk_size=4, client=client)
+
+        self.assertEqual(writer.write(b'ab'), 2)
+        self.assertEqual(writer.write(b'c'), 1)
+        self.assertEqual(writer.tell(), 3)
+        self.assertIsNone(blob._upload)
+        writer.close()
+
+        self.assertTrue(writer.closed)
+        self.assertEqual(blob._multipart, [(client, b'abc')])
+        self.assertEqual(blob._properties, {'size': '3'})
+        self.assertEqual(blob._invalidated, [client])
+
+    def test_streaming_upload(self):
+        blob = _Blob(b'')
+        client = object()
+        writer = self._make_one(blob, chunk_size=4, client=client)
+
+        writer.write(b'abc')
+        self.assertIsNone(blob._upload)
+        writer.write(b'defghij')
+        upload = blob._upload
+        self.assertEqual(upload.chunks, [b'abcd', b'efgh'])
+        self.assertEqual(blob._initiated, [client])
+        # Acknowledged bytes are not retained.
+        self.assertEqual(writer._buffer.remaining, 2)
+        self.assertEqual(len(writer._buffer._data), 2)
+        self.assertEqual(writer.tell(), 10)
+
+        writer.close()
+        self.assertEqual(upload.chunks, [b'abcd', b'efgh', b'ij'])
+        self.assertEqual(blob._multipart, [])
+        self.assertEqual(blob._properties, {'size': '10'})
+        self.assertEqual(blob._transfer_checksums.size, 10)
+        self.assertEqual(
+            blob._transfer_checksums.md5_hash,
+            base64.b64encode(hashlib.md5(b'abcdefghij').digest()).decode())
+
+    def test_streaming_upload_exact_multiple(self):
+        blob = _Blob(b'')
+        with self._make_one(blob, chunk_size=4) as writer:
+            writer.write(b'abcdefgh')
+
+        self.assertEqual(blob._upload.chunks, [b'abcd', b'efgh', b''])
+        self.assertEqual(blob._properties, {'size': '8'})
+
+    def test_text_wrapper(self):
+        blob = _Blob(b'')
+        with io.TextIOWrapper(self._make_one(blob, chunk_size=4)) as text:
+            text.write(u'a,b\n1,2\n')
+
+        self.assertEqual(blob._upload.chunks, [b'a,b\n', b'1,2\n', b''])
+
+    def test_exit_w_exception_abandons_upload(self):
+        blob = _Blob(b'')
+        with self.assertRaises(RuntimeError):
+            with self._make_one(blob, chunk_size=4) as writer:
+                writer.write(b'abcdef')
+                raise RuntimeError('boom')
+
+        self.assertTrue(writer.closed)
+        self.assertEqual(blob._upload.chunks, [b'abcd'])
+        self.assertIsNone(blob._properties)
+
+    def test_write_after_close(self):
+        writer = self._make_one(_Blob(b''), chunk_size=4)
+        writer.close()
+        writer.close()  # Closing twice is a no-op.
+
+        with self.assertRaises(ValueError):
+            writer.write(b'a')
+        with self.assertRaises(ValueError):
+            writer.tell()
+
+    def test_write_w_failure(self):
+        from google.cloud import exceptions
+
+        blob = _Blob(b'')
+        blob._upload_error = _make_invalid_response()
+        writer = self._make_one(blob, chunk_size=4)
+
+        with self.assertRaises(exceptions.NotFound):
+            writer.write(b'abcd')
+
+    def test_close_w_failure(self):
+        from google.cloud import exceptions
+
+        blob = _Blob(b'')
+        blob._upload_error = _make_invalid_response()
+        writer = self._make_one(blob, chunk_size=4)
+        writer.write(b'abc')
+
+        with self.assertRaises(exceptions.NotFound):
+            writer.close()
+        self.assertTrue(writer.closed)
+
+
+class Test_SlidingBuffer(unittest.TestCase):
+
+    @staticmethod
+    def _make_one():
+        from google.cloud.storage.fileio import _SlidingBuffer
+
+        return _SlidingBuffer()
+
+    def test_write_read_discard(self):
+        buff = self._make_one()
+        buff.write(b'abcdef')
+        self.assertEqual(buff.size, 6)
+        self.assertEqual(buff.read(4), b'abcd')
+        self.assertEqual(buff.tell(), 4)
+        self.assertEqual(buff.remaining, 2)
+
+        buff.discard(3)
+        self.assertEqual(buff.seek(3), 3)
+        self.assertEqual(buff.read(), b'def')
+        self.assertEqual(buff.read(), b'')
+
+        # Discarding never goes past the read position.
+        buff.write(b'gh')
+        buff.discard(10)
+        self.assertEqual(buff._start, 6)
+        self.assertEqual(buff.read(1), b'g')
+        self.assertEqual(buff.size, 8)
+
+    def test_seek_invalid(self):
+        buff = self._make_one()
+        buff.write(b'abcdef')
+        buff.read(4)
+        buff.discard(4)
+
+        with self.assertRaises(ValueError):
+            buff.seek(3)
+        with self.assertRaises(ValueError):
+            buff.seek(7)
+        with self.assertRaises(ValueError):
+            buff.seek(0, os.SEEK_END)
+
+
+def _make_invalid_response():
+    import requests
+    from google import resumable_media
+    from six.moves import http_client
+
+    response = requests.Response()
+    response.status_code = http_client.NOT_FOUND
+    response.request = requests.Request(
+        'PUT', 'http://example.com').prepare()
+    return resumable_media.InvalidResponse(response)
+
+
+class _Upload(object):
+
+    def __init__(self, stream, chunk_size, error=None):
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._error = error
+        self.chunks = []
+        self.bytes_uploaded = 0
+
+    def transmit_next_chunk(self, transport):
+        if self._error is not None:
+            raise self._error
+        chunk = self._stream.read(self._chunk_size)
+        self.chunks.append(chunk)
+        self.bytes_uploaded += len(chunk)
+        return mock.Mock(
+            json=mock.Mock(return_value={'size': str(self.bytes_uploaded)}))
+
+
+class _Blob(object):
+
+    _CHUNK_SIZE_MULTIPLE = 2
+    _properties = None
+    _upload = None
+    _upload_error = None
+
+    def __init__(self, data, size=-1, chunk_size=None):
+        self._data = data
+        self._size = len(data) if size == -1 else size
+        self.chunk_size = chunk_size
+        self._ranges = []
+        self._reloaded = []
+        self._initiated = []
+        self._multipart = []
+        self._invalidated = []
+
+    @property
+    def size(self):
+        return self._size
+
+    def reload(self, client=None):
+        self._reloaded.append(client)
+        self._size = len(self._data)
+
+    def _download_range(self, file_obj, start, end, client=None):
+        self._ranges.append((start, end, client))
+        file_obj.write(self._data[start:end + 1])
+
+    def _initiate_resumable_upload(self, client, stream, content_type,
+                                   size, num_retries, chunk_size=None):
+        self._initiated.append(client)
+        self._upload = _Upload(stream, chunk_size, self._upload_error)
+        return self._upload, object()
+
+    def _do_multipart_upload(self, client, stream, content_type,
+                             size, num_retries):
+        if self._upload_error is not None:
+            raise self._upload_error
+        data = stream.read(size)
+        self._multipart.append((client, data))
+        return mock.Mock(
+            json=mock.Mock(return_value={'size': str(len(data))}))
+
+    def _set_properties(self, value):
+        self._properties = value
+
+    def _invalidate_cached(self, client):
+        self._invalidated.append(client)
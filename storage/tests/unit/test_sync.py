@@ -0,0 +1,268 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import base64
+import hashlib
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+
+_UPDATED = '2017-01-01T09:09:09.081Z'
+
+
+def _record(name, data, updated=_UPDATED, md5_hash=True):
+    from google.cloud.storage.blob import BlobRecord
+
+    if md5_hash:
+        md5_hash = base64.b64encode(hashlib.md5(data).digest()).decode()
+    else:
+        md5_hash = None
+    return BlobRecord(
+        name, size=len(data), generation=7, updated=updated,
+        md5_hash=md5_hash)
+
+
+def _updated_mtime():
+    import time
+    from google.cloud._helpers import _rfc3339_to_datetime
+
+    return time.mktime(_rfc3339_to_datetime(_UPDATED).timetuple())
+
+
+class _SyncTestBase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _write(self, path, data, mtime=None):
+        filename = os.path.join(self.directory, *path.split('/'))
+        parent = os.path.dirname(filename)
+        if not os.path.isdir(parent):
+            os.makedirs(parent)
+        with open(filename, 'wb') as file_obj:
+            file_obj.write(data)
+        if mtime is not None:
+            os.utime(filename, (mtime, mtime))
+        return filename
+
+    def _read(self, path):
+        filename = os.path.join(self.directory, *path.split('/'))
+        with open(filename, 'rb') as file_obj:
+            return file_obj.read()
+
+    @staticmethod
+    def _make_bucket(records):
+        bucket = mock.Mock(spec=['list_blobs', 'blob'])
+        bucket.list_blobs.return_value = records
+        blobs = {}
+
+        def make_blob(name):
+            blob = mock.Mock(spec=[
+                'name', '_set_properties', 'upload_from_filename',
+                'download_to_filename', 'delete'])
+            blob.name = name
+            blobs[name] = blob
+            return blob
+
+        bucket.blob.side_effect = make_blob
+        return bucket, blobs
+
+
+class Test_sync_to_bucket(_SyncTestBase):
+
+    @staticmethod
+    def _call_fut(*args, **kwargs):
+        from google.cloud.storage.sync import sync_to_bucket
+
+        return sync_to_bucket(*args, **kwargs)
+
+    def test_new_changed_and_unchanged(self):
+        import time
+
+        self._write('same.txt', b'same', mtime=_updated_mtime())
+        self._write('sub/new.txt', b'new')
+        self._write('resized.txt', b'longer')
+        self._write('touched.txt', b'abc', mtime=time.time())
+        records = [
+            _record('pre/same.txt', b'same'),
+            _record('pre/resized.txt', b'short'),
+            _record('pre/touched.txt', b'abc'),
+            _record('pre/extra.txt', b'extra'),
+        ]
+        bucket, blobs = self._make_bucket(records)
+        client = object()
+
+        result = self._call_fut(
+            self.directory, bucket, prefix='pre', client=client)
+
+        self.assertEqual(
+            result.transferred,
+            ['resized.txt', 'sub/new.txt', 'touched.txt'])
+        self.assertEqual(result.unchanged, ['same.txt'])
+        self.assertEqual(result.deleted, [])
+        bucket.list_blobs.assert_called_once_with(
+            prefix='pre/', compact=True, client=client)
+        self.assertEqual(
+            sorted(blobs), ['pre/resized.txt', 'pre/sub/new.txt',
+                            'pre/touched.txt'])
+        blobs['pre/sub/new.txt'].upload_from_filename.assert_called_once_with(
+            os.path.join(self.directory, 'sub', 'new.txt'), client=client)
+
+    def test_uploaded_before_modified(self):
+        # The file was last modified long before the blob was uploaded.
+        self._write('old.txt', b'old', mtime=_updated_mtime() - 86400)
+        bucket, blobs = self._make_bucket([_record('old.txt', b'old')])
+
+        result = self._call_fut(self.directory, bucket)
+
+        self.assertEqual(result.unchanged, ['old.txt'])
+        self.assertEqual(blobs, {})
+        bucket.list_blobs.assert_called_once_with(
+            prefix=None, compact=True, client=None)
+
+    def test_checksum(self):
+        import time
+
+        now = time.time()
+        self._write('same.txt', b'abc', mtime=now)
+        self._write('other.txt', b'abc', mtime=now)
+        self._write('no-hash.txt', b'abc', mtime=now)
+        records = [
+            _record('same.txt', b'abc'),
+            _record('other.txt', b'xyz'),
+            _record('no-hash.txt', b'abc', md5_hash=False),
+        ]
+        bucket, _ = self._make_bucket(records)
+        patch = mock.patch(
+            'google.cloud.storage.checksum._crc32c_available',
+            return_value=False)
+
+        with patch:
+            result = self._call_fut(self.directory, bucket, checksum=True)
+
+        self.assertEqual(result.transferred, ['no-hash.txt', 'other.txt'])
+        self.assertEqual(result.unchanged, ['same.txt'])
+
+    def test_delete(self):
+        records = [_record('extra.txt', b'extra', updated=None)]
+        bucket, blobs = self._make_bucket(records)
+
+        result = self._call_fut(self.directory, bucket, delete=True)
+
+        self.assertEqual(result.deleted, ['extra.txt'])
+        blobs['extra.txt'].delete.assert_called_once_with(client=None)
+        self.assertEqual(
+            repr(result),
+            '<SyncResult: 0 transferred, 0 unchanged, 1 deleted>')
+
+    def test_missing_updated(self):
+        self._write('a.txt', b'abc', mtime=_updated_mtime())
+        bucket, _ = self._make_bucket([_record('a.txt', b'abc', updated=None)])
+
+        result = self._call_fut(self.directory, bucket)
+
+        self.assertEqual(result.transferred, ['a.txt'])
+
+    def test_failure(self):
+        self._write('a.txt', b'a')
+        self._write('b.txt', b'b')
+        bucket, _ = self._make_bucket([])
+        make_blob = bucket.blob.side_effect
+
+        def failing_blob(name):
+            blob = make_blob(name)
+            if name == 'a.txt':
+                blob.upload_from_filename.side_effect = ValueError('boom')
+            return blob
+
+        bucket.blob.side_effect = failing_blob
+
+        with self.assertRaises(ValueError):
+            self._call_fut(self.directory, bucket)
+
+
+class Test_sync_from_bucket(_SyncTestBase):
+
+    @staticmethod
+    def _call_fut(*args, **kwargs):
+        from google.cloud.storage.sync import sync_from_bucket
+
+        return sync_from_bucket(*args, **kwargs)
+
+    def test_download(self):
+        self._write('same.txt', b'same', mtime=_updated_mtime())
+        self._write('touched.txt', b'abc')
+        self._write('extra.txt', b'extra')
+        records = [
+            _record('pre/same.txt', b'same'),
+            _record('pre/touched.txt', b'abc'),
+            _record('pre/sub/new.txt', b'new'),
+            _record('pre/sub/', b''),
+        ]
+        bucket, blobs = self._make_bucket(records)
+        client = object()
+
+        result = self._call_fut(
+            bucket, self.directory, prefix='pre/', delete=True,
+            client=client)
+
+        self.assertEqual(result.transferred, ['sub/new.txt', 'touched.txt'])
+        self.assertEqual(result.unchanged, ['same.txt'])
+        self.assertEqual(result.deleted, ['extra.txt'])
+        self.assertFalse(
+            os.path.exists(os.path.join(self.directory, 'extra.txt')))
+        # The parent directory was created for the download.
+        self.assertTrue(os.path.isdir(os.path.join(self.directory, 'sub')))
+
+        blob = blobs['pre/sub/new.txt']
+        blob._set_properties.assert_called_once_with(
+            {'generation': 7, 'updated': _UPDATED})
+        blob.download_to_filename.assert_called_once_with(
+            os.path.join(self.directory, 'sub', 'new.txt'), client=client)
+
+    def test_download_into_new_directory(self):
+        directory = os.path.join(self.directory, 'target')
+        bucket, blobs = self._make_bucket([_record('a.txt', b'a')])
+
+        result = self._call_fut(bucket, directory)
+
+        self.assertEqual(result.transferred, ['a.txt'])
+        self.assertTrue(os.path.isdir(directory))
+
+    def test_download_skips_names_outside_directory(self):
+        directory = os.path.join(self.directory, 'target')
+        records = [
+            _record('pre/a/../../../escaped.txt', b'x'),
+            _record('pre/a/../ok.txt', b'x'),
+            _record('pre//etc/passwd', b'x'),
+            _record('pre/..', b'x'),
+        ]
+        bucket, blobs = self._make_bucket(records)
+
+        result = self._call_fut(bucket, directory, prefix='pre/')
+
+        self.assertEqual(result.skipped, ['..', 'a/../../../escaped.txt'])
+        self.assertEqual(result.transferred, ['/etc/passwd', 'a/../ok.txt'])
+        self.assertEqual(
+            sorted(blobs), ['pre//etc/passwd', 'pre/a/../ok.txt'])
+        download = blobs['pre//etc/passwd'].download_to_filename
+        filename = download.call_args[0][0]
+        self.assertTrue(filename.startswith(directory + os.sep))